@@ -300,7 +300,9 @@ class BiddingAgent:
 
 # 6. Performance:
 #    - Keep computations fast (< 1 second per bid)
-#    - Pre-compute what you can in __init__
+#    - Pre-compute what you can in __init__; for expensive tables, define
+#      an optional prepare() method instead (run once per game, result in
+#      self.prepared, see STUDENT_GUIDE.md)
 #    - Avoid complex loops in bidding_function
 #    - Test execution time regularly
 
@@ -0,0 +1,8 @@
+"""
+Benchmark suite for the AGT Competition auction pipeline
+
+Modules:
+- harness: timing samples, percentile summaries and baseline comparison
+- suite: the pipeline benchmarks run by main.py --mode bench
+- synthetic_teams: synthetic team generator for load testing
+"""
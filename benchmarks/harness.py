@@ -0,0 +1,107 @@
+"""
+Timing harness for the benchmark suite
+Collects samples, summarizes percentiles and compares against a baseline
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+# Statistics compared against the baseline when flagging regressions
+REGRESSION_METRICS = ('p50_ms', 'p95_ms')
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary of one benchmark"""
+    name: str
+    samples_ms: List[float]
+    units_per_sample: int = 1
+    unit: str = 'calls'
+    extra: Dict[str, float] = field(default_factory=dict)
+    
+    def to_dict(self) -> dict:
+        samples = np.asarray(self.samples_ms, dtype=float)
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        total_seconds = samples.sum() / 1000.0
+        throughput = (len(samples) * self.units_per_sample / total_seconds) if total_seconds > 0 else 0.0
+        
+        return {
+            'samples': len(samples),
+            'mean_ms': round(float(samples.mean()), 4),
+            'p50_ms': round(float(p50), 4),
+            'p95_ms': round(float(p95), 4),
+            'p99_ms': round(float(p99), 4),
+            'max_ms': round(float(samples.max()), 4),
+            'throughput': round(throughput, 3),
+            'throughput_unit': f'{self.unit}/sec',
+            **self.extra
+        }
+
+
+def measure(name: str, fn: Callable[[], None], repeat: int, warmup: int = 1,
+            units_per_sample: int = 1, unit: str = 'calls') -> BenchmarkResult:
+    """
+    Time repeated calls of fn.
+    
+    Args:
+        name: Benchmark name
+        fn: Zero-argument callable to time
+        repeat: Number of timed calls
+        warmup: Number of untimed calls made first
+        units_per_sample: Work units (rounds, games, ...) done by one call
+        unit: Name of the work unit, used for the throughput label
+    
+    Returns:
+        BenchmarkResult with one sample per timed call
+    """
+    for _ in range(warmup):
+        fn()
+    
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    
+    return BenchmarkResult(name=name, samples_ms=samples,
+                           units_per_sample=units_per_sample, unit=unit)
+
+
+def compare_to_baseline(results: Dict[str, dict], baseline: Dict[str, dict],
+                        tolerance: float = 0.2) -> List[dict]:
+    """
+    Flag benchmarks that got slower than the saved baseline.
+    
+    Args:
+        results: Benchmark summaries from the current run (name -> to_dict())
+        baseline: Benchmark summaries from the saved baseline
+        tolerance: Allowed relative slowdown before flagging (0.2 = 20%)
+    
+    Returns:
+        List of regressions with the benchmark, metric, both values and ratio
+    """
+    regressions = []
+    
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        
+        for metric in REGRESSION_METRICS:
+            if metric not in current or not previous.get(metric):
+                continue
+            ratio = current[metric] / previous[metric]
+            if ratio > 1.0 + tolerance:
+                regressions.append({
+                    'benchmark': name,
+                    'metric': metric,
+                    'baseline': previous[metric],
+                    'current': current[metric],
+                    'ratio': round(ratio, 3)
+                })
+    
+    return regressions
@@ -0,0 +1,328 @@
+"""
+Benchmarks for the auction pipeline
+Times the engine, valuation generation, agent calls, games and tournaments
+"""
+
+import logging
+import multiprocessing as mp
+import pickle
+import shutil
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from src.config import (
+    BID_TIMEOUT_SECONDS, RANDOM_SEED, AGENT_ISOLATION_MODE, ARENA_SIZE,
+    INITIAL_BUDGET, T_AUCTION_ROUNDS, ITEM_ID_FORMAT, EXAMPLES_DIR
+)
+from src.valuation_generator import ValuationGenerator
+from src.auction_engine import AuctionEngine
+from src.agent_manager import AgentManager, WORKER_PRELOAD
+from src.game_manager import GameManager
+from src.results_manager import ResultsManager
+from src.tournament_manager import TournamentManager
+from src.ipc import send_message, recv_message
+from src.zygote import START_FORK, START_ZYGOTE, START_METHODS, launch_worker
+from benchmarks.harness import BenchmarkResult, measure
+from benchmarks.synthetic_teams import materialize_teams
+
+
+logger = logging.getLogger(__name__)
+
+BENCHMARKS = ['execute_round', 'generate_arena_valuations', 'worker_spawn', 'ipc',
+              'execute_bid_with_timeout', 'run_game', 'run_full_tournament']
+
+# Example agent used for single-call benchmarks
+BENCH_AGENT = 'truthful_bidder.py'
+
+
+def bench_execute_round(repeat: int, seed: int) -> BenchmarkResult:
+    """Time AuctionEngine.execute_round on one arena's worth of random bids"""
+    rng = np.random.default_rng(seed)
+    engine = AuctionEngine(rng=rng)
+    team_ids = [f'team_{i}' for i in range(ARENA_SIZE)]
+    budgets = {team_id: float(INITIAL_BUDGET) for team_id in team_ids}
+    bid_sets = [dict(zip(team_ids, rng.uniform(0, 20, ARENA_SIZE).tolist())) for _ in range(repeat + 1)]
+    times = {team_id: 0.0 for team_id in team_ids}
+    rounds = iter(bid_sets)
+    
+    return measure('execute_round',
+                   lambda: engine.execute_round(1, 'item_0', next(rounds), budgets, times),
+                   repeat, unit='rounds')
+
+
+def bench_generate_arena_valuations(repeat: int, seed: int) -> BenchmarkResult:
+    """Time ValuationGenerator.generate_arena_valuations for one arena"""
+    generator = ValuationGenerator(random_seed=seed)
+    team_ids = [f'team_{i}' for i in range(ARENA_SIZE)]
+    
+    return measure('generate_arena_valuations',
+                   lambda: generator.generate_arena_valuations(team_ids),
+                   repeat, unit='arenas')
+
+
+def _spawn_probe(conn):
+    """Worker target that replies immediately"""
+    conn.send(None)
+
+
+def bench_worker_spawn(repeat: int, start_method: str) -> BenchmarkResult:
+    """Time starting an isolated worker until its first reply, for one start method"""
+    def spawn():
+        reader, writer = mp.Pipe(duplex=False)
+        try:
+            process = launch_worker(start_method, _spawn_probe, (), writer, WORKER_PRELOAD)
+        finally:
+            writer.close()
+        reader.recv()
+        process.join()
+        reader.close()
+    
+    return measure(f'worker_spawn_{start_method}', spawn, repeat, unit='calls')
+
+
+def _bid_reply_message() -> tuple:
+    """A typical bid reply: bid, timing and a state delta with a price history"""
+    price_history = pickle.dumps([10.0] * T_AUCTION_ROUNDS, protocol=5)
+    timing = {'wall': 0.001, 'cpu': 0.001, 'utime': 0.001, 'stime': 0.0, 'max_rss_kb': 20000}
+    return ('success', 12.5, timing, ({'price_history': (price_history, ())}, []), None)
+
+
+def _echo_worker(conn):
+    """Long-lived worker that answers every message with the bid reply"""
+    reply = _bid_reply_message()
+    while True:
+        try:
+            request = recv_message(conn, trusted=True)
+        except EOFError:
+            return
+        if request is None:
+            return
+        send_message(conn, ('started', time.monotonic()))
+        send_message(conn, reply)
+
+
+def bench_ipc(repeat: int) -> List[BenchmarkResult]:
+    """
+    Time the message passing of agent calls, without any agent code.
+    
+    - ipc_channel_queue: per-call mp.Queue (the previous result channel):
+      create, put a bid reply, get it, close
+    - ipc_channel_pipe: per-call pipe with the framed protocol (src/ipc.py):
+      create, send a bid reply, receive it, close
+    - ipc_round: one round of requests, started messages and replies with ARENA_SIZE
+      long-lived workers over duplex pipes
+    """
+    reply = _bid_reply_message()
+    
+    def queue_channel():
+        result_queue = mp.Queue()
+        result_queue.put(reply)
+        result_queue.get(timeout=1.0)
+        result_queue.close()
+        result_queue.join_thread()
+    
+    def pipe_channel():
+        reader, writer = mp.Pipe(duplex=False)
+        send_message(writer, reply)
+        recv_message(reader)
+        writer.close()
+        reader.close()
+    
+    results = [measure('ipc_channel_queue', queue_channel, repeat, unit='calls'),
+               measure('ipc_channel_pipe', pipe_channel, repeat, unit='calls')]
+    
+    workers = []
+    for _ in range(ARENA_SIZE):
+        parent_conn, child_conn = mp.Pipe(duplex=True)
+        workers.append((launch_worker(START_FORK, _echo_worker, (), child_conn), parent_conn))
+        child_conn.close()
+    
+    def ipc_round():
+        for _, conn in workers:
+            send_message(conn, ('bid', 'item_0'))
+        for _, conn in workers:
+            recv_message(conn)  # started message
+            recv_message(conn)
+    
+    try:
+        results.append(measure('ipc_round', ipc_round, repeat, unit='rounds'))
+    finally:
+        for process, conn in workers:
+            send_message(conn, None)
+            process.join(timeout=1.0)
+            conn.close()
+    return results
+
+
+def bench_execute_bid_with_timeout(repeat: int, seed: int, isolation_mode: str,
+                                   timeout: float, start_method: str) -> BenchmarkResult:
+    """Time one sandboxed bid call of an example agent, for one worker start method"""
+    agent_file = str(Path(__file__).parent.parent / EXAMPLES_DIR / BENCH_AGENT)
+    valuations = {ITEM_ID_FORMAT.format(i): 10.0 for i in range(20)}
+    agent_manager = AgentManager(timeout_seconds=timeout, isolation_mode=isolation_mode,
+                                 start_method=start_method)
+    
+    try:
+        agent = agent_manager.load_agent(agent_file, 'bench_team', valuations, INITIAL_BUDGET, [])
+        return measure(f'execute_bid_with_timeout_{start_method}',
+                       lambda: agent_manager.execute_bid_with_timeout(agent, 'item_0'),
+                       repeat, unit='calls')
+    finally:
+        agent_manager.shutdown()
+
+
+def bench_run_game(repeat: int, seed: int, isolation_mode: str, timeout: float) -> BenchmarkResult:
+    """Time a full GameManager.run_game with one arena of example agents"""
+    generator = ValuationGenerator(random_seed=seed)
+    teams_dir = tempfile.mkdtemp(prefix='agt_bench_teams_')
+    team_agents = {team.team_id: team.agent_file_path
+                   for team in materialize_teams(ARENA_SIZE, teams_dir, seed)}
+    game_numbers = iter(range(1, repeat + 2))
+    transfer = {'calls': 0, 'bytes': 0, 'full_state_bytes': 0}
+    
+    def run_game():
+        agent_manager = AgentManager(timeout_seconds=timeout, isolation_mode=isolation_mode)
+        game_manager = GameManager(
+            stage=1,
+            arena_id='bench',
+            game_number=next(game_numbers),
+            valuation_generator=generator,
+            auction_engine=AuctionEngine(),
+            agent_manager=agent_manager
+        )
+        game_manager.run_game(team_agents)
+        for stats in agent_manager.get_transfer_stats().values():
+            transfer['calls'] += stats['calls']
+            transfer['bytes'] += stats['bytes_sent'] + stats['bytes_received']
+            transfer['full_state_bytes'] += stats['bytes_sent'] + stats['full_state_bytes']
+    
+    try:
+        result = measure('run_game', run_game, repeat, unit='games')
+    finally:
+        shutil.rmtree(teams_dir, ignore_errors=True)
+    mean_seconds = np.mean(result.samples_ms) / 1000.0
+    result.extra['rounds_per_sec'] = round(T_AUCTION_ROUNDS / mean_seconds, 3)
+    # Agent state bytes moved per worker call, and what full-state replies would cost
+    calls = max(transfer['calls'], 1)
+    result.extra['state_bytes_per_call'] = round(transfer['bytes'] / calls, 1)
+    result.extra['full_state_bytes_per_call'] = round(transfer['full_state_bytes'] / calls, 1)
+    return result
+
+
+def bench_run_full_tournament(repeat: int, seed: int, isolation_mode: str, timeout: float,
+                              num_teams: int, jobs: int, game_jobs: int) -> BenchmarkResult:
+    """Time TournamentManager.run_full_tournament with num_teams synthetic teams"""
+    teams_dir = tempfile.mkdtemp(prefix='agt_bench_teams_')
+    samples = []
+    games = 0
+    
+    try:
+        teams = materialize_teams(num_teams, teams_dir, seed)
+        for _ in range(repeat):
+            output_dir = tempfile.mkdtemp(prefix='agt_bench_')
+            try:
+                tournament_manager = TournamentManager(
+                    valuation_generator=ValuationGenerator(random_seed=seed),
+                    results_manager=ResultsManager(output_dir=output_dir),
+                    timeout_seconds=timeout,
+                    isolation_mode=isolation_mode,
+                    jobs=jobs,
+                    game_jobs=game_jobs
+                )
+                start = time.perf_counter()
+                stage1_result, stage2_result = tournament_manager.run_full_tournament(teams)
+                samples.append((time.perf_counter() - start) * 1000.0)
+            finally:
+                shutil.rmtree(output_dir, ignore_errors=True)
+            
+            games = sum(len(arena_games) for stage in (stage1_result, stage2_result)
+                        for arena_games in stage.arena_results.values())
+    finally:
+        shutil.rmtree(teams_dir, ignore_errors=True)
+    
+    result = BenchmarkResult(name='run_full_tournament', samples_ms=samples,
+                             units_per_sample=games, unit='games')
+    result.extra['teams'] = num_teams
+    result.extra['games_per_tournament'] = games
+    return result
+
+
+def run_benchmarks(num_teams: int = 10, repeat: int = 20, tournament_repeat: int = 1,
+                   isolation_mode: str = AGENT_ISOLATION_MODE, timeout: float = BID_TIMEOUT_SECONDS,
+                   seed: int = RANDOM_SEED, jobs: int = 1, game_jobs: int = 1,
+                   selected: List[str] = None) -> Dict[str, dict]:
+    """
+    Run the benchmark suite.
+    
+    Samples per benchmark:
+    - execute_round, generate_arena_valuations: repeat * 100
+    - worker_spawn: repeat * 5 per worker start method (fork vs. pre-warmed zygote)
+    - ipc: repeat * 50 per channel
+    - execute_bid_with_timeout: repeat per worker start method
+    - run_game: max(1, repeat // 5)
+    - run_full_tournament: tournament_repeat
+    
+    Args:
+        num_teams: Number of synthetic teams in the tournament benchmark
+            (see benchmarks.synthetic_teams)
+        repeat: Base number of samples per benchmark
+        tournament_repeat: Number of full tournaments to time
+        isolation_mode: Agent isolation mode for agent, game and tournament benchmarks
+        timeout: Bid timeout in seconds
+        seed: Random seed
+        jobs: Parallel Stage 1 arenas in the tournament benchmark
+        game_jobs: Parallel games per arena in the tournament benchmark
+        selected: Optional subset of BENCHMARKS to run
+    
+    Returns:
+        Report dict with run metadata and one summary per benchmark
+    """
+    selected = selected or BENCHMARKS
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+    if 'run_full_tournament' in selected and num_teams < ARENA_SIZE:
+        raise ValueError(f"Tournament benchmark needs at least {ARENA_SIZE} teams, got {num_teams}")
+    
+    runners = {
+        'execute_round': lambda: bench_execute_round(repeat * 100, seed),
+        'generate_arena_valuations': lambda: bench_generate_arena_valuations(repeat * 100, seed),
+        'worker_spawn': lambda: [bench_worker_spawn(repeat * 5, start_method)
+                                 for start_method in (START_FORK, START_ZYGOTE)],
+        'ipc': lambda: bench_ipc(repeat * 50),
+        'execute_bid_with_timeout': lambda: [bench_execute_bid_with_timeout(
+            repeat, seed, isolation_mode, timeout, start_method) for start_method in START_METHODS],
+        'run_game': lambda: bench_run_game(max(1, repeat // 5), seed, isolation_mode, timeout),
+        'run_full_tournament': lambda: bench_run_full_tournament(
+            tournament_repeat, seed, isolation_mode, timeout, num_teams, jobs, game_jobs),
+    }
+    
+    results = {}
+    for name in BENCHMARKS:
+        if name not in selected:
+            continue
+        logger.info(f"Running benchmark {name}")
+        outcome = runners[name]()
+        for result in (outcome if isinstance(outcome, list) else [outcome]):
+            results[result.name] = result.to_dict()
+            logger.info(f"{result.name}: p50={results[result.name]['p50_ms']:.3f}ms "
+                        f"throughput={results[result.name]['throughput']} "
+                        f"{results[result.name]['throughput_unit']}")
+    
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'isolation_mode': isolation_mode,
+            'num_teams': num_teams,
+            'repeat': repeat,
+            'seed': seed,
+            'jobs': jobs,
+            'game_jobs': game_jobs
+        },
+        'benchmarks': results
+    }
@@ -0,0 +1,155 @@
+"""
+Synthetic team generator for load testing
+Materializes N teams from the example strategies with randomized parameters
+"""
+
+import argparse
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+from src.config import EXAMPLES_DIR, RANDOM_SEED
+from src.utils import Team
+
+
+# Example strategies teams are drawn from
+STRATEGIES = ['truthful_bidder.py', 'budget_aware_bidder.py', 'strategic_bidder.py', 'random_bidder.py']
+
+# Range of the per-team factor applied to the strategy's bids
+BID_SCALE_RANGE = (0.8, 1.1)
+
+REGISTRATION_FILE = 'team_registration.json'
+
+AGENT_WRAPPER = '''
+
+# Synthetic team parameters (generated)
+_StrategyAgent = BiddingAgent
+
+
+class BiddingAgent(_StrategyAgent):
+    """{strategy} with bids scaled by a per-team factor"""
+    
+    BID_SCALE = {bid_scale!r}
+    {init}
+    def bidding_function(self, item_id: str) -> float:
+        bid = _StrategyAgent.bidding_function(self, item_id) * self.BID_SCALE
+        return max(0.0, min(bid, self.budget))
+{plan}'''
+
+# Random bidders get their own seed instead of the shared RANDOM_SEED
+RANDOM_SEED_INIT = '''
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        _StrategyAgent.__init__(self, team_id, valuation_vector, budget, opponent_teams)
+        random.seed({seed!r})
+'''
+
+# Strategies with an upfront bidding plan get it scaled as well (the game
+# uses the plan instead of bidding_function)
+SCALED_PLAN = '''
+    def bidding_plan(self, remaining_items):
+        plan = _StrategyAgent.bidding_plan(self, remaining_items)
+        if plan is None:
+            return None
+        return {item_id: max(0.0, bid * self.BID_SCALE) for item_id, bid in plan.items()}
+'''
+
+
+def materialize_teams(num_teams: int, teams_dir: str, seed: int = RANDOM_SEED) -> List[Team]:
+    """
+    Write num_teams synthetic teams and their registration file.
+    
+    Each team gets teams_dir/<team_name>/bidding_agent.py built from a
+    randomly drawn example strategy whose bids are scaled by a random
+    factor in BID_SCALE_RANGE. The layout matches what main.py expects,
+    so teams_dir can be passed as --teams-dir.
+    
+    Args:
+        num_teams: Number of teams to create
+        teams_dir: Directory to write the teams to (created if missing)
+        seed: Seed for strategy and parameter draws
+    
+    Returns:
+        List of Team objects for the created teams
+    """
+    rng = np.random.default_rng(seed)
+    examples_dir = Path(__file__).parent.parent / EXAMPLES_DIR
+    sources = {strategy: (examples_dir / strategy).read_text() for strategy in STRATEGIES}
+    
+    teams_path = Path(teams_dir)
+    teams_path.mkdir(parents=True, exist_ok=True)
+    
+    teams = []
+    registration = []
+    width = max(3, len(str(num_teams - 1)))
+    
+    for i in range(num_teams):
+        team_name = f'synthetic_{i:0{width}d}'
+        strategy = STRATEGIES[rng.integers(len(STRATEGIES))]
+        bid_scale = round(float(rng.uniform(*BID_SCALE_RANGE)), 3)
+        init = RANDOM_SEED_INIT.format(seed=int(rng.integers(2**31))) if strategy == 'random_bidder.py' else ''
+        plan = SCALED_PLAN if 'def bidding_plan' in sources[strategy] else ''
+        
+        team_dir = teams_path / team_name
+        team_dir.mkdir(exist_ok=True)
+        agent_file = team_dir / 'bidding_agent.py'
+        agent_file.write_text(sources[strategy] + AGENT_WRAPPER.format(
+            strategy=strategy[:-3], bid_scale=bid_scale, init=init, plan=plan))
+        
+        members = [str(member) for member in rng.integers(10**8, 10**9, size=3)]
+        registration.append({'team_name': team_name, 'members': members})
+        teams.append(Team(
+            team_id=team_name,
+            team_name=team_name,
+            agent_file_path=str(agent_file.absolute()),
+            registration_timestamp=datetime.now(),
+            members=members
+        ))
+    
+    with open(teams_path / REGISTRATION_FILE, 'w') as f:
+        json.dump({'teams': registration}, f, indent=2)
+    
+    return teams
+
+
+def create_synthetic_tournament(num_teams: int, seed: int = RANDOM_SEED,
+                                base_dir: str = None) -> str:
+    """
+    Materialize a synthetic teams directory in a fresh temporary directory.
+    
+    Args:
+        num_teams: Number of teams to create
+        seed: Seed for strategy and parameter draws
+        base_dir: Optional parent directory for the temporary directory
+    
+    Returns:
+        Path of the teams directory (the caller removes it when done)
+    """
+    teams_dir = tempfile.mkdtemp(prefix=f'agt_teams_{num_teams}_', dir=base_dir)
+    materialize_teams(num_teams, teams_dir, seed)
+    return teams_dir
+
+
+def main():
+    """Command-line entry point: python -m benchmarks.synthetic_teams --teams 500"""
+    parser = argparse.ArgumentParser(description="Generate synthetic teams for load testing")
+    parser.add_argument('--teams', type=int, required=True, help='Number of teams to generate')
+    parser.add_argument('--output-dir', help='Teams directory to write (default: a new temp directory)')
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help='Random seed for strategy draws')
+    args = parser.parse_args()
+    
+    if args.output_dir:
+        materialize_teams(args.teams, args.output_dir, args.seed)
+        teams_dir = args.output_dir
+    else:
+        teams_dir = create_synthetic_tournament(args.teams, args.seed)
+    
+    print(f"Created {args.teams} synthetic teams in {teams_dir}")
+    print(f"Run the tournament with: python main.py --mode tournament --teams-dir {teams_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -38,3 +38,11 @@ class BiddingAgent:
         valuation = self.valuation_vector.get(item_id, 0)
         bid = min(valuation, self.budget)
         return bid
+    
+    def bidding_plan(self, remaining_items: List[str]) -> Dict[str, float]:
+        """
+        Truthful bids do not depend on what happens during the game, so the
+        whole game can be planned upfront (bids over budget are capped by the
+        auction, exactly as min(valuation, budget) would).
+        """
+        return {item_id: self.valuation_vector.get(item_id, 0) for item_id in remaining_items}
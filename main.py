@@ -13,7 +13,7 @@ from src.valuation_generator import ValuationGenerator
 from src.results_manager import ResultsManager
 from src.tournament_manager import TournamentManager
 from src.utils import Team, generate_team_id
-from src.config import BID_TIMEOUT_SECONDS, RANDOM_SEED
+from src.config import BID_TIMEOUT_SECONDS, RANDOM_SEED, AGENT_ISOLATION_MODE, TOURNAMENT_JOBS, ARENA_GAME_JOBS
 from typing import Dict, List, Optional
 import json
 
@@ -172,7 +172,9 @@ def load_teams_from_directory(teams_dir: str, registration_file: str = None) ->
     return teams
 
 
-def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: int = None):
+def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: int = None,
+                        isolation_mode: str = AGENT_ISOLATION_MODE, jobs: int = TOURNAMENT_JOBS,
+                        game_jobs: int = ARENA_GAME_JOBS):
     """
     Run the complete tournament.
     
@@ -181,6 +183,9 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
         output_dir: Directory for results output
         timeout: Timeout for bid execution
         seed: Random seed for reproducibility
+        isolation_mode: Agent isolation mode ('per_call' or 'persistent')
+        jobs: Number of Stage 1 arenas to run in parallel
+        game_jobs: Number of games within an arena to run in parallel
     """
     logging.info("Loading teams...")
     teams = load_teams_from_directory(teams_dir)
@@ -197,7 +202,10 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
     tournament_manager = TournamentManager(
         valuation_generator=valuation_generator,
         results_manager=results_manager,
-        timeout_seconds=timeout
+        timeout_seconds=timeout,
+        isolation_mode=isolation_mode,
+        jobs=jobs,
+        game_jobs=game_jobs
     )
     
     # Run tournament
@@ -208,7 +216,9 @@ def run_full_tournament(teams_dir: str, output_dir: str, timeout: float, seed: i
         logging.error(f"Tournament failed: {e}", exc_info=True)
 
 
-def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float, seed: int = None):
+def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float, seed: int = None,
+                     isolation_mode: str = AGENT_ISOLATION_MODE, jobs: int = TOURNAMENT_JOBS,
+                     game_jobs: int = ARENA_GAME_JOBS):
     """
     Run a single stage only.
     
@@ -218,6 +228,9 @@ def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float
         output_dir: Directory for results output
         timeout: Timeout for bid execution
         seed: Random seed for reproducibility
+        isolation_mode: Agent isolation mode ('per_call' or 'persistent')
+        jobs: Number of Stage 1 arenas to run in parallel
+        game_jobs: Number of games within an arena to run in parallel
     """
     logging.info(f"Loading teams for Stage {stage}...")
     teams = load_teams_from_directory(teams_dir)
@@ -234,7 +247,10 @@ def run_single_stage(stage: int, teams_dir: str, output_dir: str, timeout: float
     tournament_manager = TournamentManager(
         valuation_generator=valuation_generator,
         results_manager=results_manager,
-        timeout_seconds=timeout
+        timeout_seconds=timeout,
+        isolation_mode=isolation_mode,
+        jobs=jobs,
+        game_jobs=game_jobs
     )
     
     # Run stage
@@ -298,13 +314,69 @@ def validate_agent(agent_file: str):
     return True
 
 
+def run_benchmark_suite(num_teams: int, repeat: int, isolation_mode: str, timeout: float,
+                        seed: int = None, jobs: int = TOURNAMENT_JOBS, game_jobs: int = ARENA_GAME_JOBS,
+                        output_file: str = None, baseline_file: str = None,
+                        save_baseline: str = None, tolerance: float = 0.2,
+                        selected: List[str] = None) -> bool:
+    """
+    Run the benchmark suite and compare it against a saved baseline.
+    
+    Args:
+        num_teams: Number of synthetic teams in the tournament benchmark
+        repeat: Base number of samples per benchmark
+        isolation_mode: Agent isolation mode ('per_call' or 'persistent')
+        timeout: Timeout for bid execution
+        seed: Random seed for reproducibility
+        jobs: Number of Stage 1 arenas to run in parallel
+        game_jobs: Number of games within an arena to run in parallel
+        output_file: Optional path to write the JSON report to
+        baseline_file: Optional baseline report to compare against
+        save_baseline: Optional path to save this report as the new baseline
+        tolerance: Allowed relative slowdown before flagging a regression
+        selected: Optional subset of benchmarks to run
+    
+    Returns:
+        True if no regressions were found, False otherwise
+    """
+    from benchmarks.suite import run_benchmarks
+    from benchmarks.harness import compare_to_baseline
+    from src.utils import save_json, load_json
+    
+    # Per-round game logging would dominate the measurements
+    logging.getLogger('src').setLevel(logging.WARNING)
+    
+    report = run_benchmarks(num_teams=num_teams, repeat=repeat, isolation_mode=isolation_mode,
+                            timeout=timeout, seed=seed, jobs=jobs, game_jobs=game_jobs,
+                            selected=selected)
+    
+    if baseline_file:
+        baseline = load_json(baseline_file)
+        report['regressions'] = compare_to_baseline(report['benchmarks'],
+                                                    baseline.get('benchmarks', {}), tolerance)
+        for regression in report['regressions']:
+            logging.warning(f"Regression in {regression['benchmark']} {regression['metric']}: "
+                            f"{regression['baseline']:.3f}ms -> {regression['current']:.3f}ms "
+                            f"(x{regression['ratio']})")
+    
+    print(json.dumps(report, indent=2))
+    
+    if output_file:
+        save_json(report, output_file)
+    if save_baseline:
+        save_json(report, save_baseline)
+        logging.info(f"Saved benchmark baseline to {save_baseline}")
+    
+    return not report.get('regressions')
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="AGT Auto-Bidding Competition System")
     
     parser.add_argument(
         '--mode',
-        choices=['tournament', 'stage', 'validate'],
+        choices=['tournament', 'stage', 'validate', 'bench'],
         default='tournament',
         help='Execution mode'
     )
@@ -347,6 +419,69 @@ def main():
         help='Random seed for reproducibility'
     )
     
+    parser.add_argument(
+        '--isolation',
+        choices=['per_call', 'persistent'],
+        default=AGENT_ISOLATION_MODE,
+        help='Agent isolation mode: fresh process per call, or one persistent worker per agent per game'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=TOURNAMENT_JOBS,
+        help='Number of Stage 1 arenas to run in parallel worker processes'
+    )
+    
+    parser.add_argument(
+        '--game-jobs',
+        type=int,
+        default=ARENA_GAME_JOBS,
+        help='Number of games within an arena to run in parallel worker processes'
+    )
+    
+    parser.add_argument(
+        '--bench-teams',
+        type=int,
+        default=10,
+        help='Number of synthetic teams in the tournament benchmark (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--bench-repeat',
+        type=int,
+        default=20,
+        help='Base number of samples per benchmark (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--bench-only',
+        nargs='+',
+        help='Run only the named benchmarks (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--bench-output',
+        help='Write the benchmark report JSON to this file (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--baseline',
+        help='Benchmark report to compare against; regressions fail the run (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--save-baseline',
+        help='Save the benchmark report as a baseline to this file (for bench mode)'
+    )
+    
+    parser.add_argument(
+        '--bench-tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed relative slowdown against the baseline before flagging (for bench mode)'
+    )
+    
     parser.add_argument(
         '--log-file',
         help='Log file path'
@@ -366,19 +501,29 @@ def main():
     
     # Execute based on mode
     if args.mode == 'tournament':
-        run_full_tournament(args.teams_dir, args.output_dir, args.timeout, args.seed)
+        run_full_tournament(args.teams_dir, args.output_dir, args.timeout, args.seed, args.isolation,
+                            args.jobs, args.game_jobs)
     
     elif args.mode == 'stage':
         if args.stage is None:
             logging.error("--stage required for stage mode")
             return
-        run_single_stage(args.stage, args.teams_dir, args.output_dir, args.timeout, args.seed)
+        run_single_stage(args.stage, args.teams_dir, args.output_dir, args.timeout, args.seed,
+                         args.isolation, args.jobs, args.game_jobs)
     
     elif args.mode == 'validate':
         if args.validate is None:
             logging.error("--validate required for validate mode")
             return
         validate_agent(args.validate)
+    
+    elif args.mode == 'bench':
+        passed = run_benchmark_suite(args.bench_teams, args.bench_repeat, args.isolation, args.timeout,
+                                     args.seed, args.jobs, args.game_jobs, args.bench_output,
+                                     args.baseline, args.save_baseline, args.bench_tolerance,
+                                     args.bench_only)
+        if not passed:
+            sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,98 @@
+"""
+Compiled agent code for AGT Competition agent workers
+Hands the code of an agent file, compiled once in the game process, to that
+team's workers
+
+The marshalled code object is written into a small memory file (memfd) per
+team and sealed, so it can no longer change. Workers read it through a
+descriptor that AgentManager passes to that team's workers only, and never
+read the agent file or any on-disk cache: nothing an agent writes can change
+the code that later workers run. Without sealed memory files the marshalled
+code travels inline with the worker's arguments.
+"""
+
+import fcntl
+import marshal
+import mmap
+import os
+from types import CodeType
+from typing import Optional
+
+from src.zygote import passed_fd
+
+
+_SEALS = fcntl.F_SEAL_SEAL | fcntl.F_SEAL_SHRINK | fcntl.F_SEAL_GROW | fcntl.F_SEAL_WRITE
+
+
+class AgentCode:
+    """
+    Compiled module code of one agent file.
+
+    Created in the game process; picklable (only the path and the descriptor
+    number and size, or the inline data, travel), so it can be passed to a
+    worker, which calls load().
+    """
+
+    def __init__(self, file_path: str, fd: Optional[int] = None, size: int = 0,
+                 data: Optional[bytes] = None):
+        self.file_path = file_path
+        self.fd = fd
+        self.size = size
+        self.data = data
+        # Code object of this process; workers forked directly from the game
+        # process inherit it, zygote workers unmarshal it
+        self._code: Optional[CodeType] = None
+
+    @classmethod
+    def create(cls, file_path: str, code: CodeType) -> 'AgentCode':
+        """Write compiled module code into a new sealed block (inline if that is unavailable)."""
+        data = marshal.dumps(code)
+        try:
+            agent_code = cls(file_path, _sealed_block(data), len(data))
+        except OSError:
+            agent_code = cls(file_path, data=data)
+        agent_code._code = code
+        return agent_code
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_code'] = None
+        return state
+
+    def load(self) -> CodeType:
+        """Return the code object (in a worker)."""
+        if self._code is None:
+            if self.fd is None:
+                self._code = marshal.loads(self.data)
+            else:
+                with mmap.mmap(passed_fd(self.fd), self.size, access=mmap.ACCESS_READ) as block:
+                    self._code = marshal.loads(block)
+        return self._code
+
+    def close(self):
+        """Release the game process's descriptor."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def _sealed_block(data: bytes) -> int:
+    """
+    Return a descriptor of a new sealed memory file holding data.
+
+    Raises:
+        OSError: If sealed memory files are not available on this system
+    """
+    if not hasattr(os, 'memfd_create'):
+        raise OSError("memfd_create is not available")
+    fd = os.memfd_create('agt_agent_code', os.MFD_CLOEXEC | os.MFD_ALLOW_SEALING)
+    try:
+        payload = memoryview(data)
+        written = 0
+        while written < len(payload):
+            written += os.pwrite(fd, payload[written:], written)
+        fcntl.fcntl(fd, fcntl.F_ADD_SEALS, _SEALS)
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
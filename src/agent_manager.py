@@ -9,25 +9,507 @@ SECURITY: Uses multiprocessing for memory isolation to prevent:
 - Module pollution
 """
 
+import hashlib
 import importlib.util
 import logging
+import math
 import os
-import queue
-import sys
+import resource
+import signal
 import time
-import logging
-from typing import Dict, Optional, Any, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import multiprocessing as mp
+import multiprocessing.connection
 import pickle
 
+from src.config import (AGENT_WORKER_START, BID_TIMEOUT_CLOCK,
+                        CPU_TIMEOUT_WALL_FACTOR, MEMORY_LIMIT_MB, PREPARE_TIMEOUT_SECONDS,
+                        SANDBOX_STARTUP_SECONDS, SHARED_VALUATIONS, WORKER_PRELOAD_MODULES)
+from src.agent_code import AgentCode
+from src.ipc import send_message, recv_message
+from src.posted_bids import PostedBidSlot
+from src.shared_prepared import SharedPrepared
+from src.shared_valuations import SharedValuations
+from src.zygote import START_METHODS, START_AGENT_ZYGOTE, SpecializedZygote, launch_worker
+
 
 logger = logging.getLogger(__name__)
 
+# Isolation modes for agent execution
+ISOLATION_PER_CALL = 'per_call'        # Fresh process for every call (default)
+ISOLATION_PERSISTENT = 'persistent'    # One long-lived worker process per agent per game
+ISOLATION_MODES = (ISOLATION_PER_CALL, ISOLATION_PERSISTENT)
+
+# Clocks the agent timeout can be measured on
+TIMEOUT_WALL = 'wall'  # Elapsed (monotonic) time (default)
+TIMEOUT_CPU = 'cpu'    # CPU time of the worker, with a wall-clock backstop
+TIMEOUT_CLOCKS = (TIMEOUT_WALL, TIMEOUT_CPU)
+
+# Modules the worker zygote imports up front (this module holds the worker targets)
+WORKER_PRELOAD = [__name__] + list(WORKER_PRELOAD_MODULES)
+
+
+# Agent classes loaded ahead of time in a per-agent zygote, keyed by
+# (agent file path, team_id); empty in every other process
+_preloaded_agent_classes = {}
+
+# Agent attributes set by the system on every call, never part of the agent state
+_SYSTEM_ATTRIBUTES = frozenset({'prepared'})
+
+# CPU seconds the running agent phase may use (see _arm_cpu_limit); None
+# while no CPU limit is armed in this worker
+_cpu_limit: Optional[float] = None
+
+# Set once the armed CPU limit's timer has fired (the timer and
+# time.process_time() can disagree by a clock tick)
+_cpu_limit_hit = False
+
+
+class _CpuTimeExceeded(BaseException):
+    """
+    Raised in a worker when the agent used up its CPU time.
+
+    A BaseException, so an agent's own "except Exception" does not swallow it.
+    """
+
+
+# Code objects compiled in this process, keyed by source digest
+_agent_code_cache = {}
+
+
+def _get_agent_code(file_path: str):
+    """
+    Return the compiled code object of an agent file.
+
+    Code is kept in memory under the SHA-256 of the source (plus its path
+    and the interpreter's bytecode magic), so the game process compiles an
+    unchanged file only once across games while a resubmitted file is
+    compiled afresh. Workers get the code through AgentCode, never from
+    this cache or the file.
+
+    Raises:
+        OSError: If the agent file cannot be read
+        SyntaxError: If the agent source does not compile
+    """
+    with open(file_path, 'rb') as f:
+        source = f.read()
+    # The path is part of the key because it is compiled into the code object
+    digest = hashlib.sha256(importlib.util.MAGIC_NUMBER + os.fsencode(file_path)
+                            + b'\0' + source).hexdigest()
+
+    code = _agent_code_cache.get(digest)
+    if code is None:
+        code = compile(source, file_path, 'exec', dont_inherit=True)
+        _agent_code_cache[digest] = code
+    return code
+
+
+def _load_agent_class(agent_code: AgentCode, team_id: str):
+    """
+    Load the BiddingAgent class from an agent's compiled code.
+
+    Workers forked from a per-agent zygote reuse the class it loaded.
 
-def _worker_execute_bid(file_path: str, team_id: str, valuation_vector: Dict[str, float],
-                        budget: float, opponent_teams: list, item_id: str,
-                        agent_state: Optional[Dict], result_queue: mp.Queue):
+    Raises:
+        ImportError: If the module cannot be loaded or has no BiddingAgent class
+    """
+    preloaded = _preloaded_agent_classes.get((agent_code.file_path, team_id))
+    if preloaded is not None:
+        return preloaded
+
+    spec = importlib.util.spec_from_file_location(f"agent_{team_id}", agent_code.file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError("Failed to load module spec")
+
+    module = importlib.util.module_from_spec(spec)
+    exec(agent_code.load(), module.__dict__)
+
+    if not hasattr(module, 'BiddingAgent'):
+        raise ImportError("No BiddingAgent class found")
+
+    return getattr(module, 'BiddingAgent')
+
+
+def _preload_agent_class(agent_code: AgentCode, team_id: str, limits: Dict[str, Any]):
+    """Zygote setup: execute the agent module once for all later workers."""
+    _apply_memory_limit(limits)
+    _preloaded_agent_classes[(agent_code.file_path, team_id)] = _load_agent_class(agent_code, team_id)
+
+
+def _apply_memory_limit(limits: Dict[str, Any]):
+    """
+    Cap this worker's address space at its current size plus limits['memory_mb'].
+
+    Called before any agent code runs; allocations past the cap raise
+    MemoryError (reported as status 'memory', see _failure_reply). The cap
+    is relative so that the interpreter and preloaded modules the worker
+    starts with are not charged to the agent. No-op without a limit or
+    without /proc.
+    """
+    memory_mb = limits.get('memory_mb')
+    if not memory_mb:
+        return
+    try:
+        with open('/proc/self/statm') as statm:
+            size = int(statm.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return
+
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = size + int(memory_mb * 1024 * 1024)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _peak_rss_kb() -> int:
+    """Peak resident set size of this worker so far, in kB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _attach_valuations(valuation_vector):
+    """Map a team's shared valuations in the worker; plain dicts pass through."""
+    if isinstance(valuation_vector, SharedValuations):
+        return valuation_vector.attach()
+    return valuation_vector
+
+
+def _attach_prepared(prepared):
+    """Read a team's encoded prepare() result from its block; encoded values pass through."""
+    if isinstance(prepared, SharedPrepared):
+        return prepared.read()
+    return prepared
+
+
+def _instantiate_agent(agent_class, team_id: str, valuation_vector: Dict[str, float],
+                       budget: float, opponent_teams: list, agent_state: Optional[Dict],
+                       prepared: Optional[bytes] = None):
+    """
+    Create an agent instance and restore its encoded state (if any).
+
+    prepared is the encoded result of the agent's prepare() call, set as
+    agent.prepared (None if there is none).
+    """
+    agent = agent_class(team_id, valuation_vector, budget, opponent_teams)
+    if agent_state is not None:
+        for key, encoded in agent_state.items():
+            setattr(agent, key, _decode_state_value(encoded))
+    if prepared is not None:
+        agent.prepared = _decode_state_value(prepared)
+    return agent
+
+
+def _encode_state_value(value) -> bytes:
+    """
+    Pickle one state attribute.
+
+    NumPy arrays stay in the pickle stream: the encoded value is compared
+    with the previous call's and kept by the game process as bytes, so
+    out-of-band buffers would have to be copied into bytes anyway.
+
+    Returns:
+        Pickle data
+    """
+    return pickle.dumps(value, protocol=5)
+
+
+def _decode_state_value(encoded: bytes):
+    """Inverse of _encode_state_value (arrays come back writable)."""
+    return pickle.loads(encoded)
+
+
+def _encode_agent_state(agent, baseline: Optional[Dict]) -> Tuple[Dict, list]:
+    """
+    Encode the agent state as a delta against the state of the previous call.
+
+    Only safe attributes are kept (not methods, private internals or
+    attributes the system sets, such as prepared). Each attribute is
+    pickled once; the result both checks that it is picklable and is
+    compared with the baseline's encoding to detect changes.
+
+    Args:
+        agent: Agent instance after the call
+        baseline: Encoded state the call started from (None for a new agent)
+
+    Returns:
+        Tuple of (changed attributes as encoded values, removed attribute names)
+    """
+    changed = {}
+    current = set()
+    for key, value in agent.__dict__.items():
+        if not key.startswith('_') and key not in _SYSTEM_ATTRIBUTES and not callable(value):
+            try:
+                encoded = _encode_state_value(value)
+            except Exception:
+                continue  # Skip non-picklable attributes
+            current.add(key)
+            if baseline is None or baseline.get(key) != encoded:
+                changed[key] = encoded
+    removed = [key for key in (baseline or {}) if key not in current]
+    return changed, removed
+
+
+def _apply_state_delta(state: Optional[Dict], delta: Tuple[Dict, list]) -> Dict:
+    """Apply a delta from _encode_agent_state to an encoded state."""
+    changed, removed = delta
+    new_state = dict(state or {})
+    for key in removed:
+        new_state.pop(key, None)
+    new_state.update(changed)
+    return new_state
+
+
+def _agent_started(conn, limits: Dict[str, Any]) -> tuple:
+    """
+    Tell the game process that agent code (module, construction and call) starts now.
+
+    The agent's timeout runs from the reported moment; the worker's own
+    start-up before it is covered by the start-up allowance (see AgentManager).
+    With limits['cpu_seconds'] set, the agent's CPU time is limited from
+    here until _agent_finished.
+
+    Returns:
+        Clock and resource usage readings at the start, for _agent_finished
+    """
+    started = (time.monotonic(), time.process_time(), resource.getrusage(resource.RUSAGE_SELF))
+    if limits.get('cpu_seconds'):
+        _arm_cpu_limit(limits['cpu_seconds'])
+    send_message(conn, ('started', started[0]))
+    return started
+
+
+def _is_started_message(message: Any) -> bool:
+    """True for the ('started', monotonic_time) message sent by _agent_started."""
+    return (isinstance(message, tuple) and len(message) == 2 and message[0] == 'started'
+            and isinstance(message[1], float))
+
+
+def _agent_finished(started: tuple) -> Dict[str, float]:
+    """
+    End the agent code of a phase: lift its CPU limit and measure it.
+
+    Raises:
+        _CpuTimeExceeded: If the agent used more than its CPU time (for
+                          example after catching the first _CpuTimeExceeded)
+
+    Returns:
+        Timing of the phase since _agent_started: wall (monotonic) and cpu
+        seconds, user and system CPU seconds (utime, stime) and the worker's
+        peak resident set size so far (max_rss_kb)
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    timing = {
+        'wall': time.monotonic() - started[0],
+        'cpu': time.process_time() - started[1],
+        'utime': usage.ru_utime - started[2].ru_utime,
+        'stime': usage.ru_stime - started[2].ru_stime,
+        'max_rss_kb': usage.ru_maxrss
+    }
+    cpu_limit = _cpu_limit
+    _disarm_cpu_limit()
+    if cpu_limit is not None and (_cpu_limit_hit or timing['cpu'] > cpu_limit):
+        raise _CpuTimeExceeded()
+    return timing
+
+
+def _raise_cpu_time_exceeded(signum, frame):
+    """SIGPROF handler: the agent's CPU time is up."""
+    global _cpu_limit_hit
+    _cpu_limit_hit = True
+    raise _CpuTimeExceeded()
+
+
+def _arm_cpu_limit(cpu_seconds: float):
+    """
+    Limit the CPU time of the agent code about to run.
+
+    A one-shot ITIMER_PROF timer raises _CpuTimeExceeded in the agent once
+    it has used cpu_seconds. As a backstop for agents that catch it, the
+    soft RLIMIT_CPU is set one second past that point (RLIMIT_CPU counts
+    whole seconds); the kernel then kills the worker with SIGXCPU.
+    """
+    global _cpu_limit, _cpu_limit_hit
+    _cpu_limit = cpu_seconds
+    _cpu_limit_hit = False
+    signal.signal(signal.SIGPROF, _raise_cpu_time_exceeded)
+    signal.setitimer(signal.ITIMER_PROF, cpu_seconds)
+
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = math.ceil(time.process_time() + cpu_seconds) + 1
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _disarm_cpu_limit():
+    """Stop the CPU limit set by _arm_cpu_limit (no-op if none is armed)."""
+    global _cpu_limit
+    if _cpu_limit is None:
+        return
+    signal.setitimer(signal.ITIMER_PROF, 0)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+    _cpu_limit = None
+
+
+class _AnytimeBidding:
+    """
+    post_bid and time_remaining, set on the agent for every bid phase.
+
+    Callable attributes are never part of the agent state, so neither
+    travels back to the game process.
+    """
+
+    def __init__(self, slot: Optional[PostedBidSlot], limits: Dict[str, Any]):
+        self.slot = slot
+        self.limits = limits
+        self.started = None
+
+    def start(self, agent, started: tuple):
+        """Forget the previous posted bid and hand the helpers to the agent."""
+        self.started = started
+        if self.slot is not None:
+            self.slot.clear()
+        agent.post_bid = self.post_bid
+        agent.time_remaining = self.time_remaining
+
+    def post_bid(self, bid: float):
+        """Bid to use if the current bidding_function call runs out of time."""
+        if self.slot is not None:
+            self.slot.post(bid)
+
+    def time_remaining(self) -> float:
+        """Seconds left before the current bid phase times out (CPU seconds with the 'cpu' clock)."""
+        cpu_seconds = self.limits.get('cpu_seconds')
+        if cpu_seconds:
+            return max(0.0, cpu_seconds - (time.process_time() - self.started[1]))
+        return max(0.0, self.limits['timeout_seconds'] - (time.monotonic() - self.started[0]))
+
+
+def _bid_phase(agent, agent_state: Optional[Dict], started: tuple,
+               item_id: str, injected: Optional[Dict] = None,
+               anytime: Optional[_AnytimeBidding] = None) -> tuple:
+    """
+    Run bidding_function and build the bid reply message (state as a delta).
+
+    injected holds attributes tracked by the game process for stateless
+    agents (budget, items_won); they are set before the bid and so become
+    part of the returned delta. anytime provides post_bid and
+    time_remaining. The reply's timing covers construction and bid since
+    started.
+    """
+    for key, value in (injected or {}).items():
+        setattr(agent, key, value)
+    if anytime is not None:
+        anytime.start(agent, started)
+    bid = float(agent.bidding_function(item_id))
+    timing = _agent_finished(started)
+    return ('success', bid, timing, _encode_agent_state(agent, agent_state), None)
+
+
+def _plan_phase(agent, agent_state: Optional[Dict], started: tuple,
+                remaining_items: list) -> tuple:
+    """
+    Run bidding_plan and build the plan reply message.
+
+    The plan is None if the agent opts out (no bidding_plan, or it returned
+    None); otherwise it must hold a numeric bid for every remaining item.
+    """
+    plan_function = getattr(agent, 'bidding_plan', None)
+    plan = plan_function(list(remaining_items)) if callable(plan_function) else None
+    timing = _agent_finished(started)
+
+    if plan is not None:
+        missing = [item_id for item_id in remaining_items if item_id not in plan]
+        if missing:
+            raise ValueError(f"bidding_plan has no bid for {missing[0]}")
+        plan = {item_id: float(plan[item_id]) for item_id in remaining_items}
+    return ('success', plan, timing, _encode_agent_state(agent, agent_state), None)
+
+
+def _prepare_phase(agent, agent_state: Optional[Dict], started: tuple) -> tuple:
+    """
+    Run prepare and build the prepare reply message.
+
+    The result is sent encoded (see _encode_state_value); the game process
+    caches it without unpickling and hands it to every later call.
+    """
+    prepared = _encode_state_value(agent.prepare())
+    timing = _agent_finished(started)
+    return ('success', prepared, timing, _encode_agent_state(agent, agent_state), None)
+
+
+def _phase_limits(limits: Dict[str, Any], phase: str) -> Dict[str, Any]:
+    """Limits of one phase: prepare runs under its own, larger time budget."""
+    if phase != 'prepare':
+        return limits
+    prepare_seconds = limits['prepare_seconds']
+    return dict(limits, timeout_seconds=prepare_seconds,
+                cpu_seconds=prepare_seconds if limits.get('cpu_seconds') else None)
+
+
+def _update_phase(agent, agent_state: Optional[Dict], started: tuple, item_id: str,
+                  winning_team: str, price_paid: float) -> tuple:
+    """Run update_after_each_round and build the update reply message (state as a delta)."""
+    agent.update_after_each_round(item_id, winning_team, price_paid)
+    timing = _agent_finished(started)
+    return ('success', _encode_agent_state(agent, agent_state), timing, None)
+
+
+def _error_reply(phase: str, error: str, status: str = 'error') -> tuple:
+    """
+    Build the error reply message for a bid, plan, prepare or update phase.
+
+    Its timing only holds the worker's peak RSS (max_rss_kb).
+    """
+    timing = {'max_rss_kb': _peak_rss_kb()}
+    if phase == 'bid':
+        return (status, 0.0, timing, None, error)
+    if phase in ('plan', 'prepare'):
+        return (status, None, timing, None, error)
+    return (status, None, timing, error)
+
+
+def _failure_reply(phase: str, error: BaseException) -> tuple:
+    """
+    Build the reply for a phase that raised, after lifting its CPU limit.
+
+    A phase stopped by its CPU limit gets status 'timeout' instead of
+    'error', one that ran out of memory (see _apply_memory_limit) 'memory'.
+    """
+    _disarm_cpu_limit()
+    if isinstance(error, _CpuTimeExceeded):
+        return _error_reply(phase, "CPU time limit exceeded", status='timeout')
+    if isinstance(error, MemoryError):
+        return _error_reply(phase, "Memory limit exceeded", status='memory')
+    return _error_reply(phase, str(error))
+
+
+def _request_phases(request: tuple) -> list:
+    """Split a worker request into its (phase, args) steps."""
+    command = request[0]
+    if command == 'bid':
+        return [('bid', request[1:3])]
+    if command == 'plan':
+        return [('plan', request[1:2])]
+    if command == 'prepare':
+        return [('prepare', ())]
+    if command == 'update':
+        return [('update', request[1:4])]
+    if command == 'updates':
+        return [('update', tuple(update)) for update in request[1]]
+    if command == 'update_and_bid':
+        return [('update', request[1:4]), ('bid', request[4:5])]
+    raise ValueError(f"Unknown worker command: {command}")
+
+
+def _worker_execute_bid(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                        budget: float, opponent_teams: list, limits: Dict[str, Any],
+                        prepared: Optional[bytes], item_id: str,
+                        agent_state: Optional[Dict], injected: Optional[Dict],
+                        bid_slot: Optional[PostedBidSlot], conn):
     """
     Worker function to execute bid in isolated process.
 
@@ -35,122 +517,334 @@ def _worker_execute_bid(file_path: str, team_id: str, valuation_vector: Dict[str
     preventing access to GameManager or other agents.
 
     Args:
-        file_path: Path to agent file
+        agent_code: Compiled agent module (AgentCode)
         team_id: Team identifier
-        valuation_vector: Item valuations
+        valuation_vector: Item valuations (dict or SharedValuations)
         budget: Current budget
         opponent_teams: List of opponent team IDs
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of the agent's prepare() (SharedPrepared or encoded; None if none)
         item_id: Item to bid on
-        agent_state: Serialized agent state from previous rounds
-        result_queue: Queue to return results
+        agent_state: Encoded agent state from previous rounds
+        injected: Attributes tracked by the game process (stateless agents)
+        bid_slot: Team's posted bid (None if unavailable)
+        conn: Worker end of a pipe to return results
     """
     try:
-        # Load agent module in isolated process
-        spec = importlib.util.spec_from_file_location(f"agent_{team_id}", file_path)
-        if spec is None or spec.loader is None:
-            result_queue.put(('error', 0.0, 0.0, None, "Failed to load module spec"))
-            return
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
+
+        # Load agent module and create the agent instance with its state
+        # from previous rounds (both count as agent time)
+        started = _agent_started(conn, limits)
+        agent_class = _load_agent_class(agent_code, team_id)
+        agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                   opponent_teams, agent_state, prepared)
+
+        # Execute bidding function and send the state changes for next round
+        reply = _bid_phase(agent, agent_state, started, item_id, injected,
+                           _AnytimeBidding(bid_slot, limits))
+
+    except (Exception, _CpuTimeExceeded) as e:
+        reply = _failure_reply('bid', e)
+    send_message(conn, reply)
+
+
+def _worker_bidding_plan(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                         budget: float, opponent_teams: list, limits: Dict[str, Any],
+                         prepared: Optional[bytes], remaining_items: list,
+                         agent_state: Optional[Dict], conn):
+    """
+    Worker function to request an agent's bidding plan in isolated process.
 
-        if not hasattr(module, 'BiddingAgent'):
-            result_queue.put(('error', 0.0, 0.0, None, "No BiddingAgent class found"))
-            return
+    Args:
+        agent_code: Compiled agent module (AgentCode)
+        team_id: Team identifier
+        valuation_vector: Item valuations (dict or SharedValuations)
+        budget: Current budget
+        opponent_teams: List of opponent team IDs
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of the agent's prepare() (SharedPrepared or encoded; None if none)
+        remaining_items: Items that can still be auctioned
+        agent_state: Encoded agent state from previous rounds
+        conn: Worker end of a pipe to return results
+    """
+    try:
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
+        started = _agent_started(conn, limits)
+        agent_class = _load_agent_class(agent_code, team_id)
+        agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                   opponent_teams, agent_state, prepared)
+        reply = _plan_phase(agent, agent_state, started, remaining_items)
+
+    except (Exception, _CpuTimeExceeded) as e:
+        reply = _failure_reply('plan', e)
+    send_message(conn, reply)
+
+
+def _worker_prepare(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                    budget: float, opponent_teams: list, limits: Dict[str, Any],
+                    prepared: Optional[bytes], agent_state: Optional[Dict], conn):
+    """
+    Worker function to run an agent's prepare() hook in isolated process.
 
-        agent_class = getattr(module, 'BiddingAgent')
+    Args:
+        agent_code: Compiled agent module (AgentCode)
+        team_id: Team identifier
+        valuation_vector: Item valuations (dict or SharedValuations)
+        budget: Current budget
+        opponent_teams: List of opponent team IDs
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of an earlier prepare() (SharedPrepared or encoded; None if none)
+        agent_state: Encoded agent state from previous rounds
+        conn: Worker end of a pipe to return results
+    """
+    try:
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
+        started = _agent_started(conn, _phase_limits(limits, 'prepare'))
+        agent_class = _load_agent_class(agent_code, team_id)
+        agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                   opponent_teams, agent_state, prepared)
+        reply = _prepare_phase(agent, agent_state, started)
+
+    except (Exception, _CpuTimeExceeded) as e:
+        reply = _failure_reply('prepare', e)
+    send_message(conn, reply)
+
+
+def _worker_update_agent(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                         budget: float, opponent_teams: list, limits: Dict[str, Any],
+                         prepared: Optional[bytes], agent_state: Dict,
+                         updates: list, conn):
+    """
+    Worker function to update agent after one or more rounds in isolated process.
 
-        # Create or restore agent instance
-        if agent_state is None:
-            # First call - instantiate new agent
-            agent = agent_class(team_id, valuation_vector, budget, opponent_teams)
-        else:
-            # Restore agent state
-            agent = agent_class(team_id, valuation_vector, budget, opponent_teams)
-            # Restore internal state
-            for key, value in agent_state.items():
-                setattr(agent, key, value)
-
-        # Execute bidding function
-        start_time = time.time()
-        bid = agent.bidding_function(item_id)
-        execution_time = time.time() - start_time
-
-        # Serialize agent state for next round
-        # Only serialize safe attributes (not methods or private internals)
-        new_state = {}
-        for key, value in agent.__dict__.items():
-            if not key.startswith('_') and not callable(value):
-                try:
-                    # Test if picklable
-                    pickle.dumps(value)
-                    new_state[key] = value
-                except:
-                    pass  # Skip non-picklable attributes
-
-        result_queue.put(('success', float(bid), execution_time, new_state, None))
+    Sends one update reply per round result, in order. A failed update
+    leaves the state as it was, exactly as separate calls would.
 
+    Args:
+        agent_code: Compiled agent module (AgentCode)
+        team_id: Team identifier
+        valuation_vector: Item valuations (dict or SharedValuations)
+        budget: Current budget
+        opponent_teams: List of opponent team IDs
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of the agent's prepare() (SharedPrepared or encoded; None if none)
+        agent_state: Encoded agent state
+        updates: List of (item_id, winning_team, price_paid) round results
+        conn: Worker end of a pipe to return results
+    """
+    try:
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
     except Exception as e:
-        result_queue.put(('error', 0.0, 0.0, None, str(e)))
-
+        for _ in updates:
+            send_message(conn, _failure_reply('update', e))
+        return
 
-def _worker_update_agent(file_path: str, team_id: str, valuation_vector: Dict[str, float],
-                         budget: float, opponent_teams: list, agent_state: Dict,
-                         item_id: str, winning_team: str, price_paid: float,
-                         result_queue: mp.Queue):
+    agent_class = None
+    agent = None
+    for item_id, winning_team, price_paid in updates:
+        try:
+            started = _agent_started(conn, limits)
+            # Load the module (first update) and restore the agent (first
+            # update or after a failure), update it and send the state changes
+            if agent_class is None:
+                agent_class = _load_agent_class(agent_code, team_id)
+            if agent is None:
+                agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                           opponent_teams, agent_state, prepared)
+            reply = _update_phase(agent, agent_state, started, item_id, winning_team, price_paid)
+            agent_state = _apply_state_delta(agent_state, reply[1])
+        except (Exception, _CpuTimeExceeded) as e:
+            reply = _failure_reply('update', e)
+            agent = None
+        send_message(conn, reply)
+
+
+def _worker_update_and_bid(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                           budget: float, opponent_teams: list, limits: Dict[str, Any],
+                           prepared: Optional[bytes], agent_state: Dict,
+                           item_id: str, winning_team: str, price_paid: float, next_item_id: str,
+                           bid_slot: Optional[PostedBidSlot], conn):
     """
-    Worker function to update agent after round in isolated process.
+    Worker function to deliver a round result and request the next bid in one
+    isolated process.
+
+    Sends two replies over the pipe, each after the started message of its
+    phase (see _agent_started): the update reply (same format as
+    _worker_update_agent) as soon as update_after_each_round returns, then the
+    bid reply (same format as _worker_execute_bid). The bid runs on the updated
+    state, or on the previous state if the update failed, exactly as two
+    separate calls would.
 
     Args:
-        file_path: Path to agent file
+        agent_code: Compiled agent module (AgentCode)
         team_id: Team identifier
-        valuation_vector: Item valuations
+        valuation_vector: Item valuations (dict or SharedValuations)
         budget: Current budget
         opponent_teams: List of opponent team IDs
-        agent_state: Serialized agent state
-        item_id: Item that was auctioned
-        winning_team: Winning team ID
-        price_paid: Price paid
-        result_queue: Queue to return results
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of the agent's prepare() (SharedPrepared or encoded; None if none)
+        agent_state: Encoded agent state
+        item_id: Item that was auctioned in the previous round
+        winning_team: Winning team ID of the previous round
+        price_paid: Price paid in the previous round
+        next_item_id: Item to bid on
+        bid_slot: Team's posted bid (None if unavailable)
+        conn: Worker end of a pipe to return results
     """
     try:
-        # Load agent module
-        spec = importlib.util.spec_from_file_location(f"agent_{team_id}", file_path)
-        if spec is None or spec.loader is None:
-            result_queue.put(('error', None, "Failed to load module spec"))
-            return
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        if not hasattr(module, 'BiddingAgent'):
-            result_queue.put(('error', None, "No BiddingAgent class found"))
-            return
-
-        agent_class = getattr(module, 'BiddingAgent')
-        agent = agent_class(team_id, valuation_vector, budget, opponent_teams)
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
+    except Exception as e:
+        send_message(conn, _failure_reply('update', e))
+        send_message(conn, _failure_reply('bid', e))
+        return
 
-        # Restore state
-        for key, value in agent_state.items():
-            setattr(agent, key, value)
+    agent_class = None
+    try:
+        started = _agent_started(conn, limits)
+        agent_class = _load_agent_class(agent_code, team_id)
+        agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                   opponent_teams, agent_state, prepared)
+        reply = _update_phase(agent, agent_state, started, item_id, winning_team, price_paid)
+        agent_state = _apply_state_delta(agent_state, reply[1])
+    except (Exception, _CpuTimeExceeded) as e:
+        reply = _failure_reply('update', e)
+    send_message(conn, reply)
 
-        # Update agent
-        agent.update_after_each_round(item_id, winning_team, price_paid)
+    try:
+        started = _agent_started(conn, limits)
+        if agent_class is None:
+            agent_class = _load_agent_class(agent_code, team_id)
+        agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                   opponent_teams, agent_state, prepared)
+        reply = _bid_phase(agent, agent_state, started, next_item_id,
+                           anytime=_AnytimeBidding(bid_slot, limits))
+    except (Exception, _CpuTimeExceeded) as e:
+        reply = _failure_reply('bid', e)
+    send_message(conn, reply)
+
+
+def _worker_agent_loop(agent_code: AgentCode, team_id: str, valuation_vector: Dict[str, float],
+                       budget: float, opponent_teams: list, limits: Dict[str, Any],
+                       prepared: Optional[bytes], agent_state: Optional[Dict],
+                       bid_slot: Optional[PostedBidSlot], conn):
+    """
+    Long-lived worker that keeps a live agent instance for a whole game.
+
+    Runs in its own process (same memory isolation as the per-call workers)
+    and answers requests received over a pipe (every reply is preceded by
+    a ('started', monotonic_time) message, see _agent_started):
+    - ('bid', item_id[, injected]) -> ('success', bid, timing, state_delta, None)
+    - ('plan', remaining_items) -> ('success', plan, timing, state_delta, None)
+    - ('prepare',) -> ('success', encoded_prepared, timing, state_delta, None)
+    - ('update', item_id, winning_team, price_paid) -> ('success', state_delta, timing, None)
+    - ('updates', [(item_id, winning_team, price_paid), ...]) -> one update
+      reply per round result
+    - ('update_and_bid', item_id, winning_team, price_paid, next_item_id)
+      -> the update reply followed by the bid reply
+    - ('stop',) -> worker exits
+
+    The agent module is loaded and the agent constructed at the start of
+    the first request, as part of its agent time. If a call raises (or runs
+    out of CPU time), the agent is rebuilt from the last good state at the
+    start of the next call, exactly as a fresh per-call worker would see it.
 
-        # Serialize new state
-        new_state = {}
-        for key, value in agent.__dict__.items():
-            if not key.startswith('_') and not callable(value):
-                try:
-                    pickle.dumps(value)
-                    new_state[key] = value
-                except:
-                    pass
+    Args:
+        agent_code: Compiled agent module (AgentCode)
+        team_id: Team identifier
+        valuation_vector: Item valuations (dict or SharedValuations)
+        budget: Initial budget
+        opponent_teams: List of opponent team IDs
+        limits: Resource limits of the agent code (see _agent_started)
+        prepared: Result of the agent's prepare() (SharedPrepared or encoded; None if none)
+        agent_state: Last good encoded state to restore (None for a new agent)
+        bid_slot: Team's posted bid (None if unavailable)
+        conn: Worker end of a duplex pipe
+    """
+    try:
+        _apply_memory_limit(limits)
+        valuation_vector = _attach_valuations(valuation_vector)
+        prepared = _attach_prepared(prepared)
+    except Exception as e:
+        # Report the start-up failure on the first request, then exit
+        try:
+            for phase, _ in _request_phases(recv_message(conn, trusted=True)):
+                send_message(conn, _failure_reply(phase, e))
+        except (EOFError, OSError, ValueError):
+            pass
+        return
+
+    agent_class = None
+    agent = None
+    last_good_state = agent_state
+    anytime = _AnytimeBidding(bid_slot, limits)
+
+    while True:
+        try:
+            request = recv_message(conn, trusted=True)
+        except (EOFError, OSError):
+            break
 
-        result_queue.put(('success', new_state, None))
+        if request[0] == 'stop':
+            break
 
-    except Exception as e:
-        result_queue.put(('error', None, str(e)))
+        for phase, args in _request_phases(request):
+            try:
+                started = _agent_started(conn, _phase_limits(limits, phase))
+                if agent_class is None:
+                    agent_class = _load_agent_class(agent_code, team_id)
+                if agent is None:
+                    agent = _instantiate_agent(agent_class, team_id, valuation_vector, budget,
+                                               opponent_teams, last_good_state, prepared)
+                if phase == 'bid':
+                    reply = _bid_phase(agent, last_good_state, started, *args, anytime=anytime)
+                    last_good_state = _apply_state_delta(last_good_state, reply[3])
+                elif phase == 'plan':
+                    reply = _plan_phase(agent, last_good_state, started, *args)
+                    last_good_state = _apply_state_delta(last_good_state, reply[3])
+                elif phase == 'prepare':
+                    reply = _prepare_phase(agent, last_good_state, started)
+                    last_good_state = _apply_state_delta(last_good_state, reply[3])
+                    prepared = reply[1]
+                    agent.prepared = _decode_state_value(prepared)
+                else:
+                    reply = _update_phase(agent, last_good_state, started, *args)
+                    last_good_state = _apply_state_delta(last_good_state, reply[1])
+            except (Exception, _CpuTimeExceeded) as e:
+                reply = _failure_reply(phase, e)
+                if phase == 'prepare':
+                    prepared = _encode_state_value(None)
+                agent = None
+
+            send_message(conn, reply)
+
+
+@dataclass
+class _PendingCall:
+    """Handle for an isolated call that has been started but not collected."""
+    team_id: str
+    start_time: float             # time.monotonic() when the call was started
+    process: Any = None           # ForkedProcess or ZygoteProcess
+    channel: Any = None           # Pipe connection to the worker
+    error: Optional[str] = None   # Set if the call could not be started
+    phase: str = 'bid'            # Phase currently awaited ('update', 'bid' or 'plan')
+    deadline: float = 0.0         # time.monotonic() deadline of the current phase
+    awaiting_start: bool = True   # The current phase's started message is still due
+    agent_start: Optional[float] = None  # time.monotonic() the current phase's agent code started
+    update_error: Optional[str] = None
+    result: Optional[Tuple[float, float, Optional[str]]] = None
+    updates: int = 0              # Number of update replies expected (update calls)
+    update_errors: List[Optional[str]] = field(default_factory=list)
 
 
 class AgentManager:
@@ -160,8 +854,100 @@ class AgentManager:
     SECURITY MODEL:
     - Each agent runs in isolated process (separate memory space)
     - Agent state is serialized/deserialized between calls
+    - The game process keeps agent state only in encoded form (per-attribute
+      pickles); it never unpickles agent objects itself
+
+    VALUATIONS:
+    - Each team's valuation vector is written once per registration into a
+      read-only shared memory block (src/shared_valuations.py); workers map
+      it and the agent sees a read-only mapping instead of a pickled dict
+    - The block is only reachable through a descriptor handed to that
+      team's workers; it is not part of the agent state
+
+    STATE TRANSFER:
+    - Workers reply with a delta: only the attributes whose encoding changed
+      during the call, plus the names of removed attributes
+    - Each attribute is pickled once (protocol 5) and kept as that pickle
+    - Requests and replies are single frames with one pickle each
+      (src/ipc.py); replies are unpickled as plain data only, so a forged
+      reply cannot run code in the game process
+    - transfer_stats counts the state bytes sent to and received from
+      workers (see get_transfer_stats)
     - Prevents memory scanning, budget injection, module pollution
 
+    STATELESS AGENTS:
+    - An agent class that sets stateless = True declares that it only needs
+      its budget and items_won from the round results. Its
+      update_after_each_round is not run; the game process tracks budget
+      and items_won and sets them on the agent right before each bid, so
+      every round costs one isolated call instead of an update and a bid
+
+    TIMEOUTS:
+    - timeout_seconds only covers the agent's own code: executing the
+      agent module, constructing the agent (and restoring its state) plus
+      the call. The worker sends a started message right before agent code
+      runs and the deadline is timeout_seconds after it
+    - Starting the worker process is covered by a separate, generous
+      allowance (startup_seconds); a worker that is not ready by then fails
+      the call with "Startup timeout". With 'agent_zygote' workers the
+      module is executed once in the agent's zygote, before any call's
+      arguments exist, and counts as start-up
+    - Reported execution times are the agent's time measured in the worker
+      (monotonic clock, CPU time alongside; see get_execution_stats)
+    - timeout_clock 'cpu' measures timeout_seconds in CPU seconds of the
+      worker instead, so results do not depend on how many games share the
+      host. The worker stops the agent itself (ITIMER_PROF, with RLIMIT_CPU
+      as a kernel backstop) and replies "Timeout"; an agent that sleeps or
+      blocks is killed after timeout_seconds * CPU_TIMEOUT_WALL_FACTOR of
+      wall-clock time. Reported execution times are then CPU times
+    - Every bid and plan reply carries the worker's resource usage (user
+      and system CPU, peak RSS; see get_call_usage)
+
+    ANYTIME BIDS:
+    - During bidding_function an agent can call self.post_bid(amount) any
+      number of times and self.time_remaining() for the seconds left in
+      the phase. If the bid then times out, the last posted bid is used
+      (error "Timeout (posted bid used)") instead of 0
+    - Posted bids go to a per-team memory file (src/posted_bids.py) that
+      is read only after a timeout, so posting costs no pipe traffic
+
+    PREPARE:
+    - Agents may define prepare(), run once per game (prepare_agents)
+      under prepare_seconds instead of timeout_seconds. Its picklable
+      result is cached here, encoded and never unpickled in this process,
+      and set as agent.prepared after construction in every later call
+      (None if prepare failed), so per-call workers do not redo expensive
+      setup. prepared is never part of the agent state
+    - The encoded result is written once into a sealed per-team memory
+      file (src/shared_prepared.py) that workers read through a
+      descriptor, so it is not pickled into every call's arguments
+
+    MEMORY:
+    - Every worker may grow its address space by memory_limit_mb beyond
+      what it starts with (interpreter and preloaded modules, which are not
+      the agent's). Allocations past that raise MemoryError in the agent
+      and the phase fails with "MemoryLimit"
+    - The peak resident set size of each agent's workers is recorded
+      (max_rss_kb in get_execution_stats), whatever the outcome of the call
+
+    ISOLATION MODES:
+    - 'per_call': a fresh process per bid/update call (default)
+    - 'persistent': one long-lived worker process per agent that keeps the
+      live agent instance and answers bid/update requests over a pipe. On
+      timeout the worker is killed and respawned from the last good state
+      in agent_states, matching the per-call behavior.
+
+    WORKER START METHODS:
+    - 'zygote': workers are forked from a shared pre-warmed zygote process
+      that imported WORKER_PRELOAD_MODULES but holds no tournament state
+      (default, see src/zygote.py)
+    - 'agent_zygote': like 'zygote', but each agent gets its own zygote
+      that has already executed the agent module, so a call forks a
+      copy-on-write child instead of re-importing the agent file. Still a
+      fresh process per call; the zygote only serves that one agent
+    - 'fork': workers are forked directly from the game process and keep
+      only their own team's descriptors (src/zygote.py fork_worker)
+
     Responsibilities:
     - Load agent code from file
     - Validate agent interface compliance
@@ -169,16 +955,54 @@ class AgentManager:
     - Handle errors gracefully
     """
     
-    def __init__(self, timeout_seconds: float = 2.0):
+    def __init__(self, timeout_seconds: float = 2.0,
+                 isolation_mode: str = ISOLATION_PER_CALL,
+                 start_method: str = AGENT_WORKER_START,
+                 startup_seconds: float = SANDBOX_STARTUP_SECONDS,
+                 timeout_clock: str = BID_TIMEOUT_CLOCK,
+                 memory_limit_mb: Optional[float] = MEMORY_LIMIT_MB,
+                 prepare_seconds: float = PREPARE_TIMEOUT_SECONDS):
         """
         Initialize agent manager.
         
         Args:
             timeout_seconds: Maximum time allowed for bid execution
+            isolation_mode: 'per_call' or 'persistent' (see class docstring)
+            start_method: 'zygote', 'agent_zygote' or 'fork' (see class docstring)
+            startup_seconds: Allowance for worker start-up before the agent
+                             code runs (see TIMEOUTS in the class docstring)
+            timeout_clock: 'wall' or 'cpu' (see TIMEOUTS in the class docstring)
+            memory_limit_mb: Memory each worker may add for the agent (see
+                             MEMORY in the class docstring); None for no limit
+            prepare_seconds: Time limit of the once-per-game prepare() call
+                             (see PREPARE in the class docstring)
         """
+        if isolation_mode not in ISOLATION_MODES:
+            raise ValueError(f"Unknown isolation mode: {isolation_mode}")
+        if start_method not in START_METHODS:
+            raise ValueError(f"Unknown worker start method: {start_method}")
+        if timeout_clock not in TIMEOUT_CLOCKS:
+            raise ValueError(f"Unknown timeout clock: {timeout_clock}")
+
         self.timeout_seconds = timeout_seconds
+        self.startup_seconds = startup_seconds
+        self.timeout_clock = timeout_clock
+        self.memory_limit_mb = memory_limit_mb
+        self.prepare_seconds = prepare_seconds
+        self.isolation_mode = isolation_mode
+        self.start_method = start_method
         self.agent_metadata = {}  # Store file paths and initialization params
-        self.agent_states = {}    # Store serialized agent states
+        self.agent_states = {}    # Store encoded agent states (attribute -> encoded value)
+        self.transfer_stats = {}  # team_id -> state transfer counters
+        self.execution_stats = {}  # team_id -> agent and start-up time counters
+        self.workers = {}         # team_id -> (process, conn) for persistent mode
+        self.agent_zygotes = {}   # team_id -> SpecializedZygote for 'agent_zygote' start
+        self.shared_valuations = {}  # team_id -> SharedValuations block of the current registration
+        self.tracked_state = {}   # team_id -> {'budget', 'items_won'} kept for stateless agents
+        self.call_usage = {}      # team_id -> resource usage of each bid/plan/prepare call
+        self.bid_slots = {}       # team_id -> PostedBidSlot of the current registration
+        self.prepared = {}        # team_id -> SharedPrepared block (or encoded value) of the prepare() result
+        self.agent_code = {}      # team_id -> AgentCode compiled at registration
     
     def load_agent(self, file_path: str, team_id: str, 
                    valuation_vector: Dict[str, float],
@@ -215,8 +1039,10 @@ class AgentManager:
                 logger.error(f"Failed to load module spec from {file_path}")
                 return None
 
+            # Workers run this same code object (see AgentCode), not the file
+            code = _get_agent_code(file_path)
             module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            exec(code, module.__dict__)
 
             # Find BiddingAgent class in module
             if not hasattr(module, 'BiddingAgent'):
@@ -231,15 +1057,38 @@ class AgentManager:
                 logger.error(f"Agent validation failed for team {team_id}")
                 return None
             
+            # Drop any worker or zygote left over from a previous registration
+            self._stop_worker(team_id)
+            self._stop_agent_zygote(team_id)
+            self._release_valuations(team_id)
+            self._release_bid_slot(team_id)
+            self._release_prepared(team_id)
+            self._release_agent_code(team_id)
+            self.agent_code[team_id] = AgentCode.create(file_path, code)
+
             # Store metadata for process-isolated execution
             self.agent_metadata[team_id] = {
                 'file_path': file_path,
                 'team_id': team_id,
                 'valuation_vector': valuation_vector,
                 'budget': budget,
-                'opponent_teams': opponent_teams
+                'opponent_teams': opponent_teams,
+                'has_bidding_plan': callable(getattr(test_agent, 'bidding_plan', None)),
+                'has_prepare': callable(getattr(test_agent, 'prepare', None)),
+                'stateless': getattr(test_agent, 'stateless', False)
             }
             self.agent_states[team_id] = None  # No state yet
+            if self.agent_metadata[team_id]['stateless']:
+                self.tracked_state[team_id] = {'budget': budget, 'items_won': []}
+            else:
+                self.tracked_state.pop(team_id, None)
+            self.transfer_stats[team_id] = {'calls': 0, 'bytes_sent': 0,
+                                            'bytes_received': 0, 'full_state_bytes': 0}
+            self.execution_stats[team_id] = {'agent_calls': 0, 'agent_time': 0.0, 'cpu_time': 0.0,
+                                             'user_time': 0.0, 'system_time': 0.0,
+                                             'max_rss_kb': 0, 'startups': 0,
+                                             'startup_time': 0.0, 'max_startup_time': 0.0}
+            self.call_usage[team_id] = []
 
             logger.info(f"Successfully registered agent for team {team_id}")
 
@@ -279,6 +1128,11 @@ class AgentManager:
                 logger.error(f"Agent missing required attribute: {attr_name}")
                 return False
 
+        # Optional stateless declaration (see class docstring)
+        if not isinstance(getattr(agent, 'stateless', False), bool):
+            logger.error("Agent attribute 'stateless' must be True or False")
+            return False
+
         return True
     
     def execute_bid_with_timeout(self, agent: Any, item_id: str) -> Tuple[float, float, Optional[str]]:
@@ -297,80 +1151,230 @@ class AgentManager:
             - On success: (bid, time, None)
             - On timeout: (0.0, timeout_seconds, "Timeout")
             - On error: (0.0, time, error_message)
+            execution_time only covers the agent's own code (see TIMEOUTS)
         """
-        team_id = agent.team_id
+        return self.execute_bids_concurrently({agent.team_id: agent}, item_id)[agent.team_id]
 
-        if team_id not in self.agent_metadata:
-            logger.error(f"Team {team_id} not registered")
-            return 0.0, 0.0, "Agent not registered"
+    def execute_bids_concurrently(self, agents: Dict[str, Any],
+                                  item_id: str) -> Dict[str, Tuple[float, float, Optional[str]]]:
+        """
+        Execute the bidding functions of several agents in parallel.
 
-        metadata = self.agent_metadata[team_id]
-        agent_state = self.agent_states[team_id]
+        All isolated calls are started first and then collected together,
+        so a round takes about as long as the slowest agent instead of the
+        sum of all agents.
 
-        start_time = time.time()
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+            item_id: ID of item being auctioned
 
-        try:
-            # Create multiprocessing queue for results
-            result_queue = mp.Queue()
+        Returns:
+            Dictionary mapping team_id to (bid_amount, execution_time, error_msg),
+            with the same per-team semantics as execute_bid_with_timeout
+        """
+        results = {}
+        pending_bids = {}
 
-            # Create isolated process
-            process = mp.Process(
-                target=_worker_execute_bid,
-                args=(
-                    metadata['file_path'],
-                    metadata['team_id'],
-                    metadata['valuation_vector'],
-                    metadata['budget'],
-                    metadata['opponent_teams'],
-                    item_id,
-                    agent_state,
-                    result_queue
-                )
-            )
+        for team_id, agent in agents.items():
+            if agent.team_id not in self.agent_metadata:
+                logger.error(f"Team {agent.team_id} not registered")
+                results[team_id] = (0.0, 0.0, "Agent not registered")
+                continue
+            pending_bids[team_id] = self._start_bid(agent.team_id, item_id)
 
-            process.start()
-            process.join(timeout=self.timeout_seconds)
+        self._run_calls(pending_bids, self._bid_outcome)
+        for team_id, pending in pending_bids.items():
+            results[team_id] = pending.result
 
-            execution_time = time.time() - start_time
-            
-            # Check if process timed out
-            if process.is_alive():
-                process.terminate()
-                process.join(timeout=1.0)
-                if process.is_alive():
-                    process.kill()  # Force kill if terminate didn't work
-                logger.warning(f"Team {team_id}: Bid execution timeout ({self.timeout_seconds}s)")
-                return 0.0, self.timeout_seconds, "Timeout"
+        return {team_id: results[team_id] for team_id in agents}
 
-            # Get result from queue
-            try:
-                status, bid, exec_time, new_state, error = result_queue.get(timeout=0.5)
-
-                if status == 'success':
-                    # Update agent state for next round
-                    self.agent_states[team_id] = new_state
-                    # Round bid to 2 decimal places
-                    rounded_bid = round(float(bid), 2)
-                    logger.debug(f"Team {team_id}: Bid {rounded_bid:.2f} in {exec_time:.3f}s")
-                    return rounded_bid, exec_time, None
-                else:
-                    logger.error(f"Team {team_id}: Bid execution error: {error}")
-                    return 0.0, execution_time, f"Error: {error}"
+    def prepare_agents(self, agents: Dict[str, Any]) -> Dict[str, Tuple[float, Optional[str]]]:
+        """
+        Run the prepare() hook of agents that define it, in parallel.
+
+        Each call has prepare_seconds instead of timeout_seconds. The
+        result is cached (encoded, never unpickled here) and set as
+        agent.prepared in every later call; None if prepare failed.
+
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+
+        Returns:
+            Dictionary mapping team_id to (execution_time, error_msg), for
+            agents that define prepare only
+        """
+        results = {}
+        pending_calls = {}
+
+        for team_id, agent in agents.items():
+            if agent.team_id not in self.agent_metadata:
+                logger.error(f"Team {agent.team_id} not registered")
+                results[team_id] = (0.0, "Agent not registered")
+            elif self.agent_metadata[agent.team_id]['has_prepare']:
+                pending_calls[team_id] = self._start_bid(agent.team_id, None, command='prepare')
+
+        self._run_calls(pending_calls, self._prepare_outcome)
+        for team_id, pending in pending_calls.items():
+            results[team_id] = pending.result
+
+        return {team_id: results[team_id] for team_id in agents if team_id in results}
+
+    def _prepare_outcome(self, pending: _PendingCall, outcome: str, reply: Any) -> bool:
+        """_run_calls handler for prepare calls: caches the result, sets pending.result to (execution_time, error_msg)."""
+        team_id = pending.team_id
+
+        if outcome == 'ok':
+            status, prepared, timing, state_delta, error = reply
+            if status == 'success':
+                self._apply_reply_delta(team_id, state_delta)
+                self._store_prepared(team_id, prepared)
+                pending.result = (self._record_agent_time(team_id, 'prepare', timing), None)
+                return True
+
+            self._record_peak_rss(team_id, timing)
+            if status == 'timeout':
+                pending.result = (self.prepare_seconds, self._call_error(pending, 'cpu_timeout'))
+            elif status == 'memory':
+                pending.result = (self._agent_elapsed(pending), self._call_error(pending, 'memory'))
+            else:
+                logger.error(f"Team {team_id}: Prepare error: {error}")
+                pending.result = (self._agent_elapsed(pending), f"Error: {error}")
+        else:
+            pending.result = (self._failed_agent_time(pending, outcome),
+                              self._call_error(pending, outcome))
+
+        self._store_prepared(team_id, _encode_state_value(None))
+        return True
+
+    def request_bidding_plans(self, agents: Dict[str, Any], remaining_items: list
+                              ) -> Dict[str, Tuple[Optional[Dict[str, float]], float, Optional[str]]]:
+        """
+        Ask agents for an upfront bidding plan, in parallel.
+
+        Only agents whose class defines bidding_plan are called; the others
+        are left out of the result. A plan maps
+        every remaining item to a bid (rounded to 2 decimal places like
+        per-round bids); the caller uses it instead of per-round
+        bidding_function calls.
+
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+            remaining_items: Items that can still be auctioned
+
+        Returns:
+            Dictionary mapping team_id to (plan, execution_time, error_msg);
+            plan is None if the agent opted out or the call failed
+        """
+        results = {}
+        pending_calls = {}
+
+        for team_id, agent in agents.items():
+            if agent.team_id not in self.agent_metadata:
+                logger.error(f"Team {agent.team_id} not registered")
+                results[team_id] = (None, 0.0, "Agent not registered")
+            elif self.agent_metadata[agent.team_id]['has_bidding_plan']:
+                pending_calls[team_id] = self._start_bid(agent.team_id, list(remaining_items),
+                                                         command='plan')
+
+        self._run_calls(pending_calls, self._plan_outcome)
+        for team_id, pending in pending_calls.items():
+            results[team_id] = pending.result
+
+        return {team_id: results[team_id] for team_id in agents if team_id in results}
+
+    def _start_bid(self, team_id: str, item_id: Any, command: str = 'bid') -> _PendingCall:
+        """
+        Start an isolated bid call without waiting for its result.
+
+        With command='plan', item_id is the list of remaining items and the
+        call runs bidding_plan instead (see request_bidding_plans); with
+        command='prepare' (item_id unused) it runs prepare (see
+        prepare_agents).
+        """
+        pending = self._new_call(team_id, command)
+        agent_state = self.agent_states.get(team_id)
+
+        if command == 'plan':
+            target, call_args = _worker_bidding_plan, (item_id, agent_state)
+            request = ('plan', item_id)
+        elif command == 'prepare':
+            target, call_args = _worker_prepare, (agent_state,)
+            request = ('prepare',)
+        else:
+            injected = self.tracked_state.get(team_id)
+            bid_slot = self._clear_posted_bid(team_id)
+            target, call_args = _worker_execute_bid, (item_id, agent_state, injected, bid_slot)
+            request = ('bid', item_id, injected)
+
+        if self.isolation_mode == ISOLATION_PERSISTENT:
+            if self._send_to_worker(team_id, request):
+                pending.process, pending.channel = self.workers[team_id]
+            else:
+                pending.error = "No result returned"
+            return pending
+
+        self._record_call(team_id, agent_state)
+
+        try:
+            # Create isolated process
+            pending.process, pending.channel = self._launch_worker(
+                team_id, target, self._worker_args(team_id) + call_args
+            )
 
-            except Exception as e:
-                logger.error(f"Team {team_id}: Failed to get result from queue: {e}")
-                return 0.0, execution_time, "No result returned"
-                
         except Exception as e:
-            execution_time = time.time() - start_time
             logger.error(f"Team {team_id}: Unexpected error in bid execution: {e}", exc_info=True)
-            return 0.0, execution_time, f"Exception: {str(e)}"
-        finally:
-            # Clean up
-            try:
-                result_queue.close()
-            except:
-                pass
+            pending.error = f"Exception: {str(e)}"
+
+        return pending
+
+    def _bid_outcome(self, pending: _PendingCall, outcome: str, reply: Any) -> bool:
+        """_run_calls handler for bids: sets pending.result to (bid_amount, execution_time, error_msg)."""
+        if outcome == 'ok':
+            pending.result = self._handle_bid_reply(pending, reply)
+        elif outcome == 'timeout':
+            pending.result = self._bid_timeout_result(pending, self._call_error(pending, outcome))
+        else:
+            pending.result = (0.0, self._failed_agent_time(pending, outcome),
+                              self._call_error(pending, outcome))
+        return True
+
+    def _bid_timeout_result(self, pending: _PendingCall, error: str) -> Tuple[float, float, str]:
+        """Result of a bid that ran out of time: the agent's last posted bid if any, else 0."""
+        slot = self.bid_slots.get(pending.team_id)
+        posted = slot.read() if slot is not None else None
+        if posted is None:
+            return 0.0, self.timeout_seconds, error
+
+        posted = round(posted, 2)
+        logger.info(f"Team {pending.team_id}: Using posted bid {posted:.2f} after timeout")
+        return posted, self.timeout_seconds, f"{error} (posted bid used)"
+
+    def _plan_outcome(self, pending: _PendingCall, outcome: str, reply: Any) -> bool:
+        """_run_calls handler for bidding plans: sets pending.result to (plan, execution_time, error_msg)."""
+        team_id = pending.team_id
+
+        if outcome != 'ok':
+            pending.result = (None, self._failed_agent_time(pending, outcome),
+                              self._call_error(pending, outcome))
+            return True
+
+        status, plan, timing, state_delta, error = reply
+        if status == 'success':
+            self._apply_reply_delta(team_id, state_delta)
+            if plan is not None:
+                plan = {item_id: round(float(bid), 2) for item_id, bid in plan.items()}
+            pending.result = (plan, self._record_agent_time(team_id, 'plan', timing), None)
+            return True
+
+        self._record_peak_rss(team_id, timing)
+        if status == 'timeout':
+            pending.result = (None, self.timeout_seconds, self._call_error(pending, 'cpu_timeout'))
+        elif status == 'memory':
+            pending.result = (None, self._agent_elapsed(pending), self._call_error(pending, 'memory'))
+        else:
+            logger.error(f"Team {team_id}: Bidding plan error: {error}")
+            pending.result = (None, self._agent_elapsed(pending), f"Error: {error}")
+        return True
 
     def update_agent_after_round(self, agent: Any, item_id: str,
                                 winning_team: str, price_paid: float) -> bool:
@@ -388,69 +1392,884 @@ class AgentManager:
         Returns:
             True if update successful, False otherwise
         """
-        team_id = agent.team_id
+        errors = self.update_agent_after_rounds(agent, [(item_id, winning_team, price_paid)])
+        return errors[0] is None
 
-        if team_id not in self.agent_metadata:
-            logger.error(f"Team {team_id} not registered")
-            return False
+    def update_agent_after_rounds(self, agent: Any,
+                                  updates: List[Tuple[str, str, float]]) -> List[Optional[str]]:
+        """
+        Deliver several round results to an agent in one isolated call.
+
+        The agent's update_after_each_round runs once per round result, in
+        order, with the same semantics as separate update calls; each update
+        gets its own timeout_seconds budget.
+
+        Args:
+            agent: Agent proxy object
+            updates: List of (item_id, winning_team, price_paid)
+
+        Returns:
+            List with one entry per update: None on success, otherwise the error
+        """
+        results = self.update_agents_after_rounds({agent.team_id: agent}, {agent.team_id: updates})
+        return results[agent.team_id]
+
+    def broadcast_round_result(self, agents: Dict[str, Any], item_id: str,
+                               winning_team: str, price_paid: float) -> Dict[str, Optional[str]]:
+        """
+        Deliver one round result to several agents in parallel.
+
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+            item_id: Item that was auctioned
+            winning_team: ID of winning team
+            price_paid: Price paid by winner
+
+        Returns:
+            Dictionary mapping team_id to None on success, otherwise the error
+        """
+        update = (item_id, winning_team, price_paid)
+        results = self.update_agents_after_rounds(agents, {team_id: [update] for team_id in agents})
+        return {team_id: errors[0] for team_id, errors in results.items()}
+
+    def update_agents_after_rounds(self, agents: Dict[str, Any],
+                                   updates: Dict[str, List[Tuple[str, str, float]]]
+                                   ) -> Dict[str, List[Optional[str]]]:
+        """
+        Deliver round results to several agents in parallel.
+
+        All isolated calls are started first and then collected together,
+        so the delivery takes about one timeout window instead of one per
+        team. Per team the semantics match update_agent_after_rounds.
+
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+            updates: Dictionary mapping team_id to its list of
+                     (item_id, winning_team, price_paid)
+
+        Returns:
+            Dictionary mapping team_id to one entry per update: None on
+            success, otherwise the error
+        """
+        results = {}
+        pending_calls = {}
+
+        for team_id, agent in agents.items():
+            team_updates = [tuple(update) for update in updates.get(team_id, [])]
+
+            if agent.team_id not in self.agent_metadata:
+                logger.error(f"Team {agent.team_id} not registered")
+                results[team_id] = ["Agent not registered"] * len(team_updates)
+            elif self.agent_states[agent.team_id] is None:
+                # Agent hasn't been initialized yet (no bids executed)
+                logger.warning(f"Team {agent.team_id}: Cannot update agent with no state")
+                results[team_id] = ["No agent state"] * len(team_updates)
+            elif not team_updates:
+                results[team_id] = []
+            elif self.agent_metadata[agent.team_id]['stateless']:
+                for update in team_updates:
+                    self._track_round_result(agent.team_id, *update)
+                results[team_id] = [None] * len(team_updates)
+            else:
+                pending_calls[team_id] = self._start_updates(agent.team_id, team_updates)
+
+        self._run_calls(pending_calls, self._update_outcome)
+        for team_id, pending in pending_calls.items():
+            results[team_id] = pending.update_errors
+
+        return {team_id: results[team_id] for team_id in agents}
+
+    def _start_updates(self, team_id: str, updates: List[Tuple[str, str, float]]) -> _PendingCall:
+        """Start an isolated update call without waiting for its replies."""
+        pending = self._new_call(team_id, 'update', updates=len(updates))
+
+        if self.isolation_mode == ISOLATION_PERSISTENT:
+            if self._send_to_worker(team_id, ('updates', updates)):
+                pending.process, pending.channel = self.workers[team_id]
+            else:
+                pending.error = "No result returned"
+            return pending
 
-        metadata = self.agent_metadata[team_id]
         agent_state = self.agent_states[team_id]
+        self._record_call(team_id, agent_state)
 
-        if agent_state is None:
-            # Agent hasn't been initialized yet (no bids executed)
-            logger.warning(f"Team {team_id}: Cannot update agent with no state")
-            return False
+        try:
+            pending.process, pending.channel = self._launch_worker(
+                team_id,
+                _worker_update_agent,
+                self._worker_args(team_id) + (agent_state, updates)
+            )
+
+        except Exception as e:
+            logger.error(f"Team {team_id}: Unexpected error in agent update: {e}", exc_info=True)
+            pending.error = f"Exception: {str(e)}"
+
+        return pending
+
+    def _update_outcome(self, pending: _PendingCall, outcome: str, reply: Any) -> bool:
+        """
+        _run_calls handler for update calls.
+
+        Appends one error (or None) per update to pending.update_errors;
+        updates after a failure get the same error.
+        """
+        if outcome == 'ok':
+            pending.update_errors.append(self._handle_update_reply(pending, reply))
+            return len(pending.update_errors) >= pending.updates
+
+        missing = pending.updates - len(pending.update_errors)
+        pending.update_errors.extend([self._call_error(pending, outcome)] * missing)
+        return True
+
+    def execute_update_and_bid(self, agent: Any, item_id: str, winning_team: str,
+                               price_paid: float, next_item_id: str
+                               ) -> Tuple[float, float, Optional[str], Optional[str]]:
+        """
+        Deliver a round result and request the next bid in one isolated call.
+
+        Args:
+            agent: Agent proxy object
+            item_id: Item auctioned in the previous round
+            winning_team: ID of winning team of the previous round
+            price_paid: Price paid in the previous round
+            next_item_id: Item being auctioned now
+
+        Returns:
+            Tuple of (bid_amount, execution_time, bid_error, update_error)
+        """
+        results = self.execute_updates_and_bids_concurrently(
+            {agent.team_id: agent}, item_id, winning_team, price_paid, next_item_id
+        )
+        return results[agent.team_id]
+
+    def execute_updates_and_bids_concurrently(self, agents: Dict[str, Any], item_id: str,
+                                              winning_team: str, price_paid: float,
+                                              next_item_id: str
+                                              ) -> Dict[str, Tuple[float, float, Optional[str], Optional[str]]]:
+        """
+        Fused update-then-bid round trip for several agents in parallel.
+
+        Each agent gets one isolated call that runs update_after_each_round
+        with the previous round's public result and then bidding_function for
+        the next item. Semantics match two separate calls:
+        - The update always runs before the bid; the bid sees the updated
+          state, or the previous state if the update failed
+        - Each phase has its own timeout_seconds budget, timed from the
+          moment the agent code of that phase starts
+        - If the update times out, the bid is requested in a separate call
+        - Stateless agents skip the update phase: the result is tracked here
+          and only the bid call is made
+
+        Args:
+            agents: Dictionary mapping team_id to agent proxy object
+            item_id: Item auctioned in the previous round
+            winning_team: ID of winning team of the previous round
+            price_paid: Price paid in the previous round
+            next_item_id: Item being auctioned now
+
+        Returns:
+            Dictionary mapping team_id to
+            (bid_amount, execution_time, bid_error, update_error)
+        """
+        results = {}
+        pending_calls = {}
+        pending_bids = {}  # team_id -> bid-only call of a stateless agent
+        fallback = {}  # team_id -> update_error, for teams that still need a bid
+
+        for team_id, agent in agents.items():
+            if agent.team_id not in self.agent_metadata:
+                logger.error(f"Team {agent.team_id} not registered")
+                results[team_id] = (0.0, 0.0, "Agent not registered", "Agent not registered")
+            elif self.agent_states[agent.team_id] is None:
+                # Agent hasn't been initialized yet (no bids executed)
+                logger.warning(f"Team {agent.team_id}: Cannot update agent with no state")
+                fallback[team_id] = "No agent state"
+            elif self.agent_metadata[agent.team_id]['stateless']:
+                self._track_round_result(agent.team_id, item_id, winning_team, price_paid)
+                pending_bids[team_id] = self._start_bid(agent.team_id, next_item_id)
+            else:
+                pending_calls[team_id] = self._start_update_and_bid(
+                    agent.team_id, item_id, winning_team, price_paid, next_item_id
+                )
+
+        self._run_calls({**pending_calls, **pending_bids}, self._update_and_bid_outcome)
+        for team_id, pending in pending_bids.items():
+            results[team_id] = pending.result + (None,)
+
+        for team_id, pending in pending_calls.items():
+            if pending.result is None:
+                fallback[team_id] = pending.update_error
+            else:
+                results[team_id] = pending.result + (pending.update_error,)
+
+        if fallback:
+            bid_results = self.execute_bids_concurrently(
+                {team_id: agents[team_id] for team_id in fallback}, next_item_id
+            )
+            for team_id, update_error in fallback.items():
+                results[team_id] = bid_results[team_id] + (update_error,)
+
+        return {team_id: results[team_id] for team_id in agents}
+
+    def _start_update_and_bid(self, team_id: str, item_id: str, winning_team: str,
+                              price_paid: float, next_item_id: str) -> _PendingCall:
+        """Start a fused update-then-bid call without waiting for its result."""
+        pending = self._new_call(team_id, 'update')
+        bid_slot = self._clear_posted_bid(team_id)
+
+        if self.isolation_mode == ISOLATION_PERSISTENT:
+            request = ('update_and_bid', item_id, winning_team, price_paid, next_item_id)
+            if self._send_to_worker(team_id, request):
+                pending.process, pending.channel = self.workers[team_id]
+            else:
+                pending.error = "No result returned"
+            return pending
+
+        self._record_call(team_id, self.agent_states[team_id])
 
         try:
-            result_queue = mp.Queue()
-
-            process = mp.Process(
-                target=_worker_update_agent,
-                args=(
-                    metadata['file_path'],
-                    metadata['team_id'],
-                    metadata['valuation_vector'],
-                    metadata['budget'],
-                    metadata['opponent_teams'],
-                    agent_state,
+            pending.process, pending.channel = self._launch_worker(
+                team_id,
+                _worker_update_and_bid,
+                self._worker_args(team_id) + (
+                    self.agent_states[team_id],
                     item_id,
                     winning_team,
                     price_paid,
-                    result_queue
+                    next_item_id,
+                    bid_slot
                 )
             )
 
-            process.start()
-            process.join(timeout=self.timeout_seconds)
+        except Exception as e:
+            logger.error(f"Team {team_id}: Unexpected error in agent update: {e}", exc_info=True)
+            pending.error = f"Exception: {str(e)}"
 
-            if process.is_alive():
-                process.terminate()
-                process.join(timeout=1.0)
-                if process.is_alive():
-                    process.kill()
-                logger.warning(f"Team {team_id}: Update timeout")
-                return False
+        return pending
 
-            try:
-                status, new_state, error = result_queue.get(timeout=0.5)
+    def _update_and_bid_outcome(self, pending: _PendingCall, outcome: str, reply: Any) -> bool:
+        """
+        _run_calls handler for fused calls (and plain bids, by phase).
+
+        Fills in pending.update_error and pending.result. pending.result
+        stays None if the update phase did not complete, in which case the
+        caller must request the bid separately.
+        """
+        if pending.phase != 'update':
+            return self._bid_outcome(pending, outcome, reply)
+
+        if outcome != 'ok':
+            pending.update_error = self._call_error(pending, outcome)
+            return True
 
-                if status == 'success':
-                    self.agent_states[team_id] = new_state
-                    return True
+        pending.update_error = self._handle_update_reply(pending, reply)
+        pending.phase = 'bid'
+        return False
+
+    def _new_call(self, team_id: str, phase: str, **fields) -> _PendingCall:
+        """Create the handle of a call about to start; the start-up allowance runs from now."""
+        now = time.monotonic()
+        return _PendingCall(team_id=team_id, start_time=now, phase=phase,
+                            deadline=now + self.startup_seconds, **fields)
+
+    def _run_calls(self, pending_calls: Dict[str, _PendingCall], handle_outcome):
+        """
+        Drive started calls to completion in parallel.
+
+        handle_outcome(pending, outcome, reply) is called for every reply
+        (outcome 'ok') and once for the failure that ends a call: 'error'
+        (the call could not be started or its reply was invalid, see
+        pending.error), 'startup_timeout', 'timeout' or 'died'. For replies
+        it returns True once the call expects no further reply.
+        """
+        active = {}
+        for team_id, pending in pending_calls.items():
+            if pending.error is not None:
+                handle_outcome(pending, 'error', None)
+                self._finish_call(pending)
+            else:
+                active[team_id] = pending
+
+        while active:
+            timeout = max(0.0, min(p.deadline for p in active.values()) - time.monotonic())
+            waitables = [p.channel for p in active.values()] + [p.process.sentinel for p in active.values()]
+            ready = mp.connection.wait(waitables, timeout=timeout)
+            now = time.monotonic()
+
+            for team_id, pending in list(active.items()):
+                outcome, reply = self._poll_call(pending, ready, now)
+                if outcome is None:
+                    continue
+
+                if outcome == 'ok':
+                    try:
+                        if not handle_outcome(pending, outcome, reply):
+                            continue
+                    except Exception as e:
+                        logger.error(f"Team {pending.team_id}: Invalid worker reply: {e}", exc_info=True)
+                        self._kill_call(pending)
+                        pending.error = f"Exception: {str(e)}"
+                        handle_outcome(pending, 'error', None)
                 else:
-                    logger.error(f"Team {team_id}: Error in update_after_each_round: {error}")
-                    return False
+                    handle_outcome(pending, outcome, None)
 
-            except Exception as e:
-                logger.error(f"Team {team_id}: Failed to get update result: {e}")
-                return False
+                self._finish_call(pending)
+                del active[team_id]
 
-        except Exception as e:
-            logger.error(f"Team {team_id}: Unexpected error in agent update: {e}", exc_info=True)
-            return False
+    def _poll_call(self, pending: _PendingCall, ready: list, now: float) -> Tuple[Optional[str], Any]:
+        """
+        Check one started call after mp.connection.wait returned.
+
+        The worker's started message (see _agent_started) moves the deadline
+        to the phase's time limit after the agent code started (see
+        _wall_timeout); a reply sets the deadline of a following phase to
+        its time limit from now
+        until that phase's started message arrives. A worker still running at the
+        deadline is killed (a persistent worker is respawned from the last
+        good state on the next call).
+
+        Returns:
+            (None, None) while the call is running, otherwise (outcome, reply)
+            with outcome 'ok', 'startup_timeout', 'timeout' or 'died'
+        """
+        if pending.channel in ready:
+            try:
+                message = recv_message(pending.channel)
+            except Exception:
+                self._kill_call(pending)
+                return 'died', None
+
+            if _is_started_message(message):
+                self._mark_agent_started(pending, message[1])
+                return None, None
+
+            pending.awaiting_start = True
+            pending.deadline = now + self._wall_timeout(pending.phase)
+            return 'ok', message
+
+        if pending.process.sentinel in ready:
+            self._kill_call(pending)
+            return 'died', None
+
+        if now >= pending.deadline:
+            self._kill_call(pending)
+            return ('startup_timeout' if pending.agent_start is None else 'timeout'), None
+
+        return None, None
+
+    def _mark_agent_started(self, pending: _PendingCall, started_at: float):
+        """
+        Start the agent's timeout for the current phase of a call.
+
+        Only the first started message of a phase counts: it is sent by the
+        worker before any agent code runs, so the agent cannot move its own
+        deadline.
+        """
+        if not pending.awaiting_start:
+            return
+        started_at = min(started_at, time.monotonic())
+        if pending.agent_start is None:
+            self._record_startup(pending.team_id, max(0.0, started_at - pending.start_time))
+        pending.awaiting_start = False
+        pending.agent_start = started_at
+        pending.deadline = started_at + self._wall_timeout(pending.phase)
+
+    def _agent_elapsed(self, pending: _PendingCall) -> float:
+        """Time since the agent code of the current phase started (0 if it never did)."""
+        if pending.agent_start is None:
+            return 0.0
+        return time.monotonic() - pending.agent_start
+
+    def _phase_seconds(self, phase: str) -> float:
+        """Time limit of a phase on the timeout clock (prepare has its own budget)."""
+        return self.prepare_seconds if phase == 'prepare' else self.timeout_seconds
+
+    def _wall_timeout(self, phase: str) -> float:
+        """Wall-clock time a phase may take before its worker is killed."""
+        if self.timeout_clock == TIMEOUT_CPU:
+            return self._phase_seconds(phase) * CPU_TIMEOUT_WALL_FACTOR
+        return self._phase_seconds(phase)
+
+    def _failed_agent_time(self, pending: _PendingCall, outcome: str) -> float:
+        """Execution time to report for a call that failed with the given outcome."""
+        if outcome == 'timeout':
+            return self._phase_seconds(pending.phase)
+        if outcome == 'died':
+            return self._agent_elapsed(pending)
+        return 0.0
+
+    def _call_error(self, pending: _PendingCall, outcome: str) -> str:
+        """Log a failed call phase and return its error message."""
+        team_id = pending.team_id
+        names = {'bid': ('Bid execution', 'a bid'),
+                 'plan': ('Bidding plan', 'a bidding plan'),
+                 'prepare': ('Prepare', 'a prepare result'),
+                 'update': ('Update', 'an update result')}
+        phase_name, result_name = names[pending.phase]
+
+        if outcome == 'error':
+            return pending.error
+        if outcome == 'startup_timeout':
+            logger.warning(f"Team {team_id}: Worker did not start within {self.startup_seconds}s")
+            return "Startup timeout"
+        if outcome == 'timeout':
+            logger.warning(f"Team {team_id}: {phase_name} timeout ({self._wall_timeout(pending.phase)}s)")
+            return "Timeout"
+        if outcome == 'cpu_timeout':
+            logger.warning(f"Team {team_id}: {phase_name} timeout "
+                           f"({self._phase_seconds(pending.phase)}s of CPU time)")
+            return "Timeout"
+        if outcome == 'memory':
+            logger.warning(f"Team {team_id}: {phase_name} exceeded the memory limit "
+                           f"({self.memory_limit_mb} MB)")
+            return "MemoryLimit"
+        logger.error(f"Team {team_id}: Worker exited without returning {result_name}")
+        return "No result returned"
+
+    def _kill_call(self, pending: _PendingCall):
+        """Kill the worker of a call that timed out, died or misbehaved."""
+        if self.isolation_mode == ISOLATION_PERSISTENT:
+            self._stop_worker(pending.team_id, force=True)
+        elif pending.process.is_alive():
+            pending.process.terminate()
+            pending.process.join(timeout=1.0)
+            if pending.process.is_alive():
+                pending.process.kill()  # Force kill if terminate didn't work
+
+    def _finish_call(self, pending: _PendingCall):
+        """Release the resources of a per-call worker."""
+        if self.isolation_mode == ISOLATION_PERSISTENT:
+            return
+        if pending.process is not None:
+            self._release_worker(pending.process, pending.channel)
+        elif pending.channel is not None:
+            pending.channel.close()
+
+    def shutdown(self):
+        """Stop all persistent worker and per-agent zygote processes and free shared memory."""
+        for team_id in list(self.workers.keys()):
+            self._stop_worker(team_id)
+        for team_id in list(self.agent_zygotes.keys()):
+            self._stop_agent_zygote(team_id)
+        for team_id in list(self.shared_valuations.keys()):
+            self._release_valuations(team_id)
+        for team_id in list(self.bid_slots.keys()):
+            self._release_bid_slot(team_id)
+        for team_id in list(self.prepared.keys()):
+            self._release_prepared(team_id)
+        for team_id in list(self.agent_code.keys()):
+            self._release_agent_code(team_id)
+
+    def _start_worker(self, team_id: str):
+        """
+        Start a persistent worker for a team, restoring its last good state.
+
+        Returns:
+            Tuple of (process, conn)
+        """
+        process, parent_conn = self._launch_worker(
+            team_id,
+            _worker_agent_loop,
+            self._worker_args(team_id) + (self.agent_states.get(team_id),
+                                          self._worker_bid_slot(team_id)),
+            duplex=True
+        )
+
+        self.workers[team_id] = (process, parent_conn)
+        return process, parent_conn
+
+    def _worker_args(self, team_id: str) -> tuple:
+        """Leading arguments of every worker target, up to and including the prepared value."""
+        metadata = self.agent_metadata[team_id]
+        return (
+            self.agent_code[team_id],
+            metadata['team_id'],
+            self._worker_valuations(team_id),
+            metadata['budget'],
+            metadata['opponent_teams'],
+            self._worker_limits(),
+            self.prepared.get(team_id)
+        )
+
+    def _worker_limits(self) -> Dict[str, Any]:
+        """Resource limits the worker applies to agent code (see _agent_started)."""
+        return {'timeout_seconds': self.timeout_seconds,
+                'cpu_seconds': self.timeout_seconds if self.timeout_clock == TIMEOUT_CPU else None,
+                'prepare_seconds': self.prepare_seconds,
+                'memory_mb': self.memory_limit_mb}
+
+    def _launch_worker(self, team_id: str, target, args: tuple,
+                       duplex: bool = False) -> Tuple[Any, Any]:
+        """
+        Start an isolated worker running target(*args, conn).
+
+        Args:
+            team_id: Team whose agent the worker runs
+            target: Module-level worker function
+            args: Arguments before the worker's pipe end
+            duplex: Two-way pipe (persistent workers) instead of a result pipe
+
+        Returns:
+            Tuple of (process, conn) where conn is this side of the pipe
+        """
+        fds = tuple(shared.fd for shared in (self.agent_code.get(team_id),
+                                              self.shared_valuations.get(team_id),
+                                              self.bid_slots.get(team_id),
+                                              self.prepared.get(team_id))
+                    if isinstance(shared, (AgentCode, SharedValuations, PostedBidSlot, SharedPrepared))
+                    and shared.fd is not None)
+
+        parent_conn, child_conn = mp.Pipe(duplex=duplex)
+        try:
+            if self.start_method == START_AGENT_ZYGOTE:
+                process = self._fork_from_agent_zygote(team_id, target, args, child_conn, fds)
+            else:
+                process = launch_worker(self.start_method, target, args, child_conn,
+                                        WORKER_PRELOAD, fds)
+        except Exception:
+            parent_conn.close()
+            raise
         finally:
+            child_conn.close()
+        return process, parent_conn
+
+    def _fork_from_agent_zygote(self, team_id: str, target, args: tuple, channel,
+                                fds: tuple = ()):
+        """Fork a worker from the team's zygote, (re)starting the zygote on demand."""
+        zygote = self.agent_zygotes.get(team_id)
+        if zygote is not None and zygote.is_usable():
+            try:
+                return zygote.fork(target, args, channel, fds)
+            except (EOFError, OSError):
+                logger.warning(f"Team {team_id}: Agent zygote lost, restarting it")
+
+        self._stop_agent_zygote(team_id)
+        agent_code = self.agent_code[team_id]
+        zygote = SpecializedZygote(_preload_agent_class,
+                                   (agent_code, team_id, self._worker_limits()),
+                                   WORKER_PRELOAD,
+                                   () if agent_code.fd is None else (agent_code.fd,))
+        self.agent_zygotes[team_id] = zygote
+        return zygote.fork(target, args, channel, fds)
+
+    def _worker_valuations(self, team_id: str):
+        """
+        Valuations argument for a team's workers.
+
+        Returns the team's SharedValuations block, created on first use, or
+        the plain dict if shared memory is disabled or unavailable.
+        """
+        valuation_vector = self.agent_metadata[team_id]['valuation_vector']
+        if not SHARED_VALUATIONS:
+            return valuation_vector
+
+        shared = self.shared_valuations.get(team_id)
+        if shared is None:
+            try:
+                shared = SharedValuations.create(valuation_vector)
+            except OSError as e:
+                logger.debug(f"Team {team_id}: Shared valuations unavailable ({e})")
+                return valuation_vector
+            self.shared_valuations[team_id] = shared
+        return shared
+
+    def _worker_bid_slot(self, team_id: str) -> Optional[PostedBidSlot]:
+        """
+        Posted bid argument for a team's workers, created on first use.
+
+        Returns None if memory files are unavailable; post_bid is then a no-op.
+        """
+        slot = self.bid_slots.get(team_id)
+        if slot is None:
+            try:
+                slot = PostedBidSlot.create()
+            except OSError as e:
+                logger.debug(f"Team {team_id}: Posted bids unavailable ({e})")
+                return None
+            self.bid_slots[team_id] = slot
+        return slot
+
+    def _clear_posted_bid(self, team_id: str) -> Optional[PostedBidSlot]:
+        """Forget a team's posted bid before a new bid call and return its slot."""
+        slot = self._worker_bid_slot(team_id)
+        if slot is not None:
+            slot.clear()
+        return slot
+
+    def _release_bid_slot(self, team_id: str):
+        """Free a team's posted bid slot, if any."""
+        slot = self.bid_slots.pop(team_id, None)
+        if slot is not None:
+            slot.close()
+
+    def _store_prepared(self, team_id: str, prepared: bytes):
+        """
+        Keep a team's encoded prepare() result for its later calls.
+
+        The result is written once into a SharedPrepared block that workers
+        read through a descriptor; without memory files the encoded value
+        itself is passed to every call.
+        """
+        self._release_prepared(team_id)
+        try:
+            self.prepared[team_id] = SharedPrepared.create(prepared)
+        except OSError as e:
+            logger.debug(f"Team {team_id}: Shared prepared result unavailable ({e})")
+            self.prepared[team_id] = prepared
+
+    def _release_agent_code(self, team_id: str):
+        """Free a team's compiled code block, if any."""
+        agent_code = self.agent_code.pop(team_id, None)
+        if agent_code is not None:
+            agent_code.close()
+
+    def _release_prepared(self, team_id: str):
+        """Forget a team's prepare() result, freeing its block, if any."""
+        prepared = self.prepared.pop(team_id, None)
+        if isinstance(prepared, SharedPrepared):
+            prepared.close()
+
+    def _release_valuations(self, team_id: str):
+        """Free a team's shared valuations block, if any."""
+        shared = self.shared_valuations.pop(team_id, None)
+        if shared is not None:
+            shared.close()
+
+    def _stop_agent_zygote(self, team_id: str):
+        """Stop a team's per-agent zygote, if any."""
+        zygote = self.agent_zygotes.pop(team_id, None)
+        if zygote is not None:
+            zygote.close()
+
+    def _release_worker(self, process, conn):
+        """Reap a finished per-call worker and close its pipe."""
+        process.join(timeout=1.0)
+        if process.is_alive():
+            process.kill()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _stop_worker(self, team_id: str, force: bool = False):
+        """
+        Stop a team's persistent worker, if any.
+
+        Args:
+            team_id: Team identifier
+            force: Kill immediately instead of asking the worker to exit
+        """
+        worker = self.workers.pop(team_id, None)
+        if worker is None:
+            return
+
+        process, conn = worker
+        if not force:
             try:
-                result_queue.close()
-            except:
+                send_message(conn, ('stop',))
+            except Exception:
                 pass
+            process.join(timeout=1.0)
+
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()  # Force kill if terminate didn't work
+                process.join(timeout=1.0)
+
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _send_to_worker(self, team_id: str, request: tuple) -> bool:
+        """
+        Send a request to a team's persistent worker, (re)starting it on demand.
+
+        Returns:
+            True if the request was sent, False if the worker is unusable
+        """
+        worker = self.workers.get(team_id)
+        if worker is None or not worker[0].is_alive():
+            self._stop_worker(team_id, force=True)
+            worker = self._start_worker(team_id)
+            self._record_call(team_id, self.agent_states.get(team_id))
+        else:
+            self._record_call(team_id, None)
+
+        try:
+            send_message(worker[1], request)
+            return True
+        except Exception:
+            self._stop_worker(team_id, force=True)
+            return False
+
+    def _handle_bid_reply(self, pending: _PendingCall, reply: tuple) -> Tuple[float, float, Optional[str]]:
+        """
+        Turn a worker's bid reply into (bid_amount, execution_time, error_msg).
+
+        On success the agent state for the next round is stored.
+        """
+        team_id = pending.team_id
+        status, bid, timing, state_delta, error = reply
+
+        if status == 'success':
+            # Update agent state for next round
+            self._apply_reply_delta(team_id, state_delta)
+            exec_time = self._record_agent_time(team_id, 'bid', timing)
+            # Round bid to 2 decimal places
+            rounded_bid = round(float(bid), 2)
+            logger.debug(f"Team {team_id}: Bid {rounded_bid:.2f} in {exec_time:.3f}s")
+            return rounded_bid, exec_time, None
+
+        self._record_peak_rss(team_id, timing)
+        if status == 'timeout':
+            return self._bid_timeout_result(pending, self._call_error(pending, 'cpu_timeout'))
+        if status == 'memory':
+            return 0.0, self._agent_elapsed(pending), self._call_error(pending, 'memory')
+
+        logger.error(f"Team {team_id}: Bid execution error: {error}")
+        return 0.0, self._agent_elapsed(pending), f"Error: {error}"
+
+    def _handle_update_reply(self, pending: _PendingCall, reply: tuple) -> Optional[str]:
+        """
+        Apply a worker's update reply.
+
+        Returns:
+            None on success, otherwise the error message
+        """
+        team_id = pending.team_id
+        status, state_delta, timing, error = reply
+        self._record_peak_rss(team_id, timing)
+
+        if status == 'success':
+            self._apply_reply_delta(team_id, state_delta)
+            return None
+
+        if status == 'timeout':
+            return self._call_error(pending, 'cpu_timeout')
+        if status == 'memory':
+            return self._call_error(pending, 'memory')
+
+        logger.error(f"Team {team_id}: Error in update_after_each_round: {error}")
+        return f"Error: {error}"
+
+    def _track_round_result(self, team_id: str, item_id: str, winning_team: str,
+                            price_paid: float):
+        """Apply a round result to the budget and items_won of a stateless agent."""
+        if winning_team == team_id:
+            tracked = self.tracked_state[team_id]
+            tracked['budget'] -= price_paid
+            tracked['items_won'].append(item_id)
+
+    def _record_startup(self, team_id: str, seconds: float):
+        """Count the start-up time of a call (until its agent code started)."""
+        stats = self.execution_stats[team_id]
+        stats['startups'] += 1
+        stats['startup_time'] += seconds
+        stats['max_startup_time'] = max(stats['max_startup_time'], seconds)
+
+    def _record_agent_time(self, team_id: str, phase: str, timing: Dict[str, float]) -> float:
+        """
+        Count the worker-measured time and resource usage of a bid, plan or prepare call.
+
+        Returns:
+            The call's execution time on the timeout clock (wall or CPU seconds)
+        """
+        usage = {key: float(timing[key]) for key in ('wall', 'cpu', 'utime', 'stime')}
+        usage['max_rss_kb'] = int(timing['max_rss_kb'])
+        self.call_usage[team_id].append(dict(usage, phase=phase))
+
+        stats = self.execution_stats[team_id]
+        stats['agent_calls'] += 1
+        stats['agent_time'] += usage['wall']
+        stats['cpu_time'] += usage['cpu']
+        stats['user_time'] += usage['utime']
+        stats['system_time'] += usage['stime']
+        self._record_peak_rss(team_id, timing)
+        return usage['cpu'] if self.timeout_clock == TIMEOUT_CPU else usage['wall']
+
+    def _record_peak_rss(self, team_id: str, timing: Dict[str, float]):
+        """Keep the highest peak RSS (kB) reported by any of a team's workers."""
+        stats = self.execution_stats[team_id]
+        stats['max_rss_kb'] = max(stats['max_rss_kb'], int(timing['max_rss_kb']))
+
+    def _record_call(self, team_id: str, sent_state: Optional[Dict]):
+        """Count a worker call and the encoded state shipped with it."""
+        stats = self.transfer_stats[team_id]
+        stats['calls'] += 1
+        if sent_state is not None:
+            stats['bytes_sent'] += sum(len(encoded) for encoded in sent_state.values())
+
+    def _apply_reply_delta(self, team_id: str, state_delta: Tuple[Dict, list]):
+        """Merge a worker's state delta into the stored state and count its size."""
+        new_state = _apply_state_delta(self.agent_states[team_id], state_delta)
+        self.agent_states[team_id] = new_state
+
+        stats = self.transfer_stats[team_id]
+        stats['bytes_received'] += sum(len(encoded) for encoded in state_delta[0].values())
+        # What replying with the full state would have cost
+        stats['full_state_bytes'] += sum(len(encoded) for encoded in new_state.values())
+
+    def get_agent_state(self, team_id: str) -> Optional[Dict]:
+        """
+        Decode a team's stored agent state.
+
+        Unpickles agent-produced data in this process; meant for tests and
+        debugging, not for the game loop.
+
+        Returns:
+            Dictionary of attribute values, or None if the agent has no state yet
+        """
+        agent_state = self.agent_states.get(team_id)
+        if agent_state is None:
+            return None
+        return {key: _decode_state_value(encoded) for key, encoded in agent_state.items()}
+
+    def get_transfer_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        State transfer metrics per team.
+
+        Returns:
+            Dictionary mapping team_id to the raw counters (calls, bytes_sent,
+            bytes_received, full_state_bytes) plus bytes_per_call, the state
+            bytes moved in both directions per worker call
+        """
+        metrics = {}
+        for team_id, stats in self.transfer_stats.items():
+            moved = stats['bytes_sent'] + stats['bytes_received']
+            metrics[team_id] = dict(stats, bytes_per_call=moved / stats['calls'] if stats['calls'] else 0.0)
+        return metrics
+
+    def get_call_usage(self, team_id: str) -> List[Dict[str, Any]]:
+        """
+        Resource usage of a team's bid, plan and prepare calls, in call order.
+
+        Returns:
+            List of dicts with phase ('bid', 'plan' or 'prepare'), wall and
+            cpu seconds, utime and stime (user and system CPU seconds of the
+            worker during the call) and max_rss_kb (the worker's peak
+            resident set size)
+        """
+        return [dict(usage) for usage in self.call_usage.get(team_id, [])]
+
+    def get_execution_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Agent and start-up time metrics per team.
+
+        Returns:
+            Dictionary mapping team_id to the raw counters (agent_calls,
+            agent_time, cpu_time, user_time and system_time of bids, plans
+            and prepare calls, max_rss_kb of their workers, startups,
+            startup_time,
+            max_startup_time) plus mean_agent_time and mean_startup_time
+        """
+        metrics = {}
+        for team_id, stats in self.execution_stats.items():
+            metrics[team_id] = dict(
+                stats,
+                mean_agent_time=stats['agent_time'] / stats['agent_calls'] if stats['agent_calls'] else 0.0,
+                mean_startup_time=stats['startup_time'] / stats['startups'] if stats['startups'] else 0.0
+            )
+        return metrics
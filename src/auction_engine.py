@@ -25,9 +25,15 @@ class AuctionEngine:
     4. Handle ties randomly
     """
     
-    def __init__(self):
-        """Initialize auction engine"""
-        pass
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Initialize auction engine.
+        
+        Args:
+            rng: Optional default random stream for tie-breaking
+                 (default: a fresh unseeded Generator)
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
     
     def validate_bid(self, bid: float, budget: float, team_id: str) -> Tuple[float, bool]:
         """
@@ -56,12 +62,14 @@ class AuctionEngine:
         # Round bid to 2 decimal places
         return round(float(bid), 2), False
     
-    def determine_winner(self, bids: Dict[str, float]) -> Tuple[str, float, List[str]]:
+    def determine_winner(self, bids: Dict[str, float],
+                         rng: np.random.Generator = None) -> Tuple[str, float, List[str]]:
         """
         Determine auction winner and price using second-price mechanism.
         
         Args:
             bids: Dictionary mapping team_id to bid amount
+            rng: Optional random stream for tie-breaking (default: self.rng)
         
         Returns:
             Tuple of (winner_id, price_paid, tied_teams)
@@ -71,46 +79,111 @@ class AuctionEngine:
         if not bids:
             return None, 0.0, []
         
-        # Filter out zero or negative bids
-        valid_bids = {team_id: bid for team_id, bid in bids.items() if bid > 0}
+        # Single pass over the bids: track the highest bid, the teams tied at
+        # it (in bid order) and the runner-up bid, ignoring zero or negative bids
+        highest_bid = 0.0
+        second_bid = 0.0
+        highest_bidders = []
+        num_valid = 0
         
-        if not valid_bids:
+        for team_id, bid in bids.items():
+            if bid <= 0:
+                continue
+            num_valid += 1
+            if bid > highest_bid:
+                second_bid = highest_bid
+                highest_bid = bid
+                highest_bidders = [team_id]
+            elif bid == highest_bid:
+                highest_bidders.append(team_id)
+            elif bid > second_bid:
+                second_bid = bid
+        
+        if num_valid == 0:
             logger.info("No valid bids in this round")
             return None, 0.0, []
         
-        # Sort bids in descending order
-        sorted_bids = sorted(valid_bids.items(), key=lambda x: x[1], reverse=True)
-        
-        # Get highest bid(s) - may have ties
-        highest_bid = sorted_bids[0][1]
-        highest_bidders = [team_id for team_id, bid in sorted_bids if bid == highest_bid]
-        
         # Handle ties with random selection
         if len(highest_bidders) > 1:
-            winner_id = np.random.choice(highest_bidders)
+            winner_id = (rng if rng is not None else self.rng).choice(highest_bidders)
             logger.info(f"Tie broken randomly among {highest_bidders}, winner: {winner_id}")
         else:
             winner_id = highest_bidders[0]
         
         # Calculate second-price
-        if len(sorted_bids) == 1:
+        if num_valid == 1:
             # Only one bidder - pays 0 (or minimum bid if we want to set one)
             price_paid = 0.0
             logger.info(f"Single bidder {winner_id}, pays 0")
+        elif len(highest_bidders) > 1:
+            # If there's a tie for highest, winner pays the tied amount
+            price_paid = highest_bid
         else:
-            # Second-highest bid (or highest if tied)
-            if len(highest_bidders) > 1:
-                # If there's a tie for highest, winner pays the tied amount
-                price_paid = highest_bid
-            else:
-                # Winner pays second-highest bid
-                price_paid = sorted_bids[1][1]
+            # Winner pays second-highest bid
+            price_paid = second_bid
         
         return winner_id, price_paid, highest_bidders if len(highest_bidders) > 1 else []
     
+    def determine_winners_batch(self, bid_matrix: np.ndarray,
+                                rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Determine winners and prices for many auctions at once.
+        
+        Applies the same rules as determine_winner to every row: zero or
+        negative bids are ignored, ties for the highest bid are broken
+        uniformly at random and the winner pays the second-highest bid
+        (the tied amount on a tie, 0 for a single bidder).
+        
+        Args:
+            bid_matrix: Array of shape (n_auctions, n_bidders)
+            rng: Random stream for tie-breaking (default: self.rng); only
+                 auctions with a tie draw from it
+        
+        Returns:
+            Tuple of (winners, prices, ties)
+            - winners: int array of bidder indices, -1 where there were no valid bids
+            - prices: float array of prices paid
+            - ties: bool array, True where the highest bid was tied
+        """
+        rng = rng if rng is not None else self.rng
+        bids = np.asarray(bid_matrix, dtype=float)
+        if bids.ndim != 2:
+            raise ValueError(f"bid_matrix must be 2-D (auctions x bidders), got shape {bids.shape}")
+        
+        n_auctions, n_bidders = bids.shape
+        if n_bidders == 0:
+            return (np.full(n_auctions, -1), np.zeros(n_auctions), np.zeros(n_auctions, dtype=bool))
+        
+        valid = bids > 0
+        masked = np.where(valid, bids, -np.inf)
+        
+        # Top two bids per auction without a full sort
+        if n_bidders > 1:
+            top_two = np.partition(masked, n_bidders - 2, axis=1)[:, -2:]
+            second, highest = top_two[:, 0], top_two[:, 1]
+        else:
+            highest = masked[:, 0]
+            second = np.full(n_auctions, -np.inf)
+        
+        is_top = valid & (masked == highest[:, None])
+        ties = is_top.sum(axis=1) > 1
+        has_bid = valid.any(axis=1)
+        
+        # Pick the winner among the top bidders; tied rows get random keys
+        keys = is_top.astype(float)
+        if ties.any():
+            keys[ties] = np.where(is_top[ties], rng.random((int(ties.sum()), n_bidders)), -1.0)
+        winners = np.where(has_bid, np.argmax(keys, axis=1), -1)
+        
+        # Second price is the runner-up bid (equal to the highest on a tie)
+        prices = np.where(np.isfinite(second), second, 0.0)
+        
+        return winners, prices, ties
+    
     def execute_round(self, round_number: int, item_id: str, 
                      bids: Dict[str, float], budgets: Dict[str, float],
-                     execution_times: Dict[str, float]) -> AuctionRoundResult:
+                     execution_times: Dict[str, float],
+                     rng: np.random.Generator = None) -> AuctionRoundResult:
         """
         Execute a complete auction round.
         
@@ -120,6 +193,7 @@ class AuctionEngine:
             bids: Dictionary mapping team_id to bid amount
             budgets: Dictionary mapping team_id to available budget
             execution_times: Dictionary mapping team_id to bid execution time
+            rng: Optional per-round random stream for tie-breaking
         
         Returns:
             AuctionRoundResult with complete round information
@@ -143,7 +217,7 @@ class AuctionEngine:
             logger.warning(f"Teams with capped bids: {capped_teams}")
         
         # Determine winner and price
-        winner_id, price_paid, tied_teams = self.determine_winner(validated_bids)
+        winner_id, price_paid, tied_teams = self.determine_winner(validated_bids, rng)
         
         if winner_id:
             logger.info(f"Winner: {winner_id}, Price: {price_paid:.2f}")
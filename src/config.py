@@ -25,6 +25,48 @@ ARENA_SIZE = 5
 BID_TIMEOUT_SECONDS = 2.0
 MEMORY_LIMIT_MB = 256
 
+# Allowance for starting an agent worker (process start, loading the agent
+# module) before the agent's own BID_TIMEOUT_SECONDS start counting
+SANDBOX_STARTUP_SECONDS = 10.0
+
+# Clock BID_TIMEOUT_SECONDS is measured on: "wall" (elapsed time) or "cpu"
+# (CPU seconds used by the agent, so outcomes do not depend on how busy the
+# host is)
+BID_TIMEOUT_CLOCK = "wall"
+
+# Time limit of an agent's optional prepare() hook, run once per game before
+# the first round (same clock as BID_TIMEOUT_SECONDS)
+PREPARE_TIMEOUT_SECONDS = 10.0
+
+# With the "cpu" clock, an agent that stops using CPU (sleeping, blocked) is
+# still stopped after this multiple of BID_TIMEOUT_SECONDS in wall-clock time
+CPU_TIMEOUT_WALL_FACTOR = 5.0
+
+# Agent isolation mode: "per_call" (fresh process per call) or
+# "persistent" (one long-lived worker process per agent per game)
+AGENT_ISOLATION_MODE = "per_call"
+
+# How isolated agent workers are started: "zygote" (fork from a shared
+# pre-warmed process that holds no tournament state) or "fork" (fork the
+# game process directly). Both start a worker in a few milliseconds;
+# "zygote" is the default because a forked copy of the game process still
+# holds every team's valuations, states and prepare() results in memory,
+# where an agent can read them
+AGENT_WORKER_START = "zygote"
+
+# Modules imported once into the zygote so workers start warm
+WORKER_PRELOAD_MODULES = ["numpy", "math", "collections"]
+
+# Hand valuations to workers through a read-only shared memory block (one per
+# team per game) instead of pickling the dict into every call
+SHARED_VALUATIONS = True
+
+# Number of Stage 1 arenas run in parallel worker processes (1 = serial)
+TOURNAMENT_JOBS = 1
+
+# Number of games within one arena run in parallel worker processes (1 = serial)
+ARENA_GAME_JOBS = 1
+
 # Bid Precision
 BID_DECIMAL_PLACES = 2  # Bids rounded to 2 decimal places
 
@@ -7,6 +7,7 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Tuple
 import copy
+import numpy as np
 
 from src.config import T_AUCTION_ROUNDS, INITIAL_BUDGET
 from src.valuation_generator import ValuationGenerator
@@ -27,15 +28,26 @@ class GameManager:
     2. Select and shuffle auction sequence
     3. Initialize all agents
     4. Execute T sequential auction rounds
-    5. Update agents after each round
+    5. Update agents after each round (delivered together with the next
+       bid request, the final round's result at the end of the game)
     6. Calculate final results
+    
+    Teams whose budget is exhausted are not called any more: any bid would
+    be capped to 0, so they bid 0 with zero execution time, and their
+    round results are delivered in one batch at the end of the game.
+    
+    Agents that define bidding_plan are asked once, before the first round,
+    for a bid on every item; they then bid from that plan without further
+    calls and likewise receive their round results at the end of the game.
+    An agent whose plan fails (or returns None) is called every round.
     """
     
     def __init__(self, stage: int, arena_id: str, game_number: int,
                  valuation_generator: ValuationGenerator,
                  auction_engine: AuctionEngine,
                  agent_manager: AgentManager,
-                 fixed_valuations: Dict = None):
+                 fixed_valuations: Dict = None,
+                 rng: np.random.Generator = None):
         """
         Initialize game manager.
         
@@ -47,6 +59,8 @@ class GameManager:
             auction_engine: Auction engine instance
             agent_manager: Agent manager instance
             fixed_valuations: Optional pre-generated valuations to use for all games in arena
+            rng: Optional random stream for the auction sequence
+                 (default: the game's stream derived by the valuation generator)
         """
         self.stage = stage
         self.arena_id = arena_id
@@ -57,6 +71,7 @@ class GameManager:
         self.auction_engine = auction_engine
         self.agent_manager = agent_manager
         self.fixed_valuations = fixed_valuations  # Store fixed valuations if provided
+        self.rng = rng if rng is not None else valuation_generator.game_rng(stage, arena_id, game_number)
         
         self.agents = {}
         self.budgets = {}
@@ -64,6 +79,11 @@ class GameManager:
         self.items_won = {}
         self.auction_log = []
         self.auction_sequence = []
+        self.pending_round_result = None  # Round result not yet delivered to agents
+        self.deferred_updates = {}        # team_id -> round results held back from an exhausted or planned team
+        self.bidding_plans = {}           # team_id -> {item_id: bid} for teams bidding from a plan
+        self.plan_results = {}            # team_id -> (execution_time, error) of the bidding plan call
+        self.prepare_results = {}         # team_id -> (execution_time, error) of the prepare() call
     
     def initialize_game(self, team_agents: Dict[str, str]) -> bool:
         """
@@ -85,12 +105,17 @@ class GameManager:
                 self.valuations = self.fixed_valuations
                 logger.info(f"Using fixed valuations for {len(team_ids)} teams")
             else:
-                self.valuations, item_categories = self.valuation_generator.generate_arena_valuations(team_ids)
+                self.valuations, item_categories = self.valuation_generator.generate_arena_valuations(
+                    team_ids,
+                    rng=self.valuation_generator.derive_rng('valuations', self.stage, self.arena_id, self.game_number)
+                )
                 logger.info(f"Generated valuations for {len(team_ids)} teams")
                 logger.debug(f"Item categories: High={item_categories[0]}, Low={item_categories[1]}, Mixed={item_categories[2]}")
             
             # Generate auction sequence
-            self.auction_sequence = self.valuation_generator.get_random_auction_sequence(T_AUCTION_ROUNDS)
+            self.auction_sequence = self.valuation_generator.get_random_auction_sequence(
+                T_AUCTION_ROUNDS, rng=self.rng
+            )
             logger.info(f"Auction sequence: {self.auction_sequence}")
             
             # Initialize budgets and items_won tracking
@@ -137,29 +162,82 @@ class GameManager:
         """
         logger.info(f"=== Round {round_number}/{T_AUCTION_ROUNDS}: Item {item_id} ===")
         
-        # Collect bids from all agents
+        # Collect bids from all agents in parallel behind a single round deadline
         bids = {}
         execution_times = {}
         
+        previous_round = self.pending_round_result
+        bid_errors = {}
+        
+        # Budgets never grow, so an exhausted team stays exhausted for the rest of the game
+        active_agents = {}
         for team_id, agent in self.agents.items():
-            bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, item_id)
+            if self.is_budget_exhausted(team_id) or team_id in self.bidding_plans:
+                if self.is_budget_exhausted(team_id):
+                    bids[team_id] = 0.0
+                else:
+                    bids[team_id] = self.bidding_plans[team_id][item_id]
+                execution_times[team_id] = 0.0
+                if previous_round is not None:
+                    self.deferred_updates.setdefault(team_id, []).append(previous_round)
+            else:
+                active_agents[team_id] = agent
+        
+        if previous_round is None:
+            bid_results = {
+                team_id: result + (None,)
+                for team_id, result in self.agent_manager.execute_bids_concurrently(active_agents, item_id).items()
+            }
+        else:
+            # Deliver the previous round's result and request this bid in one call per agent
+            bid_results = self.agent_manager.execute_updates_and_bids_concurrently(
+                active_agents,
+                previous_round.item_id,
+                previous_round.winner_id if previous_round.winner_id else "",
+                previous_round.price_paid,
+                item_id
+            )
+            self.pending_round_result = None
+        
+        for team_id, (bid, exec_time, error, update_error) in bid_results.items():
             bids[team_id] = bid
             execution_times[team_id] = exec_time
             
+            if update_error:
+                logger.warning(f"Team {team_id} update error (round {previous_round.round_number}): {update_error}")
+                previous_round.agent_errors.setdefault(team_id, {})['update'] = update_error
+            
             if error:
                 logger.warning(f"Team {team_id} bid error: {error}")
+                bid_errors[team_id] = error
             
             logger.debug(f"Team {team_id}: Bid={bid:.2f}, Budget={self.budgets[team_id]:.2f}, Time={exec_time:.3f}s")
         
+        # The bidding plan call counts towards the first round
+        if previous_round is None:
+            for team_id, (plan_time, _) in self.plan_results.items():
+                execution_times[team_id] += plan_time
+        
         # Execute auction
         round_result = self.auction_engine.execute_round(
             round_number=round_number,
             item_id=item_id,
-            bids=bids,
+            bids={team_id: bids[team_id] for team_id in self.agents},
             budgets=self.budgets,
-            execution_times=execution_times
+            execution_times={team_id: execution_times[team_id] for team_id in self.agents},
+            rng=self.valuation_generator.round_rng(self.stage, self.arena_id, self.game_number, round_number)
         )
         
+        for team_id, error in bid_errors.items():
+            round_result.agent_errors.setdefault(team_id, {})['bid'] = error
+        if previous_round is None:
+            for team_id, (_, plan_error) in self.plan_results.items():
+                if plan_error:
+                    round_result.agent_errors.setdefault(team_id, {})['plan'] = plan_error
+            for team_id, (_, prepare_error) in self.prepare_results.items():
+                if prepare_error:
+                    round_result.agent_errors.setdefault(team_id, {})['prepare'] = prepare_error
+        
         # Update game state
         if round_result.winner_id:
             winner_id = round_result.winner_id
@@ -175,14 +253,81 @@ class GameManager:
         else:
             logger.info("No winner this round")
         
-        # Update all agents with round results
-        for team_id, agent in self.agents.items():
-            winner = round_result.winner_id if round_result.winner_id else ""
-            price = round_result.price_paid
-            self.agent_manager.update_agent_after_round(agent, item_id, winner, price)
+        # Agents receive this round's result together with the next bid request
+        self.pending_round_result = round_result
         
         return round_result
     
+    def prepare_agents(self):
+        """
+        Run the prepare() hook of agents that define it, once per game.
+        
+        It has its own time limit (PREPARE_TIMEOUT_SECONDS) and does not
+        count towards any round's execution time.
+        """
+        self.prepare_results = self.agent_manager.prepare_agents(self.agents)
+        for team_id, (exec_time, error) in self.prepare_results.items():
+            if error:
+                logger.warning(f"Team {team_id} prepare error: {error}")
+            else:
+                logger.info(f"Team {team_id} prepared in {exec_time:.3f}s")
+    
+    def request_bidding_plans(self):
+        """
+        Ask agents that define bidding_plan for their bids on every item.
+        
+        Agents only learn the item set (their valuation vector), never the
+        auction sequence, so a plan holds no more information than a
+        per-round bid would.
+        """
+        remaining_items = sorted({item_id for valuations in self.valuations.values() for item_id in valuations})
+        
+        plans = self.agent_manager.request_bidding_plans(self.agents, remaining_items)
+        for team_id, (plan, exec_time, error) in plans.items():
+            self.plan_results[team_id] = (exec_time, error)
+            if plan is not None:
+                self.bidding_plans[team_id] = plan
+            elif error:
+                logger.warning(f"Team {team_id} bidding plan error: {error}")
+        logger.info(f"Teams bidding from a plan: {sorted(self.bidding_plans)}")
+    
+    def is_budget_exhausted(self, team_id: str) -> bool:
+        """True if every bid of the team would be capped to 0 (see AuctionEngine.validate_bid)."""
+        return round(self.budgets[team_id], 2) <= 0
+    
+    def deliver_pending_round_result(self):
+        """
+        Update all agents with the round results not yet delivered.
+        
+        Called after the final round, whose result has no following bid
+        request to travel with. Teams with deferred results (exhausted
+        budget or bidding plan) get all of them, in order, in a single call;
+        the calls of all teams run in parallel.
+        """
+        round_result = self.pending_round_result
+        self.pending_round_result = None
+        
+        round_results = {}
+        for team_id in self.agents:
+            round_results[team_id] = self.deferred_updates.pop(team_id, [])
+            if round_result is not None:
+                round_results[team_id].append(round_result)
+        
+        # All agents are updated in parallel behind a single deadline
+        agents = {team_id: agent for team_id, agent in self.agents.items() if round_results[team_id]}
+        all_errors = self.agent_manager.update_agents_after_rounds(agents, {
+            team_id: [
+                (result.item_id, result.winner_id if result.winner_id else "", result.price_paid)
+                for result in round_results[team_id]
+            ]
+            for team_id in agents
+        })
+        
+        for team_id, errors in all_errors.items():
+            for result, error in zip(round_results[team_id], errors):
+                if error:
+                    result.agent_errors.setdefault(team_id, {})['update'] = error
+    
     def run_game(self, team_agents: Dict[str, str]) -> GameResult:
         """
         Run a complete game.
@@ -202,10 +347,17 @@ class GameManager:
             raise Exception("Game initialization failed")
         
         # Execute all auction rounds
-        for round_number in range(1, T_AUCTION_ROUNDS + 1):
-            item_id = self.auction_sequence[round_number - 1]
-            round_result = self.execute_auction_round(round_number, item_id)
-            self.auction_log.append(round_result)
+        try:
+            self.prepare_agents()
+            self.request_bidding_plans()
+            for round_number in range(1, T_AUCTION_ROUNDS + 1):
+                item_id = self.auction_sequence[round_number - 1]
+                round_result = self.execute_auction_round(round_number, item_id)
+                self.auction_log.append(round_result)
+            self.deliver_pending_round_result()
+        finally:
+            # Release any persistent agent workers held for this game
+            self.agent_manager.shutdown()
         
         # Calculate final results
         team_results = self._calculate_final_results()
@@ -0,0 +1,53 @@
+"""
+Message protocol for AGT Competition agent worker pipes
+
+Every message (bid/update requests, replies with state deltas) is a single
+length-prefixed frame on a multiprocessing Connection: the 4-byte length
+header of Connection.send_bytes followed by one protocol-5 pickle of plain
+data (tuples, lists, dicts, str, bytes, numbers). The message is pickled
+exactly once, with no Queue, feeder thread or lock in between.
+
+Replies come from agent-controlled processes, so the game process unpickles
+them without resolving any global (class or function): a reply can only
+ever produce plain data.
+"""
+
+import io
+import pickle
+from typing import Any
+
+
+# Largest frame accepted from a worker; larger messages fail the call
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """Unpickler that refuses to load classes or functions."""
+
+    def find_class(self, module: str, name: str):
+        raise pickle.UnpicklingError(f"Global '{module}.{name}' not allowed in worker messages")
+
+
+def send_message(conn, message: Any):
+    """Send one message as a single frame."""
+    conn.send_bytes(pickle.dumps(message, protocol=5))
+
+
+def recv_message(conn, trusted: bool = False) -> Any:
+    """
+    Receive one message.
+
+    Args:
+        conn: Connection to read from
+        trusted: The sender is the game process (workers reading requests);
+                 otherwise only plain data is accepted
+
+    Raises:
+        EOFError: If the other end closed the connection
+        OSError: If the frame is larger than MAX_MESSAGE_BYTES
+        pickle.UnpicklingError: If an untrusted message references a global
+    """
+    frame = conn.recv_bytes(MAX_MESSAGE_BYTES)
+    if trusted:
+        return pickle.loads(frame)
+    return _PlainDataUnpickler(io.BytesIO(frame)).load()
@@ -0,0 +1,71 @@
+"""
+Posted bids for AGT Competition anytime agents
+Lets an agent's worker publish a provisional bid that survives a timeout
+
+Each team gets one small memory file (memfd) holding a flag and the latest
+posted bid. Workers write it through a descriptor that AgentManager passes
+to that team's workers only; the game process reads it back when a bid
+phase runs out of time. Both sides use pread/pwrite rather than a mapping,
+so an agent that resizes the file cannot crash the game process.
+"""
+
+import math
+import os
+import struct
+from typing import Optional
+
+from src.zygote import passed_fd
+
+
+_SLOT = struct.Struct('<Qd')  # (1 if a bid was posted else 0, bid)
+
+
+class PostedBidSlot:
+    """
+    One team's posted bid.
+
+    Created in the game process; picklable (only the descriptor number
+    travels), so it can be passed to a worker, which calls post().
+    """
+
+    def __init__(self, fd: int):
+        self.fd = fd
+
+    @classmethod
+    def create(cls) -> 'PostedBidSlot':
+        """
+        Create an empty slot.
+
+        Raises:
+            OSError: If memory files are not available on this system
+        """
+        if not hasattr(os, 'memfd_create'):
+            raise OSError("memfd_create is not available")
+        fd = os.memfd_create('agt_posted_bid', os.MFD_CLOEXEC)
+        slot = cls(fd)
+        slot.clear()
+        return slot
+
+    def post(self, bid: float):
+        """Publish a provisional bid (in a worker)."""
+        os.pwrite(passed_fd(self.fd), _SLOT.pack(1, float(bid)), 0)
+
+    def clear(self):
+        """Forget the posted bid (before a new bid phase)."""
+        os.pwrite(passed_fd(self.fd), _SLOT.pack(0, 0.0), 0)
+
+    def read(self) -> Optional[float]:
+        """Return the posted bid, or None if none (or no valid one) was posted."""
+        data = os.pread(self.fd, _SLOT.size, 0)
+        if len(data) != _SLOT.size:
+            return None
+        posted, bid = _SLOT.unpack(data)
+        if posted != 1 or not math.isfinite(bid):
+            return None
+        return bid
+
+    def close(self):
+        """Release the game process's descriptor."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
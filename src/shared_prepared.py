@@ -0,0 +1,66 @@
+"""
+Prepared results for AGT Competition agent workers
+Hands an agent's prepare() result to its workers once per game
+
+The encoded result (pickle data, as produced by the worker) is written once
+into a small memory file (memfd) per team and sealed, so it can no longer
+change. Workers map it read-only through a descriptor that AgentManager
+passes to that team's workers only, so the result is not pickled into the
+arguments of every call.
+"""
+
+import fcntl
+import mmap
+import os
+
+from src.zygote import passed_fd
+
+
+_SEALS = fcntl.F_SEAL_SEAL | fcntl.F_SEAL_SHRINK | fcntl.F_SEAL_GROW | fcntl.F_SEAL_WRITE
+
+
+class SharedPrepared:
+    """
+    Sealed memory file holding one encoded prepare() result.
+
+    Created in the game process; picklable (only the descriptor number and
+    size travel), so it can be passed to a worker, which calls read().
+    """
+
+    def __init__(self, fd: int, size: int):
+        self.fd = fd
+        self.size = size
+
+    @classmethod
+    def create(cls, encoded: bytes) -> 'SharedPrepared':
+        """
+        Write an encoded result into a new sealed block.
+
+        Raises:
+            OSError: If sealed memory files are not available on this system
+        """
+        if not hasattr(os, 'memfd_create'):
+            raise OSError("memfd_create is not available")
+        payload = memoryview(encoded)
+
+        fd = os.memfd_create('agt_prepared', os.MFD_CLOEXEC | os.MFD_ALLOW_SEALING)
+        try:
+            written = 0
+            while written < len(payload):
+                written += os.pwrite(fd, payload[written:], written)
+            fcntl.fcntl(fd, fcntl.F_ADD_SEALS, _SEALS)
+        except OSError:
+            os.close(fd)
+            raise
+        return cls(fd, len(payload))
+
+    def read(self) -> bytes:
+        """Return the encoded result (in a worker)."""
+        with mmap.mmap(passed_fd(self.fd), self.size, access=mmap.ACCESS_READ) as block:
+            return block[:]
+
+    def close(self):
+        """Release the game process's descriptor."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
@@ -0,0 +1,116 @@
+"""
+Shared-memory valuation vectors for AGT Competition agent workers
+Places a team's valuations in a read-only shared memory block once per game
+
+Layout of a block: a header with the number of items and the size of the
+item-index table, the table itself (item ids, newline separated, in
+valuation order) and the values as float64. Workers map the block
+read-only and see it as an ordinary mapping instead of unpickling a dict on
+every call.
+
+The block's name is unlinked right after creation, so other agents cannot
+open it through /dev/shm; workers reach it only through a read-only file
+descriptor that AgentManager passes to that team's workers.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from multiprocessing import shared_memory
+from typing import Dict, Iterator
+
+from src.zygote import passed_fd
+
+
+_HEADER = struct.Struct('<QQ')  # (number of items, index table bytes)
+_VALUE = struct.Struct('<d')
+
+
+class SharedValuations:
+    """
+    Read-only shared memory block holding one valuation vector.
+
+    Created in the game process; picklable (only the descriptor number and
+    size travel), so it can be passed to a worker, which calls attach().
+    """
+
+    def __init__(self, fd: int, size: int):
+        self.fd = fd
+        self.size = size
+
+    @classmethod
+    def create(cls, valuation_vector: Dict[str, float]) -> 'SharedValuations':
+        """
+        Copy a valuation vector into a new shared memory block.
+
+        Raises:
+            OSError: If shared memory is not available on this system
+        """
+        index = '\n'.join(valuation_vector).encode()
+        values_offset = _values_offset(len(index))
+        size = values_offset + _VALUE.size * len(valuation_vector)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            _HEADER.pack_into(shm.buf, 0, len(valuation_vector), len(index))
+            shm.buf[_HEADER.size:_HEADER.size + len(index)] = index
+            for position, value in enumerate(valuation_vector.values()):
+                _VALUE.pack_into(shm.buf, values_offset + _VALUE.size * position, float(value))
+            fd = os.open(os.path.join('/dev/shm', shm.name.lstrip('/')), os.O_RDONLY)
+        finally:
+            shm.close()
+            shm.unlink()
+        return cls(fd, size)
+
+    def attach(self) -> 'ValuationView':
+        """Map the block read-only in a worker and return it as a mapping."""
+        buffer = mmap.mmap(passed_fd(self.fd), self.size, access=mmap.ACCESS_READ)
+        return ValuationView(buffer)
+
+    def close(self):
+        """Release the game process's descriptor (frees the block once workers exit)."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class ValuationView(Mapping):
+    """Read-only mapping from item id to valuation backed by a shared block."""
+
+    def __init__(self, buffer: mmap.mmap):
+        self._buffer = buffer
+        count, index_size = _HEADER.unpack_from(buffer, 0)
+        index = bytes(buffer[_HEADER.size:_HEADER.size + index_size]).decode()
+        self._items = index.split('\n') if count else []
+        self._positions = {item_id: position for position, item_id in enumerate(self._items)}
+        self._values = memoryview(buffer)[_values_offset(index_size):].cast('d')
+
+    def __getitem__(self, item_id: str) -> float:
+        return self._values[self._positions[item_id]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._positions
+
+    def copy(self) -> Dict[str, float]:
+        """Return the valuations as a plain (mutable) dict."""
+        return dict(zip(self._items, self._values))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __reduce__(self):
+        # Never part of the agent state: every worker attaches afresh
+        raise TypeError("shared valuations cannot be pickled")
+
+
+def _values_offset(index_size: int) -> int:
+    """Offset of the float64 values: after header and index, 8-byte aligned."""
+    end = _HEADER.size + index_size
+    return (end + 7) // 8 * 8
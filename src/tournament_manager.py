@@ -8,9 +8,10 @@ from datetime import datetime
 from typing import Dict, List, Tuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import os
-import random
 
-from src.config import STAGE1_GAMES, STAGE2_GAMES, ARENA_SIZE
+from src.config import (
+    STAGE1_GAMES, STAGE2_GAMES, ARENA_SIZE, AGENT_ISOLATION_MODE, TOURNAMENT_JOBS, ARENA_GAME_JOBS
+)
 from src.game_manager import GameManager
 from src.valuation_generator import ValuationGenerator
 from src.auction_engine import AuctionEngine
@@ -22,6 +23,26 @@ from src.utils import GameResult, StageResult, Team
 logger = logging.getLogger(__name__)
 
 
+def _run_arena_job(tournament_manager: 'TournamentManager', arena_id: str,
+                   arena_teams: List[Team], stage: int, num_games: int,
+                   fixed_valuations: Dict) -> List[GameResult]:
+    """Process pool entry point: run all games of one arena."""
+    return tournament_manager.run_arena_games(
+        arena_id=arena_id,
+        arena_teams=arena_teams,
+        stage=stage,
+        num_games=num_games,
+        fixed_valuations=fixed_valuations
+    )
+
+
+def _run_game_job(tournament_manager: 'TournamentManager', stage: int, arena_id: str,
+                  game_number: int, team_agents: Dict[str, str],
+                  fixed_valuations: Dict) -> GameResult:
+    """Process pool entry point: run one game of an arena."""
+    return tournament_manager.run_single_game(stage, arena_id, game_number, team_agents, fixed_valuations)
+
+
 class TournamentManager:
     """
     Manages the complete tournament including both stages.
@@ -39,7 +60,10 @@ class TournamentManager:
     
     def __init__(self, valuation_generator: ValuationGenerator,
                  results_manager: ResultsManager,
-                 timeout_seconds: float = 2.0):
+                 timeout_seconds: float = 2.0,
+                 isolation_mode: str = AGENT_ISOLATION_MODE,
+                 jobs: int = TOURNAMENT_JOBS,
+                 game_jobs: int = ARENA_GAME_JOBS):
         """
         Initialize tournament manager.
         
@@ -47,10 +71,16 @@ class TournamentManager:
             valuation_generator: Valuation generator instance
             results_manager: Results manager instance
             timeout_seconds: Timeout for agent bid execution
+            isolation_mode: Agent isolation mode ('per_call' or 'persistent')
+            jobs: Number of Stage 1 arenas to run in parallel (1 = serial)
+            game_jobs: Number of games of one arena to run in parallel (1 = serial)
         """
         self.valuation_generator = valuation_generator
         self.results_manager = results_manager
         self.timeout_seconds = timeout_seconds
+        self.isolation_mode = isolation_mode
+        self.jobs = max(1, jobs)
+        self.game_jobs = max(1, game_jobs)
         
         self.stage1_results = None
         self.stage2_results = None
@@ -75,8 +105,8 @@ class TournamentManager:
             arena_size = ARENA_SIZE
             
         # Randomly shuffle teams for fair arena allocation
-        shuffled_teams = teams.copy()
-        random.shuffle(shuffled_teams)
+        rng = self.valuation_generator.derive_rng('arenas', len(teams))
+        shuffled_teams = [teams[i] for i in rng.permutation(len(teams))]
         
         logger.info(f"Randomly allocating {len(shuffled_teams)} teams into arenas of size {arena_size}")
         
@@ -114,29 +144,29 @@ class TournamentManager:
         # Generate valuations once for this arena if not provided
         if fixed_valuations is None:
             team_ids = [team.team_id for team in arena_teams]
-            fixed_valuations, _ = self.valuation_generator.generate_arena_valuations(team_ids)
+            fixed_valuations, _ = self.valuation_generator.generate_arena_valuations(
+                team_ids, rng=self.valuation_generator.derive_rng('valuations', stage, arena_id)
+            )
             logger.info(f"Generated fixed valuations for arena {arena_id}")
         else:
             logger.info(f"Using pre-generated fixed valuations for arena {arena_id}")
         
-        for game_num in range(1, num_games + 1):
+        game_numbers = list(range(1, num_games + 1))
+        
+        if self.game_jobs > 1 and num_games > 1:
+            games = self._run_games_parallel(stage, arena_id, game_numbers, team_agents, fixed_valuations)
+            
+            # Save in game order so output does not depend on completion order
+            for game_num in game_numbers:
+                if games.get(game_num) is not None:
+                    game_results.append(games[game_num])
+                    self.results_manager.save_game_result(games[game_num])
+            
+            return game_results
+        
+        for game_num in game_numbers:
             try:
-                # Create fresh instances for each game
-                auction_engine = AuctionEngine()
-                agent_manager = AgentManager(timeout_seconds=self.timeout_seconds)
-                
-                game_manager = GameManager(
-                    stage=stage,
-                    arena_id=arena_id,
-                    game_number=game_num,
-                    valuation_generator=self.valuation_generator,
-                    auction_engine=auction_engine,
-                    agent_manager=agent_manager,
-                    fixed_valuations=fixed_valuations  # Pass fixed valuations to each game
-                )
-                
-                # Run the game
-                game_result = game_manager.run_game(team_agents)
+                game_result = self.run_single_game(stage, arena_id, game_num, team_agents, fixed_valuations)
                 game_results.append(game_result)
                 
                 # Save game results
@@ -147,6 +177,81 @@ class TournamentManager:
         
         return game_results
     
+    def run_single_game(self, stage: int, arena_id: str, game_number: int,
+                        team_agents: Dict[str, str], fixed_valuations: Dict) -> GameResult:
+        """
+        Run one game with fresh engine and agent manager instances.
+        
+        The game draws its auction sequence and tie-breaks from its own
+        random streams, so the result does not depend on other games.
+        
+        Args:
+            stage: Competition stage (1 or 2)
+            arena_id: Arena identifier
+            game_number: Game number within the arena
+            team_agents: Dictionary mapping team_id to agent_file_path
+            fixed_valuations: Valuations shared by all games in the arena
+        
+        Returns:
+            GameResult of the game
+        """
+        # Create fresh instances for each game
+        auction_engine = AuctionEngine()
+        agent_manager = AgentManager(timeout_seconds=self.timeout_seconds,
+                                     isolation_mode=self.isolation_mode)
+        
+        game_manager = GameManager(
+            stage=stage,
+            arena_id=arena_id,
+            game_number=game_number,
+            valuation_generator=self.valuation_generator,
+            auction_engine=auction_engine,
+            agent_manager=agent_manager,
+            fixed_valuations=fixed_valuations  # Pass fixed valuations to each game
+        )
+        
+        # Run the game
+        return game_manager.run_game(team_agents)
+    
+    def _run_games_parallel(self, stage: int, arena_id: str, game_numbers: List[int],
+                            team_agents: Dict[str, str],
+                            fixed_valuations: Dict) -> Dict[int, GameResult]:
+        """
+        Run the games of one arena in parallel worker processes.
+        
+        Args:
+            stage: Competition stage (1 or 2)
+            arena_id: Arena identifier
+            game_numbers: Game numbers to run
+            team_agents: Dictionary mapping team_id to agent_file_path
+            fixed_valuations: Valuations shared by all games in the arena
+        
+        Returns:
+            Dictionary mapping game number to GameResult (None if the game failed)
+        """
+        logger.info(f"Running {len(game_numbers)} games of arena {arena_id} with {self.game_jobs} parallel jobs")
+        
+        results = {}
+        max_workers = min(self.game_jobs, len(game_numbers))
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_game_job, self, stage, arena_id, game_num, team_agents, fixed_valuations
+                ): game_num
+                for game_num in game_numbers
+            }
+            
+            for future in as_completed(futures):
+                game_num = futures[future]
+                try:
+                    results[game_num] = future.result()
+                except Exception as e:
+                    logger.error(f"Error running game {game_num} in arena {arena_id}: {e}", exc_info=True)
+                    results[game_num] = None
+        
+        return results
+    
     def determine_arena_winner(self, arena_teams: List[Team], game_results: List[GameResult]) -> Team:
         """
         Determine arena winner using new tiebreaker rules.
@@ -253,25 +358,34 @@ class TournamentManager:
         # Generate fixed valuations for each arena in Stage 1
         # These valuations will be reused across all games in this stage
         logger.info("Generating fixed valuations for Stage 1 (same across all games)")
-        self.stage1_valuations = {}
-        for arena_id, arena_teams in arenas.items():
-            team_ids = [team.team_id for team in arena_teams]
-            valuations, _ = self.valuation_generator.generate_arena_valuations(team_ids)
-            self.stage1_valuations[arena_id] = valuations
-            logger.info(f"Generated fixed valuations for Arena {arena_id}")
+        arena_team_ids = [[team.team_id for team in arena_teams] for arena_teams in arenas.values()]
+        stage_valuations = self.valuation_generator.generate_stage_valuations(
+            arena_team_ids, rng=self.valuation_generator.derive_rng('valuations', 1)
+        )
+        self.stage1_valuations = dict(zip(arenas.keys(), stage_valuations))
+        logger.info(f"Generated fixed valuations for {len(arenas)} arenas")
         
         # Run games for each arena
         arena_results = {}
         arena_winners = []
         
+        if self.jobs > 1 and len(arenas) > 1:
+            parallel_results = self._run_arenas_parallel(arenas, stage=1, num_games=STAGE1_GAMES)
+        else:
+            parallel_results = None
+        
+        # Arenas are processed in allocation order so winner selection matches a serial run
         for arena_id, arena_teams in arenas.items():
-            game_results = self.run_arena_games(
-                arena_id=arena_id,
-                arena_teams=arena_teams,
-                stage=1,
-                num_games=STAGE1_GAMES,
-                fixed_valuations=self.stage1_valuations[arena_id]  # Pass fixed valuations
-            )
+            if parallel_results is not None:
+                game_results = parallel_results[arena_id]
+            else:
+                game_results = self.run_arena_games(
+                    arena_id=arena_id,
+                    arena_teams=arena_teams,
+                    stage=1,
+                    num_games=STAGE1_GAMES,
+                    fixed_valuations=self.stage1_valuations[arena_id]  # Pass fixed valuations
+                )
             
             arena_results[arena_id] = game_results
             
@@ -303,6 +417,47 @@ class TournamentManager:
         
         return stage_result, arena_winners
     
+    def _run_arenas_parallel(self, arenas: Dict[str, List[Team]], stage: int,
+                             num_games: int) -> Dict[str, List[GameResult]]:
+        """
+        Run the games of several arenas in parallel worker processes.
+        
+        Every game draws from its own seeded random streams, so results
+        match a serial run for the same seed.
+        
+        Args:
+            arenas: Dictionary mapping arena_id to list of teams
+            stage: Competition stage
+            num_games: Number of games per arena
+        
+        Returns:
+            Dictionary mapping arena_id to list of GameResult objects
+        """
+        logger.info(f"Running {len(arenas)} arenas with {self.jobs} parallel jobs")
+        
+        arena_valuations = self.stage1_valuations if stage == 1 else self.stage2_valuations
+        results = {}
+        
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            futures = {
+                executor.submit(
+                    _run_arena_job, self, arena_id, arena_teams, stage, num_games,
+                    arena_valuations[arena_id]
+                ): arena_id
+                for arena_id, arena_teams in arenas.items()
+            }
+            
+            for future in as_completed(futures):
+                arena_id = futures[future]
+                try:
+                    results[arena_id] = future.result()
+                    logger.info(f"Arena {arena_id} finished ({len(results[arena_id])} games)")
+                except Exception as e:
+                    logger.error(f"Error running arena {arena_id}: {e}", exc_info=True)
+                    results[arena_id] = []
+        
+        return results
+    
     def run_stage2(self, qualified_teams: List[Team]) -> StageResult:
         """
         Run Stage 2: Championship Round.
@@ -329,7 +484,9 @@ class TournamentManager:
         
         # Generate fixed valuations for Stage 2 championship
         team_ids = [team.team_id for team in qualified_teams]
-        stage2_valuations, _ = self.valuation_generator.generate_arena_valuations(team_ids)
+        stage2_valuations, _ = self.valuation_generator.generate_arena_valuations(
+            team_ids, rng=self.valuation_generator.derive_rng('valuations', 2, arena_id)
+        )
         self.stage2_valuations = {arena_id: stage2_valuations}
         logger.info(f"Generated fixed valuations for Stage 2 Championship")
         
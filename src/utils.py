@@ -37,6 +37,10 @@ class AuctionRoundResult:
     all_bids: Dict[str, float]
     timestamp: datetime
     execution_times: Dict[str, float]  # Time taken by each agent to bid
+    # Agent call errors by team and phase, e.g. {"team_a": {"update": "Timeout"}}.
+    # "bid" errors come from this round's bid; "update" errors from delivering
+    # this round's result to the agent.
+    agent_errors: Dict[str, Dict[str, str]] = field(default_factory=dict)
     
     def to_dict(self) -> dict:
         return {
@@ -46,7 +50,8 @@ class AuctionRoundResult:
             "price_paid": self.price_paid,
             "all_bids": self.all_bids,
             "timestamp": self.timestamp.isoformat(),
-            "execution_times": self.execution_times
+            "execution_times": self.execution_times,
+            "agent_errors": self.agent_errors
         }
     
     def to_public_dict(self) -> dict:
@@ -3,6 +3,7 @@ Valuation Generator for AGT Competition
 Generates item valuations according to competition rules
 """
 
+import zlib
 import numpy as np
 from typing import Dict, List, Tuple
 from src.config import (
@@ -11,6 +12,12 @@ from src.config import (
 )
 
 
+# Item category codes used by batch generation
+CATEGORY_HIGH = 0
+CATEGORY_LOW = 1
+CATEGORY_MIXED = 2
+
+
 class ValuationGenerator:
     """
     Generates valuation vectors for teams according to competition specifications.
@@ -25,13 +32,18 @@ class ValuationGenerator:
         """
         Initialize valuation generator.
         
+        All randomness is drawn from numpy Generators derived from a root seed
+        (see derive_rng); the global np.random state is never touched.
+        
         Args:
             random_seed: Optional seed for reproducibility
         """
         self.random_seed = random_seed if random_seed is not None else RANDOM_SEED
         self.initial_seed = self.random_seed
-        if self.random_seed is not None:
-            np.random.seed(self.random_seed)
+        # Without a seed, fix fresh entropy once so every derived stream of
+        # this run (including those used in worker processes) is consistent
+        self.entropy = np.random.SeedSequence().entropy if self.random_seed is None else None
+        self.rng = self.derive_rng('default')
         
         # Verify configuration
         assert HIGH_VALUE_ITEMS + LOW_VALUE_ITEMS + MIXED_VALUE_ITEMS == K_TOTAL_ITEMS, \
@@ -45,10 +57,64 @@ class ValuationGenerator:
         if self.initial_seed is not None:
             # Increment seed to get different but reproducible valuations
             self.random_seed = (self.random_seed + 1000) % (2**32)
-            np.random.seed(self.random_seed)
-        # If no seed, numpy will continue with current state
+        else:
+            self.entropy = np.random.SeedSequence().entropy
+        self.rng = self.derive_rng('default')
+    
+    def derive_rng(self, *key) -> np.random.Generator:
+        """
+        Derive an independent random stream from the root seed.
+        
+        Streams are keyed by their purpose and position in the tournament,
+        e.g. ('valuations', stage, arena_id) or
+        ('round', stage, arena_id, game_number, round_number). The same key
+        always gives the same stream, regardless of which other streams were
+        used before or concurrently, so serial and parallel runs match.
+        
+        Args:
+            *key: Stream identity (ints or strings)
+        
+        Returns:
+            numpy Generator for the keyed stream
+        """
+        entropy = self.random_seed if self.initial_seed is not None else self.entropy
+        spawn_key = tuple(
+            part if isinstance(part, int) and part >= 0 else zlib.crc32(str(part).encode())
+            for part in key
+        )
+        return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
+    
+    def game_rng(self, stage: int, arena_id: str, game_number: int) -> np.random.Generator:
+        """
+        Create an independent random stream for one game's auction sequence.
+        
+        Args:
+            stage: Competition stage (1 or 2)
+            arena_id: Arena identifier
+            game_number: Game number within the arena
+        
+        Returns:
+            numpy Generator for the game
+        """
+        return self.derive_rng('game', stage, arena_id, game_number)
+    
+    def round_rng(self, stage: int, arena_id: str, game_number: int,
+                  round_number: int) -> np.random.Generator:
+        """
+        Create an independent random stream for one auction round (tie-breaks).
+        
+        Args:
+            stage: Competition stage (1 or 2)
+            arena_id: Arena identifier
+            game_number: Game number within the arena
+            round_number: Round number within the game
+        
+        Returns:
+            numpy Generator for the round
+        """
+        return self.derive_rng('round', stage, arena_id, game_number, round_number)
     
-    def _generate_item_categories(self) -> Tuple[List[str], List[str], List[str]]:
+    def _generate_item_categories(self, rng: np.random.Generator = None) -> Tuple[List[str], List[str], List[str]]:
         """
         Randomly assign items to categories (high, low, mixed).
         This is done once per game so all teams have consistent categorization.
@@ -56,6 +122,9 @@ class ValuationGenerator:
         SECURITY: Item IDs are randomized to prevent teams from inferring
         item types based on ID patterns or positions in the valuation vector.
         
+        Args:
+            rng: Random stream to draw from (default: self.rng)
+        
         Returns:
             Tuple of (high_value_items, low_value_items, mixed_value_items)
         """
@@ -64,7 +133,8 @@ class ValuationGenerator:
         
         # Shuffle to randomize which items belong to which category
         # This prevents teams from inferring that "item_0-5 are always high value"
-        np.random.shuffle(all_items)
+        rng = rng if rng is not None else self.rng
+        rng.shuffle(all_items)
         
         # Assign shuffled items to categories
         high_value_items = all_items[:HIGH_VALUE_ITEMS]
@@ -76,7 +146,8 @@ class ValuationGenerator:
     def generate_valuation_vector(self, team_id: str, 
                                   high_items: List[str],
                                   low_items: List[str],
-                                  mixed_items: List[str]) -> Dict[str, float]:
+                                  mixed_items: List[str],
+                                  rng: np.random.Generator = None) -> Dict[str, float]:
         """
         Generate a valuation vector for a single team.
         
@@ -85,34 +156,38 @@ class ValuationGenerator:
             high_items: List of item IDs that are high-value for all teams
             low_items: List of item IDs that are low-value for all teams
             mixed_items: List of item IDs with mixed values
+            rng: Random stream to draw from (default: self.rng)
         
         Returns:
             Dictionary mapping item_id to valuation
         """
+        rng = rng if rng is not None else self.rng
         valuation_vector = {}
         
         # High-value items (same items for all teams, but different values)
         for item_id in high_items:
-            valuation_vector[item_id] = np.random.uniform(*HIGH_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*HIGH_VALUE_RANGE)
         
         # Low-value items (same items for all teams, but different values)
         for item_id in low_items:
-            valuation_vector[item_id] = np.random.uniform(*LOW_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*LOW_VALUE_RANGE)
         
         # Mixed-value items (can be high or low for different teams)
         for item_id in mixed_items:
-            valuation_vector[item_id] = np.random.uniform(*MIXED_VALUE_RANGE)
+            valuation_vector[item_id] = rng.uniform(*MIXED_VALUE_RANGE)
         
         return valuation_vector
     
-    def generate_arena_valuations(self, team_ids: List[str]) -> Tuple[Dict[str, Dict[str, float]], 
-                                                                       Tuple[List[str], List[str], List[str]]]:
+    def generate_arena_valuations(self, team_ids: List[str],
+                                  rng: np.random.Generator = None) -> Tuple[Dict[str, Dict[str, float]], 
+                                                                            Tuple[List[str], List[str], List[str]]]:
         """
         Generate valuations for all teams in an arena.
         All teams get the same item categorization but different values.
         
         Args:
             team_ids: List of team IDs in the arena
+            rng: Random stream to draw from (default: self.rng)
         
         Returns:
             Tuple of (valuations_dict, item_categories)
@@ -120,23 +195,107 @@ class ValuationGenerator:
             - item_categories: (high_items, low_items, mixed_items)
         """
         # Determine item categories (consistent for all teams)
-        high_items, low_items, mixed_items = self._generate_item_categories()
+        rng = rng if rng is not None else self.rng
+        high_items, low_items, mixed_items = self._generate_item_categories(rng)
         
         # Generate valuations for each team
         valuations = {}
         for team_id in team_ids:
             valuations[team_id] = self.generate_valuation_vector(
-                team_id, high_items, low_items, mixed_items
+                team_id, high_items, low_items, mixed_items, rng
             )
         
         return valuations, (high_items, low_items, mixed_items)
     
-    def get_random_auction_sequence(self, num_items: int = None) -> List[str]:
+    def generate_valuation_batch(self, n_arenas: int, n_teams: int,
+                                 rng: np.random.Generator = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generate valuations for many arenas at once with vectorized draws.
+        
+        Same distribution as generate_arena_valuations: per arena, items are
+        randomly assigned to the high/low/mixed categories (shared by all
+        teams of the arena) and each team draws its own uniform values.
+        
+        Args:
+            n_arenas: Number of arenas
+            n_teams: Number of teams per arena
+            rng: Random stream to draw from (default: self.rng)
+        
+        Returns:
+            Tuple of (values, categories)
+            - values: float array of shape (n_arenas, n_teams, K_TOTAL_ITEMS);
+              values[a, t, i] is team t's valuation of item i in arena a
+            - categories: int array of shape (n_arenas, K_TOTAL_ITEMS) with
+              CATEGORY_HIGH, CATEGORY_LOW or CATEGORY_MIXED per item
+        """
+        rng = rng if rng is not None else self.rng
+        
+        # Shuffle the category labels independently for every arena
+        labels = np.repeat(
+            [CATEGORY_HIGH, CATEGORY_LOW, CATEGORY_MIXED],
+            [HIGH_VALUE_ITEMS, LOW_VALUE_ITEMS, MIXED_VALUE_ITEMS]
+        )
+        categories = rng.permuted(np.tile(labels, (n_arenas, 1)), axis=1)
+        
+        # Scale uniform draws into each item's category range
+        ranges = np.array([HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE], dtype=float)
+        low = ranges[categories, 0][:, None, :]
+        width = (ranges[categories, 1] - ranges[categories, 0])[:, None, :]
+        values = low + width * rng.random((n_arenas, n_teams, K_TOTAL_ITEMS))
+        
+        return values, categories
+    
+    def batch_to_arena_valuations(self, values: np.ndarray,
+                                  arena_team_ids: List[List[str]]) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Convert a valuation batch into per-arena {team_id: {item_id: value}} dicts.
+        
+        Args:
+            values: Array from generate_valuation_batch
+            arena_team_ids: Team IDs of each arena; arenas with fewer teams
+                than the batch use the first rows
+        
+        Returns:
+            List with one valuations dict per arena, as used by GameManager
+        """
+        item_ids = [ITEM_ID_FORMAT.format(i) for i in range(K_TOTAL_ITEMS)]
+        arena_valuations = []
+        
+        for arena_values, team_ids in zip(values, arena_team_ids):
+            arena_valuations.append({
+                team_id: dict(zip(item_ids, arena_values[row].tolist()))
+                for row, team_id in enumerate(team_ids)
+            })
+        
+        return arena_valuations
+    
+    def generate_stage_valuations(self, arena_team_ids: List[List[str]],
+                                  rng: np.random.Generator = None) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Generate valuations for all arenas of a stage in one batch.
+        
+        Args:
+            arena_team_ids: Team IDs of each arena
+            rng: Random stream to draw from (default: self.rng)
+        
+        Returns:
+            List with one {team_id: {item_id: value}} dict per arena
+        """
+        if not arena_team_ids:
+            return []
+        
+        n_teams = max(len(team_ids) for team_ids in arena_team_ids)
+        values, _ = self.generate_valuation_batch(len(arena_team_ids), n_teams, rng)
+        return self.batch_to_arena_valuations(values, arena_team_ids)
+    
+    def get_random_auction_sequence(self, num_items: int = None,
+                                    rng: np.random.Generator = None) -> List[str]:
         """
         Select and shuffle random items for auction sequence.
         
         Args:
             num_items: Number of items to auction (default from config)
+            rng: Random stream to draw from (default: self.rng)
         
         Returns:
             List of item IDs in random order
@@ -144,9 +303,11 @@ class ValuationGenerator:
         from src.config import T_AUCTION_ROUNDS
         if num_items is None:
             num_items = T_AUCTION_ROUNDS
+        if rng is None:
+            rng = self.rng
         
         all_items = [ITEM_ID_FORMAT.format(i) for i in range(K_TOTAL_ITEMS)]
-        selected_items = np.random.choice(all_items, size=num_items, replace=False).tolist()
-        np.random.shuffle(selected_items)
+        selected_items = rng.choice(all_items, size=num_items, replace=False).tolist()
+        rng.shuffle(selected_items)
         
         return selected_items
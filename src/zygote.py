@@ -0,0 +1,463 @@
+"""
+Zygote process for AGT Competition agent workers
+Forks isolated agent calls from a small, pre-warmed process image
+
+The zygote is started once per tournament process as a fresh interpreter,
+so it holds none of the tournament's memory (GameManager, other
+agents' valuations). It imports an allowlist of common libraries up front;
+every isolated call is then an os.fork() of this warm, clean image instead
+of a fork of the (much larger) tournament process or a fresh interpreter.
+"""
+
+import atexit
+import importlib
+import logging
+import os
+import pickle
+import signal
+import subprocess
+import sys
+import multiprocessing as mp
+import multiprocessing.connection
+from multiprocessing.reduction import send_handle, recv_handle
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.ipc import recv_message
+
+
+logger = logging.getLogger(__name__)
+
+# Worker start methods
+START_FORK = 'fork'                  # Fork the calling process for every worker
+START_ZYGOTE = 'zygote'              # Fork from the shared pre-warmed zygote
+START_AGENT_ZYGOTE = 'agent_zygote'  # Fork from a per-agent SpecializedZygote (see AgentManager)
+START_METHODS = (START_FORK, START_ZYGOTE, START_AGENT_ZYGOTE)
+
+# Write end of this process's own sentinel pipe, if it was forked by a zygote
+_sentinel_fd: Optional[int] = None
+
+# Descriptors passed along with this worker's request, keyed by their number
+# in the process that launched the worker
+_passed_fds: Dict[int, int] = {}
+
+
+def passed_fd(fd: int) -> int:
+    """
+    Translate a descriptor number of the launching process to this worker.
+
+    Workers forked directly from the launching process inherit its
+    descriptors unchanged; zygote workers receive copies under new numbers.
+    """
+    return _passed_fds.get(fd, fd)
+
+
+def _reap_children():
+    """Collect exit statuses of finished workers so they do not linger as zombies."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _close_fds_except(keep: Sequence[int]):
+    """Close every descriptor of this process except those in keep."""
+    start = 0
+    for fd in sorted(set(keep)):
+        if fd > start:
+            os.closerange(start, fd)
+        start = fd + 1
+    os.closerange(start, os.sysconf('SC_OPEN_MAX'))
+
+
+def _run_child(target: Callable, args: tuple, channel_fd: int):
+    """Run a worker target in a freshly forked child and exit without cleanup."""
+    exit_code = 0
+    try:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        target(*args, mp.connection.Connection(channel_fd))
+    except BaseException:
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def _serve(control_conn):
+    """
+    Zygote server loop.
+
+    Requests on control_conn are (target, args, fds) followed by the file
+    descriptor of the worker's end of its result channel and one descriptor
+    for each number in fds (see passed_fd). For each request the zygote
+    forks a child that runs target(*args, channel) and replies with the
+    child's pid followed by a sentinel descriptor that becomes readable when
+    the child exits. A None request stops the server.
+    """
+    global _sentinel_fd, _passed_fds
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    while True:
+        _reap_children()
+        try:
+            if not control_conn.poll(1.0):
+                continue
+            request = control_conn.recv()
+            if request is None:
+                break
+            target, args, fds = request
+            channel_fd = recv_handle(control_conn)
+            local_fds = [recv_handle(control_conn) for _ in fds]
+        except (EOFError, OSError):
+            break
+
+        sentinel_r, sentinel_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Only the child itself may hold its sentinel open, not the
+            # zygote's own sentinel (which would keep the zygote "alive")
+            if _sentinel_fd is not None:
+                os.close(_sentinel_fd)
+            _sentinel_fd = sentinel_w
+            _passed_fds = dict(zip(fds, local_fds))
+            os.close(sentinel_r)
+            control_conn.close()
+            _run_child(target, args, channel_fd)
+
+        os.close(sentinel_w)
+        os.close(channel_fd)
+        for fd in local_fds:
+            os.close(fd)
+        try:
+            control_conn.send(pid)
+            send_handle(control_conn, sentinel_r, os.getppid())
+        except OSError:
+            break
+        finally:
+            os.close(sentinel_r)
+
+
+def _zygote_main(control_fd: int, preload: List[str]):
+    """Entry point of the shared zygote interpreter: preload modules, then serve."""
+    control_conn = mp.connection.Connection(control_fd)
+
+    for module_name in preload:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+    _serve(control_conn)
+
+
+def _specialized_zygote_main(setup: Callable, setup_args: tuple, conn):
+    """Worker target that runs setup once and then serves forks as a zygote."""
+    # Bound before setup, which may run agent code that rebinds module globals
+    serve = _serve
+    try:
+        setup(*setup_args)
+    except Exception:
+        # Workers redo the work themselves and report the error per call
+        pass
+    serve(conn)
+
+
+class ZygoteProcess:
+    """
+    Handle for a worker forked by the zygote.
+
+    Mirrors the parts of multiprocessing.Process that AgentManager uses
+    (pid, sentinel, is_alive, join, terminate, kill). The worker is not a
+    child of this process; its lifetime is tracked through the sentinel
+    pipe, whose write end only the worker holds.
+    """
+
+    def __init__(self, pid: int, sentinel: int):
+        self.pid = pid
+        self.sentinel = sentinel
+
+    def is_alive(self) -> bool:
+        if self.sentinel is None:
+            return False
+        return not mp.connection.wait([self.sentinel], timeout=0)
+
+    def join(self, timeout: Optional[float] = None):
+        if self.sentinel is not None:
+            mp.connection.wait([self.sentinel], timeout=timeout)
+
+    def terminate(self):
+        self._signal(signal.SIGTERM)
+
+    def kill(self):
+        self._signal(signal.SIGKILL)
+
+    def close(self):
+        if self.sentinel is not None:
+            os.close(self.sentinel)
+            self.sentinel = None
+
+    def _signal(self, signum: int):
+        # Only signal a live worker: once it has exited the zygote may reap it
+        # and the pid may be reused
+        if self.is_alive():
+            try:
+                os.kill(self.pid, signum)
+            except ProcessLookupError:
+                pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ForkedProcess(ZygoteProcess):
+    """
+    Handle for a worker forked directly from this process (see fork_worker).
+
+    Same interface as ZygoteProcess; as the worker is a child of this
+    process, the handle also collects its exit status once the sentinel
+    reports that it exited.
+    """
+
+    def is_alive(self) -> bool:
+        alive = super().is_alive()
+        if not alive and self.sentinel is not None and self.pid is not None:
+            try:
+                os.waitpid(self.pid, 0)
+            except ChildProcessError:
+                pass
+            self.pid = None
+        return alive
+
+    def join(self, timeout: Optional[float] = None):
+        super().join(timeout)
+        self.is_alive()
+
+    def close(self):
+        self.is_alive()
+        super().close()
+
+
+def fork_worker(target: Callable, args: tuple, channel: Any,
+                fds: Sequence[int] = ()) -> ForkedProcess:
+    """
+    Fork this process into a worker running target(*args, channel).
+
+    The worker keeps only the standard streams, its channel, its sentinel
+    and fds; every other descriptor it would inherit (other teams' shared
+    valuations and posted bids, other workers' pipes, log files) is closed
+    before target runs.
+
+    Args:
+        target: Worker function
+        args: Positional arguments for target
+        channel: Worker end of a multiprocessing pipe; the caller closes its
+                 copy after this returns
+        fds: Further descriptors the worker keeps (same numbers, see passed_fd)
+
+    Returns:
+        ForkedProcess handle of the worker
+    """
+    global _sentinel_fd
+    sentinel_r, sentinel_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            _sentinel_fd = sentinel_w
+            _close_fds_except((0, 1, 2, channel.fileno(), sentinel_w) + tuple(fds))
+        except BaseException:
+            os._exit(1)
+        _run_child(target, args, channel.fileno())
+
+    os.close(sentinel_w)
+    return ForkedProcess(pid, sentinel_r)
+
+
+class Zygote:
+    """Client side of a zygote server process."""
+
+    def __init__(self, preload: List[str]):
+        """
+        Start a zygote server.
+
+        The server is a new interpreter (not a multiprocessing spawn child),
+        so it does not re-import the caller's __main__ module.
+
+        Args:
+            preload: Modules the zygote imports before serving requests
+        """
+        self.preload = list(preload)
+        self.owner_pid = os.getpid()
+        self.conn, child_conn = mp.Pipe(duplex=True)
+
+        command = (f"import sys; sys.path[:] = {sys.path!r}; "
+                   f"from {__name__} import _zygote_main; "
+                   f"_zygote_main({child_conn.fileno()}, {self.preload!r})")
+        try:
+            self.process = subprocess.Popen([sys.executable, '-c', command],
+                                            pass_fds=(child_conn.fileno(),),
+                                            stdin=subprocess.DEVNULL)
+        finally:
+            child_conn.close()
+
+    def is_usable(self) -> bool:
+        """True if the zygote belongs to this process and is still running."""
+        return self.owner_pid == os.getpid() and self.process.poll() is None
+
+    def fork(self, target: Callable, args: tuple, channel: Any,
+             fds: Sequence[int] = ()) -> ZygoteProcess:
+        """
+        Fork a worker running target(*args, channel).
+
+        Args:
+            target: Module-level function (pickled by reference)
+            args: Picklable positional arguments
+            channel: Worker end of a multiprocessing pipe; the caller closes
+                     its copy after this returns
+            fds: Further descriptors to pass to the worker (see passed_fd)
+
+        Returns:
+            ZygoteProcess handle of the worker
+        """
+        self.conn.send((target, args, tuple(fds)))
+        send_handle(self.conn, channel.fileno(), self.process.pid)
+        for fd in fds:
+            send_handle(self.conn, fd, self.process.pid)
+        # The zygote may have run agent code (SpecializedZygote), so its
+        # reply is read as plain data only
+        try:
+            pid = recv_message(self.conn)
+        except pickle.UnpicklingError as e:
+            raise OSError(f"Invalid reply from zygote: {e}") from e
+        if type(pid) is not int:
+            raise OSError(f"Invalid reply from zygote: {pid!r}")
+        sentinel = recv_handle(self.conn)
+        return ZygoteProcess(pid, sentinel)
+
+    def close(self):
+        """Stop the zygote server."""
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        try:
+            self.process.wait(timeout=1.0)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.conn.close()
+
+
+class SpecializedZygote(Zygote):
+    """
+    Zygote forked from the shared zygote after running a setup function.
+
+    Workers forked from it start with whatever setup left in memory (for
+    example an agent module that is already executed), copy-on-write and
+    private to each worker.
+    """
+
+    def __init__(self, setup: Callable, setup_args: tuple, preload: List[str],
+                 fds: Sequence[int] = ()):
+        """
+        Start a specialized zygote.
+
+        Args:
+            setup: Module-level function run once in the zygote
+            setup_args: Picklable arguments for setup
+            preload: Modules the shared zygote imports if it is not running yet
+            fds: Descriptors setup needs (see passed_fd)
+        """
+        self.preload = list(preload)
+        self.owner_pid = os.getpid()
+        self.conn, child_conn = mp.Pipe(duplex=True)
+        try:
+            self.process = launch_worker(START_ZYGOTE, _specialized_zygote_main,
+                                         (setup, setup_args), child_conn, preload, fds)
+        finally:
+            child_conn.close()
+
+    def is_usable(self) -> bool:
+        """True if the zygote belongs to this process and is still running."""
+        return self.owner_pid == os.getpid() and self.process.is_alive()
+
+    def close(self):
+        """Stop the zygote server."""
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(timeout=1.0)
+        self.process.kill()
+        self.process.close()
+        self.conn.close()
+
+
+_zygote: Optional[Zygote] = None
+
+
+def get_zygote(preload: List[str]) -> Zygote:
+    """
+    Return this process's zygote, starting (or restarting) it when needed.
+
+    A process forked from the owner (e.g. a tournament pool worker) starts
+    its own zygote instead of sharing the owner's control pipe.
+    """
+    global _zygote
+    if _zygote is None or not _zygote.is_usable():
+        if _zygote is not None and _zygote.owner_pid == os.getpid():
+            _zygote.close()
+        _zygote = Zygote(preload)
+        logger.debug(f"Started zygote process {_zygote.process.pid} (preload: {preload})")
+    return _zygote
+
+
+@atexit.register
+def _shutdown_zygote():
+    """Stop this process's zygote at interpreter exit."""
+    if _zygote is not None and _zygote.owner_pid == os.getpid():
+        _zygote.close()
+
+
+def launch_worker(start_method: str, target: Callable, args: tuple, channel: Any,
+                  preload: List[str] = (), fds: Sequence[int] = ()) -> Any:
+    """
+    Start an isolated worker running target(*args, channel).
+
+    Args:
+        start_method: START_FORK or START_ZYGOTE (per-agent zygotes are
+                      managed by the caller)
+        target: Module-level worker function
+        args: Positional arguments for target
+        channel: Worker end of a multiprocessing pipe; the caller closes its
+                 copy after this returns
+        preload: Modules the zygote imports when it is first started
+        fds: Descriptors the worker needs (the only ones forked workers
+             keep, passed to zygote workers; see passed_fd)
+
+    Returns:
+        Process handle (ForkedProcess or ZygoteProcess)
+    """
+    global _zygote
+    if start_method == START_ZYGOTE:
+        try:
+            return get_zygote(preload).fork(target, args, channel, fds)
+        except (EOFError, OSError):
+            # The zygote died (e.g. killed by an agent); start a fresh one
+            logger.warning("Zygote process lost, restarting it")
+            _zygote.close()
+            _zygote = None
+            return get_zygote(preload).fork(target, args, channel, fds)
+
+    if start_method != START_FORK:
+        raise ValueError(f"Unknown worker start method: {start_method}")
+
+    return fork_worker(target, args, channel, fds)
@@ -0,0 +1,49 @@
+"""
+Malicious Agent: Reply Forger
+Attempts to run code in the game process by sending a forged pickled reply
+"""
+
+import gc
+import os
+import pickle
+import tempfile
+from multiprocessing.connection import Connection
+
+
+MARKER_FILE = os.path.join(tempfile.gettempdir(), 'agt_reply_forger_marker')
+
+
+class _Payload:
+    """Unpickling this object creates MARKER_FILE in the receiving process"""
+
+    def __reduce__(self):
+        return (open, (MARKER_FILE, 'w'))
+
+
+class BiddingAgent:
+    """
+    EXPLOIT ATTEMPT: Write a reply whose unpickling executes code in the game process
+    
+    Expected behavior: SHOULD FAIL
+    - The game process only unpickles plain data from workers
+    - The forged reply is rejected and the bid counts as failed
+    """
+    
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        
+    def bidding_function(self, item_id):
+        """Send the forged reply on the worker's own result pipe, then exit"""
+        forged = pickle.dumps(('success', _Payload(), 0.0, ({}, []), None))
+        for obj in gc.get_objects():
+            if isinstance(obj, Connection) and not obj.closed and obj.writable:
+                try:
+                    obj.send_bytes(forged)
+                except Exception:
+                    pass
+        os._exit(0)
+        
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
@@ -0,0 +1,44 @@
+"""
+Malicious Agent: Slot Tamperer
+Attempts to overwrite rivals' posted bids and read their valuation blocks
+through descriptors inherited from the game process
+"""
+
+import os
+import struct
+
+
+class BiddingAgent:
+    """
+    EXPLOIT ATTEMPT: Write a bid into every posted-bid slot the worker can reach
+
+    Expected behavior: SHOULD FAIL
+    - A worker only holds its own team's valuations and posted-bid slot
+    - Rivals' posted bids stay untouched
+    """
+
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        """Tamper with every reachable slot; bid the number of team blocks found"""
+        found = set()
+        for name in os.listdir('/proc/self/fd'):
+            try:
+                target = os.readlink(f'/proc/self/fd/{name}')
+            except OSError:
+                continue
+            if 'agt_posted_bid' in target or target.startswith('/dev/shm/'):
+                info = os.fstat(int(name))
+                found.add((info.st_dev, info.st_ino))
+            if 'agt_posted_bid' in target:
+                try:
+                    os.pwrite(int(name), struct.pack('<Qd', 1, 99.0), 0)
+                except OSError:
+                    pass
+        return float(len(found))
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
@@ -0,0 +1,62 @@
+"""
+Malicious Agent: Zygote Hijacker
+Attempts to run code in the game process through the agent zygote's replies
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+from multiprocessing.connection import Connection
+
+
+MARKER_FILE = os.path.join(tempfile.gettempdir(), 'agt_zygote_hijacker_marker')
+
+
+class _Payload:
+    """Unpickling this object creates MARKER_FILE in the receiving process"""
+
+    def __reduce__(self):
+        return (open, (MARKER_FILE, 'w'))
+
+
+def _forged_send(self, obj):
+    """Answer every request with the payload instead of the worker's pid"""
+    self.send_bytes(pickle.dumps(_Payload()))
+
+
+def _forged_serve(control_conn):
+    """Stand-in for the zygote's fork server"""
+    while True:
+        control_conn.recv()
+        _forged_send(control_conn, None)
+
+
+# The module runs while the per-agent zygote (started with python -c) is
+# being set up, before it answers fork requests on its control pipe
+if sys.argv[:1] == ['-c']:
+    Connection.send = _forged_send
+    zygote = sys.modules.get('src.zygote')
+    if zygote is not None:
+        zygote._serve = _forged_serve
+
+
+class BiddingAgent:
+    """
+    EXPLOIT ATTEMPT: Make the agent zygote reply with a payload that runs code when unpickled
+
+    Expected behavior: SHOULD FAIL
+    - The game process reads the zygote's replies as plain data only
+    - The forged reply is rejected and the bid counts as failed
+    """
+
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
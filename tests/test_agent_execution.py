@@ -0,0 +1,1086 @@
+"""
+Agent Execution Test Suite
+Tests scheduling and timing behavior of isolated agent calls
+"""
+
+import sys
+import os
+import time
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+import src.agent_manager as agent_manager_module
+from src.agent_manager import AgentManager, ISOLATION_MODES
+from src.auction_engine import AuctionEngine
+from src.config import T_AUCTION_ROUNDS
+from src.game_manager import GameManager
+from src.shared_prepared import SharedPrepared
+from src.zygote import START_METHODS
+from src.valuation_generator import ValuationGenerator
+
+
+SLEEPY_AGENT = '''
+import time
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        time.sleep({sleep})
+        return self.valuation_vector.get(item_id, 0.0)
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+SLOW_UPDATE_AGENT = '''
+import time
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.updates = []
+
+    def bidding_function(self, item_id):
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        time.sleep({sleep})
+        self.updates.append(item_id)
+'''
+
+
+SLOW_START_AGENT = '''
+import time
+
+time.sleep({load})
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        time.sleep({init})
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        end = time.process_time() + {busy}
+        while time.process_time() < end:
+            pass
+        time.sleep({sleep})
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+CPU_HOG_AGENT = '''
+import time
+
+def spin(seconds):
+    end = time.process_time() + seconds
+    while time.process_time() < end:
+        pass
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.bids = 0
+
+    def bidding_function(self, item_id):
+        self.bids += 1
+        if item_id == 'item_hog':
+            spin(5.0)
+        elif item_id == 'item_sneaky':
+            try:
+                spin(5.0)
+            except BaseException:
+                pass
+        elif item_id == 'item_nap':
+            time.sleep(0.8)
+        else:
+            spin(0.1)
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+MEMORY_HOG_AGENT = '''
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        if item_id == 'item_hog':
+            self.hoard = bytearray(400 * 1024 * 1024)
+        elif item_id == 'item_big':
+            self.scratch = bytearray(100 * 1024 * 1024)
+            del self.scratch
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        if item_id == 'item_hog':
+            self.hoard = bytearray(400 * 1024 * 1024)
+'''
+
+
+ANYTIME_AGENT = '''
+import time
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.first_remaining = None
+
+    def bidding_function(self, item_id):
+        if item_id == 'item_search':
+            for bid in (1.0, 2.0, 3.456):
+                self.post_bid(bid)
+            time.sleep(5.0)
+        elif item_id == 'item_spin':
+            self.post_bid(4.0)
+            while True:
+                pass
+        elif item_id == 'item_silent':
+            time.sleep(5.0)
+        elif item_id == 'item_budgeted':
+            self.first_remaining = self.time_remaining()
+            while self.time_remaining() > 0.3:
+                time.sleep(0.02)
+            return 5.0
+        return 1.0
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+COUNTING_AGENT = '''
+import time
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.updates_seen = []
+
+    def bidding_function(self, item_id):
+        if item_id == 'item_error':
+            raise RuntimeError('bid failed')
+        return float(len(self.updates_seen))
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        if item_id == 'item_slow':
+            time.sleep(10)
+        if item_id == 'item_error':
+            raise RuntimeError('update failed')
+        self.updates_seen.append(item_id)
+'''
+
+
+PROBE_AGENT = '''
+import os
+import sys
+
+NUMPY_PRELOADED = 'numpy' in sys.modules
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def bidding_function(self, item_id):
+        if item_id == 'item_kill_parent':
+            os.kill(os.getppid(), 9)
+        if item_id == 'item_numpy':
+            return float(NUMPY_PRELOADED)
+        return float(os.getppid())
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+IMPORT_COUNTING_AGENT = '''
+import os
+
+with open({log!r}, 'a') as log:
+    log.write(f"{{os.getpid()}}\\n")
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.rounds = 0
+
+    def bidding_function(self, item_id):
+        return float(self.rounds)
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        self.rounds += 1
+'''
+
+
+ARRAY_AGENT = '''
+import numpy as np
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.weights = np.arange(1000, dtype=float)
+        self.price_history = []
+
+    def bidding_function(self, item_id):
+        return float(self.weights.sum() + len(self.price_history))
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        self.price_history.append(price_paid)
+        if item_id == 'item_drop':
+            del self.weights
+'''
+
+
+VALUATION_PROBE_AGENT = '''
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.total_value = sum(valuation_vector.values())
+
+    def bidding_function(self, item_id):
+        if item_id == 'item_type':
+            return float(isinstance(self.valuation_vector, dict))
+        if item_id == 'item_write':
+            self.valuation_vector['item_0'] = 100.0
+        return self.valuation_vector[item_id] + self.total_value
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        pass
+'''
+
+
+ALL_IN_AGENT = '''
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def _log(self, line):
+        with open({log!r}, 'a') as log:
+            log.write(f"{{self.team_id}} {{line}}\\n")
+
+    def bidding_function(self, item_id):
+        self._log(f"bid {{item_id}}")
+        return {bid}
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        self._log(f"update {{item_id}}")
+'''
+
+
+PLAN_AGENT = ALL_IN_AGENT + '''
+    def bidding_plan(self, remaining_items):
+        self._log(f"plan {{len(remaining_items)}}")
+        return {plan}
+'''
+
+
+PREPARE_AGENT = '''
+import time
+
+class BiddingAgent:
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+
+    def _log(self, line):
+        with open({log!r}, 'a') as log:
+            log.write(f"{{self.team_id}} {{line}}\\n")
+
+    def prepare(self):
+        self._log("prepare")
+        time.sleep({sleep})
+        return {{'squares': [i * i for i in range(100)]}}
+
+    def bidding_function(self, item_id):
+        self._log(f"bid {{item_id}}")
+        if self.prepared is None:
+            return 0.5
+        return float(self.prepared['squares'][3])
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        self._log(f"update {{item_id}}")
+'''
+
+
+STATELESS_AGENT = '''
+class BiddingAgent:
+    stateless = {stateless}
+
+    def __init__(self, team_id, valuation_vector, budget, opponent_teams):
+        self.team_id = team_id
+        self.valuation_vector = valuation_vector
+        self.budget = budget
+        self.items_won = []
+
+    def _log(self, line):
+        with open({log!r}, 'a') as log:
+            log.write(f"{{self.team_id}} {{line}}\\n")
+
+    def bidding_function(self, item_id):
+        self._log(f"bid {{item_id}} {{self.budget:.2f}} {{','.join(self.items_won) or '-'}}")
+        return {bid}
+
+    def update_after_each_round(self, item_id, winning_team, price_paid):
+        self._log(f"update {{item_id}}")
+        if winning_team == self.team_id:
+            self.budget -= price_paid
+            self.items_won.append(item_id)
+'''
+
+
+def write_agent(directory: str, name: str, source: str) -> str:
+    """Write an agent source file and return its path"""
+    path = os.path.join(directory, f'{name}.py')
+    with open(path, 'w') as f:
+        f.write(source)
+    return path
+
+
+class AgentFilesMixin:
+    """Temporary directory, call log and valuations for tests that write agents"""
+
+    AGENT = None  # Source written to self.agent_file, if set
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.call_log = os.path.join(self.temp_dir, 'calls.log')
+        self.valuations = {f'item_{i}': float(i + 1) for i in range(20)}
+        if self.AGENT is not None:
+            self.agent_file = write_agent(self.temp_dir, 'agent', self.AGENT)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_game(self, team_agents, isolation_mode, timeout_seconds=2.0):
+        """
+        Run one game with a fresh call log and return its GameManager.
+
+        Args:
+            team_agents: Dictionary mapping team_id to agent source
+            isolation_mode: Agent isolation mode
+            timeout_seconds: Bid timeout
+        """
+        open(self.call_log, 'w').close()
+        game_manager = GameManager(
+            stage=1,
+            arena_id='test',
+            game_number=1,
+            valuation_generator=ValuationGenerator(random_seed=3),
+            auction_engine=AuctionEngine(),
+            agent_manager=AgentManager(timeout_seconds=timeout_seconds, isolation_mode=isolation_mode)
+        )
+        game_manager.run_game({team_id: write_agent(self.temp_dir, team_id, source)
+                               for team_id, source in team_agents.items()})
+        return game_manager
+
+    def calls(self, team_id):
+        """Calls a team's agent wrote to the call log, each as a list of words"""
+        with open(self.call_log) as f:
+            return [line.split()[1:] for line in f if line.split()[0] == team_id]
+
+    def load_agents(self, agent_manager, sources):
+        """Register one agent per source as team_0, team_1, ... and return them by team id"""
+        agents = {}
+        for i, source in enumerate(sources):
+            team_id = f'team_{i}'
+            path = write_agent(self.temp_dir, team_id, source)
+            agents[team_id] = agent_manager.load_agent(path, team_id, self.valuations, 60.0, [])
+        return agents
+
+
+class TestConcurrentBidCollection(AgentFilesMixin, unittest.TestCase):
+    """Test that bids for a round are collected in parallel"""
+
+    def test_round_latency(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode=isolation_mode)
+                agents = self.load_agents(agent_manager, [SLEEPY_AGENT.format(sleep=sleep)
+                                                          for sleep in [0.5, 0.5, 0.5, 0.5, 5]])
+
+                start = time.time()
+                results = agent_manager.execute_bids_concurrently(agents, 'item_3')
+                elapsed = time.time() - start
+                agent_manager.shutdown()
+
+                print(f"\n{isolation_mode}: round took {elapsed:.2f}s")
+
+                # Roughly the slowest agent (the timeout), not the sum of all agents
+                self.assertLess(elapsed, 2.5)
+                self.assertEqual(list(results.keys()), list(agents.keys()))
+                for team_id in ['team_0', 'team_1', 'team_2', 'team_3']:
+                    bid, exec_time, error = results[team_id]
+                    self.assertIsNone(error)
+                    self.assertAlmostEqual(bid, 4.0, places=2)
+                    self.assertGreaterEqual(exec_time, 0.5)
+                self.assertEqual(results['team_4'], (0.0, 1.0, "Timeout"))
+
+
+class TestBroadcastUpdates(AgentFilesMixin, unittest.TestCase):
+    """Test that round results are delivered to all agents in parallel"""
+
+    def test_broadcast_latency(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode=isolation_mode)
+                agents = self.load_agents(agent_manager, [SLOW_UPDATE_AGENT.format(sleep=sleep)
+                                                          for sleep in [0.5, 0.5, 0.5, 0.5, 5]])
+                agent_manager.execute_bids_concurrently(agents, 'item_0')
+
+                start = time.time()
+                results = agent_manager.broadcast_round_result(agents, 'item_0', 'team_0', 1.0)
+                elapsed = time.time() - start
+                agent_manager.shutdown()
+
+                print(f"\n{isolation_mode}: broadcast took {elapsed:.2f}s")
+
+                # One timeout window for all agents, not one per agent
+                self.assertLess(elapsed, 2.5)
+                self.assertEqual(results, {'team_0': None, 'team_1': None, 'team_2': None,
+                                           'team_3': None, 'team_4': "Timeout"})
+                self.assertEqual(agent_manager.get_agent_state('team_0')['updates'], ['item_0'])
+                self.assertEqual(agent_manager.get_agent_state('team_4')['updates'], [])
+
+
+class TestTimeoutAccounting(AgentFilesMixin, unittest.TestCase):
+    """Test that the timeout only covers the agent's own construction and bid"""
+
+    def _bid(self, agent_manager, load=0.0, init=0.0, busy=0.0, sleep=0.0):
+        path = write_agent(self.temp_dir, 'slow_start', SLOW_START_AGENT.format(
+            load=load, init=init, busy=busy, sleep=sleep))
+        agent = agent_manager.load_agent(path, 'team_a', self.valuations, 60.0, [])
+        try:
+            return agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        finally:
+            agent_manager.shutdown()
+
+    def test_module_execution_charged(self):
+        # Module-level agent code runs on the call's clock, like the call itself
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode=isolation_mode)
+                self.assertEqual(self._bid(agent_manager, load=1.2), (0.0, 1.0, "Timeout"))
+
+    def test_startup_not_charged(self):
+        # An agent zygote executes the module once, before any call starts
+        agent_manager = AgentManager(timeout_seconds=1.0, start_method='agent_zygote')
+        bid, exec_time, error = self._bid(agent_manager, load=1.2)
+
+        self.assertIsNone(error)
+        self.assertEqual(bid, 1.0)
+        self.assertLess(exec_time, 0.5)
+        stats = agent_manager.get_execution_stats()['team_a']
+        self.assertEqual(stats['startups'], 1)
+        self.assertGreaterEqual(stats['startup_time'], 1.2)
+
+    def test_startup_allowance(self):
+        agent_manager = AgentManager(timeout_seconds=1.0, start_method='agent_zygote',
+                                     startup_seconds=0.5)
+        self.assertEqual(self._bid(agent_manager, load=1.2), (0.0, 0.0, "Startup timeout"))
+
+    def test_construction_charged(self):
+        agent_manager = AgentManager(timeout_seconds=1.0)
+        self.assertEqual(self._bid(agent_manager, init=0.6, sleep=0.6), (0.0, 1.0, "Timeout"))
+
+    def test_agent_and_cpu_time_recorded(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, isolation_mode='persistent')
+        bid, exec_time, error = self._bid(agent_manager, busy=0.2, sleep=0.2)
+
+        self.assertIsNone(error)
+        self.assertGreaterEqual(exec_time, 0.4)
+        stats = agent_manager.get_execution_stats()['team_a']
+        self.assertEqual(stats['agent_calls'], 1)
+        self.assertAlmostEqual(stats['agent_time'], exec_time)
+        self.assertGreaterEqual(stats['cpu_time'], 0.2)
+        self.assertLess(stats['cpu_time'], exec_time)
+
+
+class TestCpuTimeClock(AgentFilesMixin, unittest.TestCase):
+    """Test the timeout measured in CPU seconds of the worker"""
+
+    AGENT = CPU_HOG_AGENT
+
+    def test_cpu_clock(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=0.5, isolation_mode=isolation_mode,
+                                             timeout_clock='cpu')
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+                # Waiting does not use CPU time: not a timeout, and not charged
+                bid, exec_time, error = agent_manager.execute_bid_with_timeout(agent, 'item_nap')
+                self.assertEqual((bid, error), (1.0, None))
+                self.assertLess(exec_time, 0.3)
+
+                # The worker stops the agent at its CPU limit, long before the wall-clock backstop
+                start = time.monotonic()
+                result = agent_manager.execute_bid_with_timeout(agent, 'item_hog')
+                self.assertEqual(result, (0.0, 0.5, "Timeout"))
+                self.assertLess(time.monotonic() - start, 2.0)
+
+                # Catching the limit does not help
+                self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_sneaky'),
+                                 (0.0, 0.5, "Timeout"))
+
+                # State of the timed-out calls was not kept; the agent still bids
+                bid, exec_time, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+                self.assertEqual((bid, error), (1.0, None))
+                self.assertGreaterEqual(exec_time, 0.1)
+                self.assertEqual(agent_manager.get_agent_state('team_a')['bids'], 2)
+
+                usage = agent_manager.get_call_usage('team_a')
+                self.assertEqual([call['phase'] for call in usage], ['bid', 'bid'])
+                self.assertAlmostEqual(usage[1]['cpu'], exec_time)
+                self.assertGreaterEqual(usage[1]['utime'] + usage[1]['stime'], 0.09)
+                self.assertGreater(usage[1]['max_rss_kb'], 0)
+                stats = agent_manager.get_execution_stats()['team_a']
+                self.assertEqual(stats['max_rss_kb'], max(call['max_rss_kb'] for call in usage))
+
+                agent_manager.shutdown()
+
+    def test_wall_clock_backstop(self):
+        agent_manager = AgentManager(timeout_seconds=0.1, timeout_clock='cpu')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_nap'),
+                         (0.0, 0.1, "Timeout"))
+        agent_manager.shutdown()
+
+    def test_unknown_clock_rejected(self):
+        with self.assertRaises(ValueError):
+            AgentManager(timeout_clock='gpu')
+
+
+class TestMemoryLimit(AgentFilesMixin, unittest.TestCase):
+    """Test that workers enforce the memory limit and record peak RSS"""
+
+    AGENT = MEMORY_HOG_AGENT
+
+    def test_memory_limit(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=2.0, isolation_mode=isolation_mode,
+                                             memory_limit_mb=256)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+                # Within the limit; the peak RSS is recorded
+                self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_big')[::2],
+                                 (1.0, None))
+                self.assertGreater(agent_manager.get_execution_stats()['team_a']['max_rss_kb'],
+                                   100 * 1024)
+
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_hog')
+                self.assertEqual((bid, error), (0.0, "MemoryLimit"))
+
+                # Update phases report the limit on their own; the bid still runs
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_hog', '', 0.0, 'item_1')
+                self.assertEqual((bid, bid_error, update_error), (1.0, None, "MemoryLimit"))
+                self.assertNotIn('hoard', agent_manager.get_agent_state('team_a'))
+
+                agent_manager.shutdown()
+
+    def test_memory_limit_agent_zygote(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='agent_zygote',
+                                     memory_limit_mb=256)
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_0')[::2], (1.0, None))
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_hog')[::2],
+                         (0.0, "MemoryLimit"))
+        agent_manager.shutdown()
+
+
+class TestAnytimeBidding(AgentFilesMixin, unittest.TestCase):
+    """Test posted bids used after a timeout and the time_remaining helper"""
+
+    AGENT = ANYTIME_AGENT
+
+    def test_anytime(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode=isolation_mode)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+                # The last posted bid replaces the timed-out bid
+                self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_search'),
+                                 (3.46, 1.0, "Timeout (posted bid used)"))
+
+                # A bid posted in an earlier call is not reused
+                self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_silent'),
+                                 (0.0, 1.0, "Timeout"))
+
+                # Agents that watch the clock finish in time
+                bid, exec_time, error = agent_manager.execute_bid_with_timeout(agent, 'item_budgeted')
+                self.assertEqual((bid, error), (5.0, None))
+                self.assertLess(exec_time, 1.0)
+                first_remaining = agent_manager.get_agent_state('team_a')['first_remaining']
+                self.assertTrue(0.5 < first_remaining <= 1.0)
+
+                # Also for the bid phase of a fused call
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_0', '', 0.0, 'item_search')
+                self.assertEqual((bid, bid_error, update_error),
+                                 (3.46, "Timeout (posted bid used)", None))
+
+                # The helpers are not part of the agent state
+                self.assertNotIn('post_bid', agent_manager.get_agent_state('team_a'))
+                agent_manager.shutdown()
+
+    def test_anytime_cpu_clock(self):
+        agent_manager = AgentManager(timeout_seconds=0.5, timeout_clock='cpu')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_spin'),
+                         (4.0, 0.5, "Timeout (posted bid used)"))
+        agent_manager.shutdown()
+
+
+class TestFusedUpdateAndBid(AgentFilesMixin, unittest.TestCase):
+    """Test the combined update-then-bid round trip"""
+
+    AGENT = COUNTING_AGENT
+
+    def test_phases(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode=isolation_mode)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+                agent_manager.execute_bid_with_timeout(agent, 'item_0')
+
+                # Update always precedes the bid
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_0', 'team_a', 1.0, 'item_1')
+                self.assertEqual((bid, bid_error, update_error), (1.0, None, None))
+
+                # A failed update is attributed to the update phase; the bid still runs on the old state
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_error', '', 0.0, 'item_2')
+                self.assertEqual((bid, bid_error), (1.0, None))
+                self.assertTrue(update_error.startswith("Error: "))
+
+                # An update timeout does not cost the agent its bid
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_slow', '', 0.0, 'item_3')
+                self.assertEqual((bid, bid_error, update_error), (1.0, None, "Timeout"))
+
+                # A failed bid is attributed to the bid phase; the update is kept
+                bid, _, bid_error, update_error = agent_manager.execute_update_and_bid(
+                    agent, 'item_4', '', 0.0, 'item_error')
+                self.assertEqual((bid, update_error), (0.0, None))
+                self.assertTrue(bid_error.startswith("Error: "))
+                self.assertEqual(agent_manager.get_agent_state('team_a')['updates_seen'],
+                                 ['item_0', 'item_4'])
+
+                agent_manager.shutdown()
+
+
+class TestZygoteWorkers(AgentFilesMixin, unittest.TestCase):
+    """Test workers forked from the pre-warmed zygote"""
+
+    AGENT = PROBE_AGENT
+
+    def test_workers_fork_from_warm_zygote(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='zygote')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+        # The worker's parent is the zygote, not this process
+        parent_pid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        self.assertIsNone(error)
+        self.assertNotEqual(int(parent_pid), os.getpid())
+
+        # Allowlisted modules are already imported when the agent module runs
+        preloaded, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_numpy')
+        self.assertEqual((preloaded, error), (1.0, None))
+
+    def test_zygote_restarts_after_agent_kills_it(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='zygote')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+        first_pid, _, _ = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        agent_manager.execute_bid_with_timeout(agent, 'item_kill_parent')
+
+        second_pid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        self.assertIsNone(error)
+        self.assertNotEqual(first_pid, second_pid)
+
+
+class TestAgentZygote(AgentFilesMixin, unittest.TestCase):
+    """Test per-agent zygotes that execute the agent module once"""
+
+    def setUp(self):
+        super().setUp()
+        self.agent_file = write_agent(self.temp_dir, 'agent',
+                                      IMPORT_COUNTING_AGENT.format(log=self.call_log))
+
+    def _imports(self):
+        with open(self.call_log) as f:
+            return f.read().split()
+
+    def test_module_executed_once_per_agent(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='agent_zygote')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+        for round_number in range(5):
+            bid, _, error = agent_manager.execute_bid_with_timeout(agent, f'item_{round_number}')
+            self.assertEqual((bid, error), (float(round_number), None))
+            self.assertTrue(agent_manager.update_agent_after_round(agent, f'item_{round_number}', '', 0.0))
+
+        # One validation import in this process, one in the agent's zygote
+        self.assertEqual(len(self._imports()), 2)
+        self.assertEqual(self._imports()[0], str(os.getpid()))
+
+        # State still travels between calls exactly as with a fresh process per call
+        self.assertEqual(agent_manager.get_agent_state('team_a')['rounds'], 5)
+        agent_manager.shutdown()
+        self.assertEqual(agent_manager.agent_zygotes, {})
+
+    def test_reregistration_restarts_zygote(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='agent_zygote')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        agent_manager.execute_bid_with_timeout(agent, 'item_0')
+
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        agent_manager.shutdown()
+
+        # Validation and zygote import for each registration
+        self.assertEqual(len(self._imports()), 4)
+
+
+class TestAgentCodeCache(AgentFilesMixin, unittest.TestCase):
+    """Test the content-hash keyed compiled-code cache"""
+
+    AGENT = SLEEPY_AGENT.format(sleep=0)
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(agent_manager_module._agent_code_cache.clear)
+
+    def test_compiled_once(self):
+        code = agent_manager_module._get_agent_code(self.agent_file)
+        with mock.patch('builtins.compile', side_effect=AssertionError('recompiled')):
+            cached = agent_manager_module._get_agent_code(self.agent_file)
+        self.assertIs(cached, code)
+
+    def test_resubmission_invalidates_cache(self):
+        agent_manager = AgentManager(timeout_seconds=2.0, start_method='fork')
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_3')
+        self.assertEqual((bid, error), (4.0, None))
+
+        write_agent(self.temp_dir, 'agent', self.AGENT.replace('0.0)', '0.0) + 1'))
+        agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+        bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_3')
+        self.assertEqual((bid, error), (5.0, None))
+        agent_manager.shutdown()
+
+    def test_workers_run_registered_code(self):
+        """Workers run the code compiled at registration, whatever is on disk later"""
+        for start_method in START_METHODS:
+            with self.subTest(start_method=start_method):
+                write_agent(self.temp_dir, 'agent', self.AGENT)
+                agent_manager = AgentManager(timeout_seconds=2.0, start_method=start_method)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+                write_agent(self.temp_dir, 'agent', self.AGENT.replace('0.0)', '0.0) + 1'))
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_3')
+                agent_manager.shutdown()
+                self.assertEqual((bid, error), (4.0, None))
+
+
+class TestStateDelta(AgentFilesMixin, unittest.TestCase):
+    """Test delta-encoded agent state transfer"""
+
+    AGENT = ARRAY_AGENT
+
+    def test_codec_sends_only_changes(self):
+        import numpy as np
+
+        class Agent:
+            pass
+
+        agent = Agent()
+        agent.weights = np.arange(10.0)
+        agent.history = [1.0]
+        agent.helper = print
+
+        changed, removed = agent_manager_module._encode_agent_state(agent, None)
+        self.assertEqual((sorted(changed), removed), (['history', 'weights'], []))
+        weights = agent_manager_module._decode_state_value(changed['weights'])
+        np.testing.assert_array_equal(weights, np.arange(10.0))
+        self.assertTrue(weights.flags.writeable)
+        state = agent_manager_module._apply_state_delta(None, (changed, removed))
+
+        agent.history.append(2.0)
+        del agent.weights
+        changed, removed = agent_manager_module._encode_agent_state(agent, state)
+        self.assertEqual((sorted(changed), removed), (['history'], ['weights']))
+        state = agent_manager_module._apply_state_delta(state, (changed, removed))
+        self.assertEqual(agent_manager_module._decode_state_value(state['history']), [1.0, 2.0])
+
+    def test_transfer(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=2.0, isolation_mode=isolation_mode)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+                self.assertEqual((bid, error), (499500.0, None))
+                first_reply = agent_manager.transfer_stats['team_a']['bytes_received']
+                self.assertGreater(first_reply, 8000)
+
+                # Only the price history changes; the array and valuations are not resent
+                for round_number in range(1, 4):
+                    self.assertTrue(agent_manager.update_agent_after_round(agent, 'item_0', '', 1.0))
+                    bid, _, error = agent_manager.execute_bid_with_timeout(agent, f'item_{round_number}')
+                    self.assertEqual((bid, error), (499500.0 + round_number, None))
+                stats = agent_manager.get_transfer_stats()['team_a']
+                self.assertEqual(stats['calls'], 7)
+                self.assertLess(stats['bytes_received'] - first_reply, 500)
+                self.assertGreater(stats['full_state_bytes'], 7 * 8000)
+
+                # Removed attributes are dropped from the stored state
+                self.assertTrue(agent_manager.update_agent_after_round(agent, 'item_drop', '', 1.0))
+                self.assertNotIn('weights', agent_manager.agent_states['team_a'])
+                self.assertEqual(agent_manager.get_agent_state('team_a')['price_history'], [1.0] * 4)
+                agent_manager.shutdown()
+
+
+class TestSharedValuations(AgentFilesMixin, unittest.TestCase):
+    """Test valuations handed to workers through shared memory"""
+
+    AGENT = VALUATION_PROBE_AGENT
+
+    def test_read_only_mapping(self):
+        for start_method, isolation_mode in [('zygote', 'per_call'), ('agent_zygote', 'per_call'),
+                                             ('fork', 'persistent')]:
+            with self.subTest(start_method=start_method, isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=2.0, isolation_mode=isolation_mode,
+                                             start_method=start_method)
+                agent = agent_manager.load_agent(self.agent_file, 'team_a', self.valuations, 60.0, [])
+
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_3')
+                self.assertEqual((bid, error), (214.0, None))
+                self.assertIn('team_a', agent_manager.shared_valuations)
+
+                # A mapping, not a dict, and writes fail
+                is_dict, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_type')
+                self.assertEqual((is_dict, error), (0.0, None))
+                _, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_write')
+                self.assertIn('does not support item assignment', error)
+
+                # The valuations are not carried in the agent state
+                self.assertNotIn('valuation_vector', agent_manager.agent_states['team_a'])
+                self.assertEqual(agent_manager.get_agent_state('team_a')['total_value'], 210.0)
+
+                agent_manager.shutdown()
+                self.assertEqual(agent_manager.shared_valuations, {})
+
+    def test_block_has_no_name(self):
+        from src.shared_valuations import SharedValuations
+
+        before = set(os.listdir('/dev/shm'))
+        shared = SharedValuations.create(self.valuations)
+        self.assertEqual(set(os.listdir('/dev/shm')), before)
+        self.assertEqual(dict(shared.attach()), self.valuations)
+        shared.close()
+
+
+class TestBudgetExhaustion(AgentFilesMixin, unittest.TestCase):
+    """Test that teams without budget are not called any more"""
+
+    def test_exhausted_team_skipped(self):
+        # Both big bidders bid their whole budget, so the first winner pays it all
+        team_agents = {team_id: ALL_IN_AGENT.format(log=self.call_log, bid=bid)
+                       for team_id, bid in [('team_a', 60.0), ('team_b', 60.0), ('team_c', 0.5)]}
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                game_manager = self.run_game(team_agents, isolation_mode)
+                first_winner = game_manager.auction_log[0].winner_id
+                self.assertIn(first_winner, ('team_a', 'team_b'))
+                self.assertEqual(game_manager.budgets[first_winner], 0.0)
+
+                # One bid call, then zero bids that cost no time
+                calls = self.calls(first_winner)
+                self.assertEqual([call for call in calls if call[0] == 'bid'],
+                                 [['bid', game_manager.auction_sequence[0]]])
+                for round_result in game_manager.auction_log[1:]:
+                    self.assertEqual(round_result.all_bids[first_winner], 0.0)
+                    self.assertEqual(round_result.execution_times[first_winner], 0.0)
+                    self.assertNotIn(first_winner, round_result.agent_errors)
+
+                # Every round result still reaches the agent, in order
+                self.assertEqual([call[1] for call in calls if call[0] == 'update'],
+                                 game_manager.auction_sequence)
+                self.assertEqual(game_manager.deferred_updates, {})
+
+                # Teams with budget left keep bidding every round
+                self.assertEqual(len([call for call in self.calls('team_c') if call[0] == 'bid']),
+                                 T_AUCTION_ROUNDS)
+
+
+class TestBiddingPlan(AgentFilesMixin, unittest.TestCase):
+    """Test that agents with a bidding plan are called once per game"""
+
+    def _team_agents(self, plan):
+        return {'team_plan': PLAN_AGENT.format(log=self.call_log, bid=1.0, plan=plan),
+                'team_b': ALL_IN_AGENT.format(log=self.call_log, bid=0.5)}
+
+    def test_plan_used(self):
+        team_agents = self._team_agents('dict.fromkeys(remaining_items, 2.345)')
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                game_manager = self.run_game(team_agents, isolation_mode)
+
+                # One plan call for all items, no per-round bids
+                calls = self.calls('team_plan')
+                self.assertEqual(calls[0], ['plan', str(len(game_manager.valuations['team_plan']))])
+                self.assertEqual([call for call in calls if call[0] == 'bid'], [])
+                for round_result in game_manager.auction_log:
+                    self.assertEqual(round_result.all_bids['team_plan'], 2.35)
+                    self.assertNotIn('team_plan', round_result.agent_errors)
+                for round_result in game_manager.auction_log[1:]:
+                    self.assertEqual(round_result.execution_times['team_plan'], 0.0)
+
+                # Every round result still reaches the agent, in order
+                self.assertEqual([call[1] for call in calls if call[0] == 'update'],
+                                 game_manager.auction_sequence)
+                self.assertEqual(len([call for call in self.calls('team_b') if call[0] == 'bid']),
+                                 T_AUCTION_ROUNDS)
+
+    def test_declined_plan_falls_back(self):
+        game_manager = self.run_game(self._team_agents('None'), 'persistent')
+
+        calls = self.calls('team_plan')
+        self.assertEqual(len([call for call in calls if call[0] == 'bid']), T_AUCTION_ROUNDS)
+        self.assertEqual(game_manager.auction_log[0].all_bids['team_plan'], 1.0)
+
+    def test_incomplete_plan_falls_back(self):
+        game_manager = self.run_game(self._team_agents('{}'), 'per_call')
+
+        calls = self.calls('team_plan')
+        self.assertEqual(len([call for call in calls if call[0] == 'bid']), T_AUCTION_ROUNDS)
+        self.assertIn('bidding_plan has no bid', game_manager.auction_log[0].agent_errors['team_plan']['plan'])
+
+
+class TestPrepareHook(AgentFilesMixin, unittest.TestCase):
+    """Test the once-per-game prepare() hook and its cached result"""
+
+    def test_prepared(self):
+        team_agents = {'team_prep': PREPARE_AGENT.format(log=self.call_log, sleep=1.2),
+                       'team_b': ALL_IN_AGENT.format(log=self.call_log, bid=0.5)}
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                game_manager = self.run_game(team_agents, isolation_mode, timeout_seconds=1.0)
+
+                # Prepared once, under its own time limit (longer than a bid's)
+                self.assertEqual(list(game_manager.prepare_results), ['team_prep'])
+                prepare_time, prepare_error = game_manager.prepare_results['team_prep']
+                self.assertIsNone(prepare_error)
+                self.assertGreaterEqual(prepare_time, 1.2)
+                self.assertEqual([call for call in self.calls('team_prep') if call[0] == 'prepare'],
+                                 [['prepare']])
+
+                # Every bid sees the cached result, which is not part of the agent state
+                for round_result in game_manager.auction_log:
+                    self.assertEqual(round_result.all_bids['team_prep'], 9.0)
+                    self.assertNotIn('team_prep', round_result.agent_errors)
+                self.assertNotIn('prepared', game_manager.agent_manager.get_agent_state('team_prep'))
+
+    def test_prepare_timeout(self):
+        agent_manager = AgentManager(timeout_seconds=1.0, prepare_seconds=0.5)
+        path = write_agent(self.temp_dir, 'team_prep', PREPARE_AGENT.format(log=self.call_log, sleep=1.2))
+        agent = agent_manager.load_agent(path, 'team_a', self.valuations, 60.0, [])
+
+        self.assertEqual(agent_manager.prepare_agents({'team_a': agent}), {'team_a': (0.5, "Timeout")})
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_0')[::2], (0.5, None))
+        agent_manager.shutdown()
+
+    def test_prepared_shipped_once(self):
+        agent_manager = AgentManager(timeout_seconds=1.0)
+        path = write_agent(self.temp_dir, 'team_prep', PREPARE_AGENT.format(log=self.call_log, sleep=0))
+        agent = agent_manager.load_agent(path, 'team_a', self.valuations, 60.0, [])
+        agent_manager.prepare_agents({'team_a': agent})
+
+        # Calls get the sealed block, not the pickled result
+        block = agent_manager._worker_args('team_a')[-1]
+        self.assertIsInstance(block, SharedPrepared)
+        with self.assertRaises(PermissionError):
+            os.pwrite(block.fd, b'\0', 0)
+        self.assertEqual(agent_manager.execute_bid_with_timeout(agent, 'item_0')[::2], (9.0, None))
+
+        agent_manager.shutdown()
+        self.assertEqual(agent_manager.prepared, {})
+
+
+class TestStatelessAgents(AgentFilesMixin, unittest.TestCase):
+    """Test that stateless agents get one call per round with tracked budget and items"""
+
+    def _run_game(self, isolation_mode, stateless):
+        team_agents = {team_id: STATELESS_AGENT.format(log=self.call_log, bid=bid, stateless=stateless)
+                       for team_id, bid in [('team_a', 5.0), ('team_b', 3.0)]}
+        game_manager = self.run_game(team_agents, isolation_mode)
+        return game_manager, {team_id: self.calls(team_id) for team_id in team_agents}
+
+    def test_stateless(self):
+        for isolation_mode in ISOLATION_MODES:
+            with self.subTest(isolation_mode=isolation_mode):
+                stateless_game, stateless_calls = self._run_game(isolation_mode, True)
+                stateful_game, stateful_calls = self._run_game(isolation_mode, False)
+
+                # Updates are not run, yet every bid sees the same budget and items
+                for team_id, calls in stateless_calls.items():
+                    self.assertEqual(calls, [call for call in stateful_calls[team_id]
+                                             if call[0] == 'bid'])
+                    self.assertEqual(len(calls), T_AUCTION_ROUNDS)
+                self.assertEqual(stateless_game.budgets, stateful_game.budgets)
+                for round_result in stateless_game.auction_log:
+                    self.assertEqual(round_result.agent_errors, {})
+
+    def test_invalid_declaration_rejected(self):
+        path = write_agent(self.temp_dir, 'invalid', STATELESS_AGENT.format(
+            log=self.call_log, bid=1.0, stateless="'yes'"))
+        agent = AgentManager().load_agent(path, 'team_a', {'item_0': 1.0}, 60.0, [])
+        self.assertIsNone(agent)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
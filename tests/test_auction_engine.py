@@ -0,0 +1,83 @@
+"""
+Auction Engine Test Suite
+Tests winner determination for single and batched auctions
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.auction_engine import AuctionEngine
+
+
+class TestDetermineWinner(unittest.TestCase):
+    """Test second-price winner determination"""
+
+    def setUp(self):
+        self.engine = AuctionEngine(rng=np.random.default_rng(0))
+
+    def test_second_price(self):
+        bids = {'a': 5.0, 'b': 9.0, 'c': 0.0, 'd': 7.5}
+        self.assertEqual(self.engine.determine_winner(bids), ('b', 7.5, []))
+
+    def test_single_and_no_bidders(self):
+        self.assertEqual(self.engine.determine_winner({'a': 3.0, 'b': 0.0}), ('a', 0.0, []))
+        self.assertEqual(self.engine.determine_winner({'a': 0.0, 'b': -1.0}), (None, 0.0, []))
+        self.assertEqual(self.engine.determine_winner({}), (None, 0.0, []))
+
+    def test_tie_pays_tied_amount(self):
+        winner, price, tied = self.engine.determine_winner({'a': 4.0, 'b': 8.0, 'c': 8.0})
+        self.assertIn(winner, ['b', 'c'])
+        self.assertEqual(price, 8.0)
+        self.assertEqual(tied, ['b', 'c'])
+
+
+class TestDetermineWinnersBatch(unittest.TestCase):
+    """Test that the batched kernel agrees with determine_winner"""
+
+    def setUp(self):
+        self.engine = AuctionEngine()
+
+    def test_matches_single_auctions(self):
+        rng = np.random.default_rng(1)
+        # Coarse bids so that ties, zero bids and single bidders all occur
+        bid_matrix = rng.integers(-2, 6, size=(2000, 5)).astype(float)
+
+        winners, prices, ties = self.engine.determine_winners_batch(bid_matrix, np.random.default_rng(2))
+
+        for row, winner, price, tie in zip(bid_matrix, winners, prices, ties):
+            bids = {index: bid for index, bid in enumerate(row)}
+            expected_winner, expected_price, tied = self.engine.determine_winner(bids)
+            self.assertEqual(price, expected_price)
+            self.assertEqual(tie, bool(tied))
+            if tied:
+                self.assertIn(winner, tied)
+            else:
+                self.assertEqual(winner, -1 if expected_winner is None else expected_winner)
+
+    def test_tie_breaks_use_supplied_generator(self):
+        bid_matrix = np.full((500, 4), 3.0)
+
+        first, _, ties = self.engine.determine_winners_batch(bid_matrix, np.random.default_rng(7))
+        second, _, _ = self.engine.determine_winners_batch(bid_matrix, np.random.default_rng(7))
+
+        self.assertTrue(ties.all())
+        np.testing.assert_array_equal(first, second)
+        self.assertEqual(set(first.tolist()), {0, 1, 2, 3})
+
+    def test_single_column(self):
+        winners, prices, ties = self.engine.determine_winners_batch(np.array([[2.0], [0.0]]))
+        np.testing.assert_array_equal(winners, [0, -1])
+        np.testing.assert_array_equal(prices, [0.0, 0.0])
+        self.assertFalse(ties.any())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
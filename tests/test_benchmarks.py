@@ -0,0 +1,130 @@
+"""
+Benchmark Suite Test Suite
+Tests the timing summaries, baseline comparison and a short suite run
+"""
+
+import sys
+import shutil
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from benchmarks.harness import BenchmarkResult, compare_to_baseline
+from benchmarks.suite import run_benchmarks
+from benchmarks.synthetic_teams import create_synthetic_tournament
+from src.agent_manager import AgentManager
+from main import load_teams_from_directory
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Test percentile summaries and regression flagging"""
+
+    def test_summary(self):
+        summary = BenchmarkResult('rounds', [float(i) for i in range(1, 101)],
+                                  units_per_sample=2, unit='rounds').to_dict()
+
+        self.assertEqual(summary['samples'], 100)
+        self.assertAlmostEqual(summary['p50_ms'], 50.5)
+        self.assertAlmostEqual(summary['p99_ms'], 99.01)
+        self.assertEqual(summary['throughput_unit'], 'rounds/sec')
+        # 200 rounds in 5.05 seconds
+        self.assertAlmostEqual(summary['throughput'], 200 / 5.05, places=2)
+
+    def test_compare_to_baseline(self):
+        baseline = {'a': {'p50_ms': 10.0, 'p95_ms': 20.0}, 'b': {'p50_ms': 1.0, 'p95_ms': 1.0}}
+        current = {'a': {'p50_ms': 11.0, 'p95_ms': 30.0}, 'b': {'p50_ms': 0.5, 'p95_ms': 0.5},
+                   'c': {'p50_ms': 5.0, 'p95_ms': 5.0}}
+
+        regressions = compare_to_baseline(current, baseline, tolerance=0.2)
+
+        self.assertEqual([(r['benchmark'], r['metric']) for r in regressions], [('a', 'p95_ms')])
+        self.assertEqual(regressions[0]['ratio'], 1.5)
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Test a short run of the suite"""
+
+    def test_quick_run(self):
+        report = run_benchmarks(repeat=2, seed=1, isolation_mode='persistent',
+                                selected=['execute_round', 'generate_arena_valuations', 'ipc',
+                                          'execute_bid_with_timeout'])
+
+        self.assertEqual(list(report['benchmarks'].keys()),
+                         ['execute_round', 'generate_arena_valuations',
+                          'ipc_channel_queue', 'ipc_channel_pipe', 'ipc_round',
+                          'execute_bid_with_timeout_fork', 'execute_bid_with_timeout_zygote',
+                          'execute_bid_with_timeout_agent_zygote'])
+        self.assertEqual(report['benchmarks']['execute_round']['samples'], 200)
+        self.assertEqual(report['benchmarks']['execute_bid_with_timeout_agent_zygote']['samples'], 2)
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(ValueError):
+            run_benchmarks(selected=['nope'])
+
+
+class TestSyntheticTeams(unittest.TestCase):
+    """Test the synthetic load-test team generator"""
+
+    def setUp(self):
+        self.teams_dir = create_synthetic_tournament(40, seed=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.teams_dir, ignore_errors=True)
+
+    def test_teams_load_and_bid(self):
+        teams = load_teams_from_directory(self.teams_dir)
+
+        self.assertEqual(len(teams), 40)
+        self.assertTrue(all(len(team.members) == 3 for team in teams))
+
+        agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode='persistent')
+        valuations = {f'item_{i}': 10.0 for i in range(20)}
+        try:
+            for team in teams[:8]:
+                agent = agent_manager.load_agent(team.agent_file_path, team.team_id, valuations, 60.0, [])
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+                self.assertIsNone(error)
+                self.assertGreaterEqual(bid, 0.0)
+                self.assertLessEqual(bid, 11.0)
+        finally:
+            agent_manager.shutdown()
+
+    def test_planned_bids_scaled(self):
+        # Truthful teams bid from a plan, which must be scaled like bidding_function
+        scaled_teams = []
+        for team in load_teams_from_directory(self.teams_dir):
+            source = Path(team.agent_file_path).read_text()
+            if 'truthful_bidder with bids scaled' in source:
+                scaled_teams.append((team, float(source.split('BID_SCALE = ')[1].split()[0])))
+        self.assertTrue(scaled_teams)
+
+        agent_manager = AgentManager(timeout_seconds=1.0)
+        valuations = {f'item_{i}': 10.0 for i in range(20)}
+        try:
+            for team, bid_scale in scaled_teams[:3]:
+                agent = agent_manager.load_agent(team.agent_file_path, team.team_id, valuations, 60.0, [])
+                plan, _, error = agent_manager.request_bidding_plans({team.team_id: agent},
+                                                                     ['item_0'])[team.team_id]
+                self.assertIsNone(error)
+                self.assertEqual(plan, {'item_0': round(10.0 * bid_scale, 2)})
+                bid, _, error = agent_manager.execute_bid_with_timeout(agent, 'item_0')
+                self.assertEqual((bid, error), (plan['item_0'], None))
+        finally:
+            agent_manager.shutdown()
+
+    def test_generation_is_seeded(self):
+        other_dir = create_synthetic_tournament(40, seed=4)
+        try:
+            for path in sorted(Path(self.teams_dir).glob('*/bidding_agent.py')):
+                other = Path(other_dir) / path.parent.name / path.name
+                self.assertEqual(path.read_text(), other.read_text())
+        finally:
+            shutil.rmtree(other_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+"""
+Determinism Test Suite
+Tests that seeded random streams make serial and parallel runs identical
+"""
+
+import sys
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.valuation_generator import ValuationGenerator
+from src.results_manager import ResultsManager
+from src.tournament_manager import TournamentManager
+from test_tournament import make_teams, strip_wall_clock
+
+
+class TestSeededStreams(unittest.TestCase):
+    """Test that random streams are keyed, not order dependent"""
+
+    def test_streams_do_not_depend_on_draw_order(self):
+        first = ValuationGenerator(random_seed=7)
+        second = ValuationGenerator(random_seed=7)
+
+        # Consume unrelated streams on one generator only
+        first.derive_rng('valuations', 1, '1').random(100)
+        first.get_random_auction_sequence(15, rng=first.game_rng(1, '1', 1))
+
+        self.assertEqual(first.get_random_auction_sequence(15, rng=first.game_rng(1, '2', 3)),
+                         second.get_random_auction_sequence(15, rng=second.game_rng(1, '2', 3)))
+        self.assertEqual(first.round_rng(2, 'championship', 1, 4).random(),
+                         second.round_rng(2, 'championship', 1, 4).random())
+
+    def test_distinct_keys_give_distinct_streams(self):
+        generator = ValuationGenerator(random_seed=7)
+        self.assertNotEqual(generator.game_rng(1, '1', 1).random(), generator.game_rng(1, '1', 2).random())
+        self.assertNotEqual(generator.game_rng(1, '1', 1).random(), generator.game_rng(1, '2', 1).random())
+
+    def test_global_numpy_state_untouched(self):
+        np.random.seed(99)
+        expected = np.random.random()
+
+        np.random.seed(99)
+        generator = ValuationGenerator(random_seed=7)
+        generator.generate_arena_valuations(['a', 'b'])
+        generator.get_random_auction_sequence(15)
+        generator.reset_seed()
+
+        self.assertEqual(np.random.random(), expected)
+
+
+class TestSerialParallelTournament(unittest.TestCase):
+    """Test that a full tournament gives identical results serially and in parallel"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _run(self, subdir, jobs, game_jobs):
+        tournament_manager = TournamentManager(
+            valuation_generator=ValuationGenerator(random_seed=2024),
+            results_manager=ResultsManager(output_dir=str(Path(self.output_dir) / subdir)),
+            isolation_mode='persistent',
+            jobs=jobs,
+            game_jobs=game_jobs
+        )
+        stage1, stage2 = tournament_manager.run_full_tournament(make_teams(10))
+        return strip_wall_clock(stage1.to_dict()), strip_wall_clock(stage2.to_dict())
+
+    def test_full_tournament_serial_equals_parallel(self):
+        serial = self._run('serial', jobs=1, game_jobs=1)
+        parallel = self._run('parallel', jobs=2, game_jobs=3)
+        self.assertEqual(serial, parallel)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
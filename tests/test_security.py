@@ -97,6 +97,30 @@ class TestSecurityIsolation(unittest.TestCase):
         # Budget should still be normal, not injected
         # In isolated process, any budget changes don't affect main process
         
+    def test_forged_reply_blocked(self):
+        """Test that a forged worker reply cannot run code in the game process"""
+        print("\n=== Testing Forged Reply Exploit ===")
+        
+        marker = os.path.join(tempfile.gettempdir(), 'agt_reply_forger_marker')
+        if os.path.exists(marker):
+            os.remove(marker)
+        
+        malicious_path = str(self.malicious_agents_dir / 'reply_forger.py')
+        agent = self.agent_manager.load_agent(
+            file_path=malicious_path,
+            team_id='team_malicious',
+            valuation_vector=self.test_valuations['team_malicious'],
+            budget=self.test_budget,
+            opponent_teams=['team_good']
+        )
+        
+        bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        
+        print(f"Bid: {bid}, Time: {exec_time}, Error: {error}")
+        
+        self.assertEqual((bid, error), (0.0, "No result returned"))
+        self.assertFalse(os.path.exists(marker), "Forged reply must not execute code")
+        
     def test_module_sabotage_blocked(self):
         """Test that agents cannot sabotage each other via sys.modules"""
         print("\n=== Testing Module Sabotage Exploit ===")
@@ -216,6 +240,42 @@ class TestSecurityIsolation(unittest.TestCase):
         print("\n✅ All security tests passed!")
 
 
+class TestSecurityIsolationAgentZygote(TestSecurityIsolation):
+    """Same exploits with workers forked from per-agent zygotes"""
+
+    def setUp(self):
+        super().setUp()
+        self.agent_manager = AgentManager(timeout_seconds=3.0, start_method='agent_zygote')
+
+    def tearDown(self):
+        self.agent_manager.shutdown()
+
+    def test_zygote_reply_blocked(self):
+        """Test that an agent zygote's forged reply cannot run code in the game process"""
+        print("\n=== Testing Zygote Hijack Exploit ===")
+
+        marker = os.path.join(tempfile.gettempdir(), 'agt_zygote_hijacker_marker')
+        if os.path.exists(marker):
+            os.remove(marker)
+
+        malicious_path = str(self.malicious_agents_dir / 'zygote_hijacker.py')
+        agent = self.agent_manager.load_agent(
+            file_path=malicious_path,
+            team_id='team_malicious',
+            valuation_vector=self.test_valuations['team_malicious'],
+            budget=self.test_budget,
+            opponent_teams=['team_good']
+        )
+
+        bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, 'item_0')
+
+        print(f"Bid: {bid}, Time: {exec_time}, Error: {error}")
+
+        self.assertEqual(bid, 0.0)
+        self.assertIsNotNone(error)
+        self.assertFalse(os.path.exists(marker), "Forged zygote reply must not execute code")
+
+
 class TestAgentStateIsolation(unittest.TestCase):
     """Test that agent state is properly isolated between games"""
     
@@ -250,6 +310,119 @@ class TestAgentStateIsolation(unittest.TestCase):
         print(f"Agent state preserved: {agent_manager.agent_states['team_test'].keys()}")
         
 
+class TestPersistentWorkerIsolation(unittest.TestCase):
+    """Test the persistent per-agent worker mode keeps the same guarantees"""
+
+    SLOW_AGENT = (
+        "import time\n"
+        "class BiddingAgent:\n"
+        "    def __init__(self, team_id, valuation_vector, budget, opponent_teams):\n"
+        "        self.team_id = team_id\n"
+        "        self.valuation_vector = valuation_vector\n"
+        "        self.budget = budget\n"
+        "        self.calls = 0\n"
+        "    def bidding_function(self, item_id):\n"
+        "        self.calls += 1\n"
+        "        if item_id == 'item_slow':\n"
+        "            time.sleep(10)\n"
+        "        return float(self.calls)\n"
+        "    def update_after_each_round(self, item_id, winning_team, price_paid):\n"
+        "        pass\n"
+    )
+
+    def setUp(self):
+        self.malicious_agents_dir = Path(__file__).parent / 'malicious_agents'
+        self.agent_manager = AgentManager(timeout_seconds=1.0, isolation_mode='persistent')
+        self.valuations = {f'item_{i}': float(i + 1) for i in range(20)}
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.agent_manager.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_module_sabotage_blocked(self):
+        """Persistent workers do not share sys.modules with each other"""
+        good = self.agent_manager.load_agent(
+            str(Path(__file__).parent.parent / 'examples' / 'truthful_bidder.py'),
+            'team_good', self.valuations, 60.0, ['team_malicious'])
+        malicious = self.agent_manager.load_agent(
+            str(self.malicious_agents_dir / 'module_saboteur.py'),
+            'team_malicious', self.valuations, 60.0, ['team_good'])
+
+        # Start the good worker first so its module is live while the saboteur runs
+        self.agent_manager.execute_bid_with_timeout(good, 'item_0')
+        self.agent_manager.execute_bid_with_timeout(malicious, 'item_1')
+        bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(good, 'item_2')
+
+        self.assertIsNone(error, "Good agent should not be sabotaged")
+        self.assertAlmostEqual(bid, 3.0, places=2)
+
+    def test_worker_reused_across_calls(self):
+        """A single worker process serves all calls for an agent"""
+        agent = self.agent_manager.load_agent(
+            str(Path(__file__).parent.parent / 'examples' / 'strategic_bidder.py'),
+            'team_test', self.valuations, 60.0, ['team_other'])
+
+        self.agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        pid = self.agent_manager.workers['team_test'][0].pid
+        self.assertTrue(self.agent_manager.update_agent_after_round(agent, 'item_0', 'team_other', 5.0))
+        self.agent_manager.execute_bid_with_timeout(agent, 'item_1')
+
+        self.assertEqual(pid, self.agent_manager.workers['team_test'][0].pid)
+        self.assertEqual(self.agent_manager.get_agent_state('team_test')['observed_prices'], [5.0])
+
+    def test_timeout_respawns_from_last_good_state(self):
+        """After a timeout the worker is replaced and restored from agent_states"""
+        agent_file = os.path.join(self.temp_dir, 'slow_agent.py')
+        with open(agent_file, 'w') as f:
+            f.write(self.SLOW_AGENT)
+
+        agent = self.agent_manager.load_agent(agent_file, 'team_slow', self.valuations, 60.0, [])
+
+        bid, _, error = self.agent_manager.execute_bid_with_timeout(agent, 'item_0')
+        self.assertEqual((bid, error), (1.0, None))
+
+        bid, exec_time, error = self.agent_manager.execute_bid_with_timeout(agent, 'item_slow')
+        self.assertEqual((bid, exec_time, error), (0.0, 1.0, "Timeout"))
+        self.assertNotIn('team_slow', self.agent_manager.workers)
+
+        # The call that timed out must not leak into the restored state
+        bid, _, error = self.agent_manager.execute_bid_with_timeout(agent, 'item_1')
+        self.assertEqual((bid, error), (2.0, None))
+
+
+class TestForkedWorkerDescriptors(unittest.TestCase):
+    """Test that workers forked from the game process only hold their own team's blocks"""
+
+    def setUp(self):
+        self.malicious_agents_dir = Path(__file__).parent / 'malicious_agents'
+        self.valuations = {f'item_{i}': float(i + 1) for i in range(20)}
+
+    def test_rival_slots_unreachable(self):
+        """A forked agent cannot write another team's posted bid"""
+        for isolation_mode in ('per_call', 'persistent'):
+            with self.subTest(isolation_mode=isolation_mode):
+                agent_manager = AgentManager(timeout_seconds=2.0, isolation_mode=isolation_mode,
+                                             start_method='fork')
+                good = agent_manager.load_agent(
+                    str(Path(__file__).parent.parent / 'examples' / 'truthful_bidder.py'),
+                    'team_good', self.valuations, 60.0, ['team_malicious'])
+                malicious = agent_manager.load_agent(
+                    str(self.malicious_agents_dir / 'slot_tamperer.py'),
+                    'team_malicious', self.valuations, 60.0, ['team_good'])
+
+                # The good team's blocks exist in the game process while the tamperer runs
+                agent_manager.execute_bid_with_timeout(good, 'item_0')
+                self.assertIn('team_good', agent_manager.bid_slots)
+                self.assertIn('team_good', agent_manager.shared_valuations)
+                bid, _, error = agent_manager.execute_bid_with_timeout(malicious, 'item_0')
+
+                # Only its own valuations and slot were visible
+                self.assertEqual((bid, error), (2.0, None))
+                self.assertIsNone(agent_manager.bid_slots['team_good'].read())
+                agent_manager.shutdown()
+
+
 if __name__ == '__main__':
     # Run with verbose output
     unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+"""
+Tournament Test Suite
+Tests that parallel tournament execution matches the serial run
+"""
+
+import sys
+import unittest
+import tempfile
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.valuation_generator import ValuationGenerator
+from src.results_manager import ResultsManager
+from src.tournament_manager import TournamentManager
+from src.utils import Team
+
+
+EXAMPLE_AGENTS = ['truthful_bidder.py', 'budget_aware_bidder.py', 'strategic_bidder.py']
+
+
+def make_teams(num_teams: int) -> list:
+    """Create teams backed by the deterministic example agents"""
+    examples_dir = Path(__file__).parent.parent / 'examples'
+    return [
+        Team(
+            team_id=f'team_{i:02d}',
+            team_name=f'team_{i:02d}',
+            agent_file_path=str(examples_dir / EXAMPLE_AGENTS[i % len(EXAMPLE_AGENTS)]),
+            registration_timestamp=datetime(2025, 1, 1, 0, 0, i)
+        )
+        for i in range(num_teams)
+    ]
+
+
+def strip_wall_clock(data):
+    """Drop fields that depend on wall-clock time (timestamps, execution times)"""
+    if isinstance(data, dict):
+        return {
+            key: strip_wall_clock(value) for key, value in data.items()
+            if key not in ('timestamp', 'execution_times')
+        }
+    if isinstance(data, list):
+        return [strip_wall_clock(value) for value in data]
+    return data
+
+
+class TestParallelStage1(unittest.TestCase):
+    """Test that Stage 1 arenas run in parallel reproduce the serial results"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def _run_stage1(self, teams, jobs, subdir):
+        tournament_manager = TournamentManager(
+            valuation_generator=ValuationGenerator(random_seed=11),
+            results_manager=ResultsManager(output_dir=str(Path(self.output_dir) / subdir)),
+            timeout_seconds=2.0,
+            isolation_mode='persistent',
+            jobs=jobs
+        )
+        return tournament_manager.run_stage1(teams)
+
+    def test_parallel_matches_serial(self):
+        teams = make_teams(15)
+
+        serial_result, serial_winners = self._run_stage1(teams, jobs=1, subdir='serial')
+        parallel_result, parallel_winners = self._run_stage1(teams, jobs=3, subdir='parallel')
+
+        self.assertEqual([t.team_id for t in serial_winners], [t.team_id for t in parallel_winners])
+        self.assertEqual(strip_wall_clock(serial_result.to_dict()),
+                         strip_wall_clock(parallel_result.to_dict()))
+
+
+class TestParallelArenaGames(unittest.TestCase):
+    """Test that games of one arena run in parallel reproduce the serial results"""
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_parallel_games_match_serial(self):
+        teams = make_teams(6)
+        results = []
+
+        for subdir, game_jobs in [('serial', 1), ('parallel', 3)]:
+            tournament_manager = TournamentManager(
+                valuation_generator=ValuationGenerator(random_seed=5),
+                results_manager=ResultsManager(output_dir=str(Path(self.output_dir) / subdir)),
+                isolation_mode='persistent',
+                game_jobs=game_jobs
+            )
+            results.append(tournament_manager.run_stage2(teams))
+
+        serial, parallel = results
+        self.assertEqual(len(serial.arena_results['championship']), 5)
+        self.assertEqual(strip_wall_clock(serial.to_dict()), strip_wall_clock(parallel.to_dict()))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,65 @@
+"""
+Valuation Generator Test Suite
+Tests batch valuation generation against the competition distribution
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src.valuation_generator import (
+    ValuationGenerator, CATEGORY_HIGH, CATEGORY_LOW, CATEGORY_MIXED
+)
+from src.config import (
+    K_TOTAL_ITEMS, HIGH_VALUE_ITEMS, LOW_VALUE_ITEMS, MIXED_VALUE_ITEMS,
+    HIGH_VALUE_RANGE, LOW_VALUE_RANGE, MIXED_VALUE_RANGE
+)
+
+
+class TestValuationBatch(unittest.TestCase):
+    """Test the vectorized batch API"""
+
+    def setUp(self):
+        self.generator = ValuationGenerator(random_seed=3)
+
+    def test_shapes_and_categories(self):
+        values, categories = self.generator.generate_valuation_batch(50, 5)
+
+        self.assertEqual(values.shape, (50, 5, K_TOTAL_ITEMS))
+        self.assertEqual(categories.shape, (50, K_TOTAL_ITEMS))
+        np.testing.assert_array_equal((categories == CATEGORY_HIGH).sum(axis=1), HIGH_VALUE_ITEMS)
+        np.testing.assert_array_equal((categories == CATEGORY_LOW).sum(axis=1), LOW_VALUE_ITEMS)
+        np.testing.assert_array_equal((categories == CATEGORY_MIXED).sum(axis=1), MIXED_VALUE_ITEMS)
+
+        # Categorization varies between arenas
+        self.assertGreater(len({tuple(row) for row in categories}), 1)
+
+    def test_values_within_category_ranges(self):
+        values, categories = self.generator.generate_valuation_batch(200, 5)
+
+        for code, (low, high) in [(CATEGORY_HIGH, HIGH_VALUE_RANGE),
+                                  (CATEGORY_LOW, LOW_VALUE_RANGE),
+                                  (CATEGORY_MIXED, MIXED_VALUE_RANGE)]:
+            selected = values[np.broadcast_to(categories[:, None, :] == code, values.shape)]
+            self.assertGreaterEqual(selected.min(), low)
+            self.assertLess(selected.max(), high)
+
+    def test_adapter_yields_game_manager_dicts(self):
+        arena_team_ids = [['a', 'b', 'c'], ['d', 'e']]
+        valuations = self.generator.generate_stage_valuations(arena_team_ids)
+
+        self.assertEqual([list(v.keys()) for v in valuations], arena_team_ids)
+        self.assertEqual(sorted(valuations[0]['a'].keys()),
+                         sorted(f'item_{i}' for i in range(K_TOTAL_ITEMS)))
+        self.assertIsInstance(valuations[1]['e']['item_0'], float)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)